@@ -3,14 +3,32 @@ Mapping Models
 
 This module defines the data models used for source-to-target mappings
 in the Customer 360 data integration pipeline.
+
+Objects built internally from already-typed values (templates, from_dict)
+use model_construct() and skip validation. That path must never be used
+for untrusted input such as user payloads or raw LLM output; those go
+through the regular model constructors.
 """
 
-from typing import List, Dict, Any, Optional, Union
-from pydantic import BaseModel, Field
+import sys
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union
+from pydantic import BaseModel, ConfigDict, Field, PrivateAttr, ValidationInfo, field_validator
 from enum import Enum
+from collections import Counter
+from functools import lru_cache
+from itertools import chain
+
+if sys.version_info >= (3, 11):
+    from enum import StrEnum
+else:
+    class StrEnum(str, Enum):
+        """Minimal stand-in for enum.StrEnum on Python < 3.11."""
+
+        def __str__(self) -> str:
+            return self.value
 
 
-class DataType(str, Enum):
+class DataType(StrEnum):
     """Enumeration of supported data types for mapping."""
     STRING = "STRING"
     INTEGER = "INTEGER"
@@ -29,74 +47,92 @@ class DataType(str, Enum):
     @classmethod
     def from_source_type(cls, source_type: str, source_system: str) -> "DataType":
         """Map source system type to standardized data type."""
-        # Mapping for core banking types
-        core_banking_map = {
-            "VARCHAR": cls.STRING,
-            "CHAR": cls.STRING,
-            "NUMBER": cls.DECIMAL,
-            "INT": cls.INTEGER,
-            "SMALLINT": cls.INTEGER,
-            "FLOAT": cls.FLOAT,
-            "DECIMAL": cls.DECIMAL,
-            "NUMERIC": cls.DECIMAL,
-            "DATE": cls.DATE,
-            "TIMESTAMP": cls.TIMESTAMP,
-            "BOOLEAN": cls.BOOLEAN,
-            "BINARY": cls.BINARY
-        }
-
-        # Mapping for CRM system types
-        crm_map = {
-            "Text": cls.STRING,
-            "Number": cls.DECIMAL,
-            "Integer": cls.INTEGER,
-            "Date": cls.DATE,
-            "DateTime": cls.DATETIME,
-            "Boolean": cls.BOOLEAN,
-            "PickList": cls.STRING,
-            "MultiPickList": cls.ARRAY,
-            "LongText": cls.STRING,
-            "Email": cls.STRING,
-            "Phone": cls.STRING,
-            "URL": cls.STRING,
-            "Currency": cls.DECIMAL
-        }
-
-        # Standardize type based on source system
-        source_type_upper = source_type.upper()
-        if source_system.upper() in ["CORE BANKING", "CBS", "LEGACY"]:
-            return core_banking_map.get(source_type_upper, cls.STRING)
-        elif source_system.upper() in ["CRM", "SALESFORCE", "DYNAMICS"]:
-            return crm_map.get(source_type, cls.STRING)
-
-        # Default mapping for unknown systems
-        default_map = {
-            "VARCHAR": cls.STRING,
-            "STRING": cls.STRING,
-            "TEXT": cls.STRING,
-            "INT": cls.INTEGER,
-            "INTEGER": cls.INTEGER,
-            "NUMBER": cls.DECIMAL,
-            "FLOAT": cls.FLOAT,
-            "DOUBLE": cls.FLOAT,
-            "DECIMAL": cls.DECIMAL,
-            "BOOL": cls.BOOLEAN,
-            "BOOLEAN": cls.BOOLEAN,
-            "DATE": cls.DATE,
-            "DATETIME": cls.DATETIME,
-            "TIMESTAMP": cls.TIMESTAMP,
-            "ARRAY": cls.ARRAY,
-            "LIST": cls.ARRAY,
-            "STRUCT": cls.STRUCT,
-            "OBJECT": cls.STRUCT,
-            "MAP": cls.MAP,
-            "BINARY": cls.BINARY
-        }
-
-        return default_map.get(source_type_upper, cls.STRING)
-
-
-class TransformationType(str, Enum):
+        return _resolve_data_type(source_type, source_system)
+
+
+# Source system names (upper-cased) that use the core banking type map
+_CORE_BANKING_SYSTEMS = frozenset({"CORE BANKING", "CBS", "LEGACY"})
+
+# Source system names (upper-cased) that use the CRM type map
+_CRM_SYSTEMS = frozenset({"CRM", "SALESFORCE", "DYNAMICS"})
+
+# Mapping for core banking types
+_CORE_BANKING_TYPE_MAP = {
+    "VARCHAR": DataType.STRING,
+    "CHAR": DataType.STRING,
+    "NUMBER": DataType.DECIMAL,
+    "INT": DataType.INTEGER,
+    "SMALLINT": DataType.INTEGER,
+    "FLOAT": DataType.FLOAT,
+    "DECIMAL": DataType.DECIMAL,
+    "NUMERIC": DataType.DECIMAL,
+    "DATE": DataType.DATE,
+    "TIMESTAMP": DataType.TIMESTAMP,
+    "BOOLEAN": DataType.BOOLEAN,
+    "BINARY": DataType.BINARY
+}
+
+# Mapping for CRM system types (keys are matched case-sensitively)
+_CRM_TYPE_MAP = {
+    "Text": DataType.STRING,
+    "Number": DataType.DECIMAL,
+    "Integer": DataType.INTEGER,
+    "Date": DataType.DATE,
+    "DateTime": DataType.DATETIME,
+    "Boolean": DataType.BOOLEAN,
+    "PickList": DataType.STRING,
+    "MultiPickList": DataType.ARRAY,
+    "LongText": DataType.STRING,
+    "Email": DataType.STRING,
+    "Phone": DataType.STRING,
+    "URL": DataType.STRING,
+    "Currency": DataType.DECIMAL
+}
+
+# Default mapping for unknown systems
+_DEFAULT_TYPE_MAP = {
+    "VARCHAR": DataType.STRING,
+    "STRING": DataType.STRING,
+    "TEXT": DataType.STRING,
+    "INT": DataType.INTEGER,
+    "INTEGER": DataType.INTEGER,
+    "NUMBER": DataType.DECIMAL,
+    "FLOAT": DataType.FLOAT,
+    "DOUBLE": DataType.FLOAT,
+    "DECIMAL": DataType.DECIMAL,
+    "BOOL": DataType.BOOLEAN,
+    "BOOLEAN": DataType.BOOLEAN,
+    "DATE": DataType.DATE,
+    "DATETIME": DataType.DATETIME,
+    "TIMESTAMP": DataType.TIMESTAMP,
+    "ARRAY": DataType.ARRAY,
+    "LIST": DataType.ARRAY,
+    "STRUCT": DataType.STRUCT,
+    "OBJECT": DataType.STRUCT,
+    "MAP": DataType.MAP,
+    "BINARY": DataType.BINARY
+}
+
+
+@lru_cache(maxsize=512)
+def _resolve_data_type(source_type: str, source_system: str) -> DataType:
+    """Resolve a (source type, source system) pair to a standardized data type.
+
+    Results are cached since the same pairs recur for every attribute of a
+    source table.
+    """
+    # Standardize type based on source system
+    system_upper = source_system.upper()
+    if system_upper in _CORE_BANKING_SYSTEMS:
+        return _CORE_BANKING_TYPE_MAP.get(source_type.upper(), DataType.STRING)
+    elif system_upper in _CRM_SYSTEMS:
+        return _CRM_TYPE_MAP.get(source_type, DataType.STRING)
+
+    # Default mapping for unknown systems
+    return _DEFAULT_TYPE_MAP.get(source_type.upper(), DataType.STRING)
+
+
+class TransformationType(StrEnum):
     """Types of transformations that can be applied to data."""
     DIRECT_MAPPING = "DIRECT_MAPPING"
     TYPE_CONVERSION = "TYPE_CONVERSION"
@@ -114,7 +150,7 @@ class TransformationType(str, Enum):
     FORMAT_STANDARDIZATION = "FORMAT_STANDARDIZATION"
 
 
-class MappingStatus(str, Enum):
+class MappingStatus(StrEnum):
     """Status of the attribute mapping."""
     DRAFT = "DRAFT"
     REVIEWED = "REVIEWED"
@@ -124,7 +160,7 @@ class MappingStatus(str, Enum):
     ERROR = "ERROR"
 
 
-class DataQualityIssue(str, Enum):
+class DataQualityIssue(StrEnum):
     """Types of data quality issues that can affect mappings."""
     MISSING_VALUES = "MISSING_VALUES"
     INCONSISTENT_FORMAT = "INCONSISTENT_FORMAT"
@@ -137,7 +173,27 @@ class DataQualityIssue(str, Enum):
     BUSINESS_RULE_VIOLATION = "BUSINESS_RULE_VIOLATION"
 
 
-class SourceAttributeMetadata(BaseModel):
+def _none_as_default(cls, value: Any, info: ValidationInfo) -> Any:
+    """Treat an explicit null as the field's empty default; these fields accepted None before."""
+    if value is None:
+        return cls.model_fields[info.field_name].get_default(call_default_factory=True)
+    return value
+
+
+class _MetadataModel(BaseModel):
+    """Base class for the leaf metadata models built in bulk during mapping ingest."""
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]):
+        """Build an instance from trusted internal data, skipping validation.
+
+        Only use this for data produced by the pipeline itself; external or
+        user-supplied payloads must go through the regular constructor.
+        """
+        return cls.model_construct(**data)
+
+
+class SourceAttributeMetadata(_MetadataModel):
     """Metadata for a source attribute."""
     system_name: str = Field(..., description="Name of the source system")
     database_name: Optional[str] = Field(None, description="Name of the database")
@@ -148,7 +204,15 @@ class SourceAttributeMetadata(BaseModel):
     nullable: bool = Field(True, description="Flag indicating if attribute can be null")
     primary_key: bool = Field(False, description="Flag indicating if attribute is part of primary key")
     description: Optional[str] = Field(None, description="Description of the attribute")
-    sample_values: Optional[List[Any]] = Field(None, description="Sample values for the attribute")
+    sample_values: Tuple[Any, ...] = Field((), description="Sample values for the attribute")
+
+    _none_as_empty = field_validator("sample_values", mode="before")(_none_as_default)
+
+    @field_validator("system_name", "table_name", "data_type")
+    @classmethod
+    def _intern_name(cls, value: str) -> str:
+        """Intern names that repeat across attributes and are used as grouping keys."""
+        return sys.intern(value)
 
     @property
     def full_path(self) -> str:
@@ -162,8 +226,13 @@ class SourceAttributeMetadata(BaseModel):
         parts.append(self.attribute_name)
         return ".".join(parts)
 
+    @property
+    def source_table_fqn(self) -> str:
+        """Return the system-qualified name of the source table."""
+        return f"{self.system_name}.{self.table_name}"
+
 
-class TargetAttributeMetadata(BaseModel):
+class TargetAttributeMetadata(_MetadataModel):
     """Metadata for a target attribute in the Customer 360 model."""
     entity_name: str = Field(..., description="Name of the target entity")
     attribute_path: str = Field(..., description="Path to the attribute within the entity")
@@ -171,27 +240,53 @@ class TargetAttributeMetadata(BaseModel):
     nullable: bool = Field(True, description="Flag indicating if attribute can be null")
     description: Optional[str] = Field(None, description="Description of the attribute")
     business_definition: Optional[str] = Field(None, description="Business definition of the attribute")
-    validation_rules: Optional[List[str]] = Field(None, description="Validation rules for the attribute")
+    validation_rules: Tuple[str, ...] = Field((), description="Validation rules for the attribute")
+
+    _none_as_empty = field_validator("validation_rules", mode="before")(_none_as_default)
+
+    @field_validator("entity_name")
+    @classmethod
+    def _intern_name(cls, value: str) -> str:
+        """Intern entity names, which repeat across attributes and are used as grouping keys."""
+        return sys.intern(value)
 
     @property
     def full_path(self) -> str:
         """Return the fully qualified path to the attribute."""
         return f"{self.entity_name}.{self.attribute_path}"
 
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "TargetAttributeMetadata":
+        """Build an instance from trusted internal data, skipping validation."""
+        return cls.model_construct(**{**data, "data_type": DataType(data["data_type"])})
+
 
-class ValueMappingRule(BaseModel):
+class ValueMappingRule(_MetadataModel):
     """Rule for mapping source values to target values."""
     source_value: Any = Field(..., description="Value in the source system")
     target_value: Any = Field(..., description="Corresponding value in the target system")
     description: Optional[str] = Field(None, description="Description of the mapping")
 
 
-class TransformationRule(BaseModel):
+class TransformationRule(_MetadataModel):
     """Rule for transforming data from source to target."""
     transformation_type: TransformationType = Field(..., description="Type of transformation")
     transformation_logic: str = Field(..., description="Logic or expression for the transformation")
     description: Optional[str] = Field(None, description="Description of the transformation")
-    value_mappings: Optional[List[ValueMappingRule]] = Field(None, description="Value mapping rules, if applicable")
+    value_mappings: Tuple[ValueMappingRule, ...] = Field((), description="Value mapping rules, if applicable")
+
+    _none_as_empty = field_validator("value_mappings", mode="before")(_none_as_default)
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "TransformationRule":
+        """Build an instance from trusted internal data, skipping validation."""
+        fields = {**data, "transformation_type": TransformationType(data["transformation_type"])}
+        if data.get("value_mappings"):
+            fields["value_mappings"] = tuple(
+                rule if isinstance(rule, ValueMappingRule) else ValueMappingRule.from_dict(rule)
+                for rule in data["value_mappings"]
+            )
+        return cls.model_construct(**fields)
 
     def to_sql(self) -> str:
         """Convert the transformation logic to SQL syntax."""
@@ -199,7 +294,7 @@ class TransformationRule(BaseModel):
         return self.transformation_logic
 
 
-class DataQualityCheck(BaseModel):
+class DataQualityCheck(_MetadataModel):
     """Data quality check for a mapping."""
     check_type: DataQualityIssue = Field(..., description="Type of data quality issue to check for")
     check_logic: str = Field(..., description="Logic or expression for the check")
@@ -207,12 +302,35 @@ class DataQualityCheck(BaseModel):
     description: Optional[str] = Field(None, description="Description of the check")
     remediation: Optional[str] = Field(None, description="Remediation strategy for issues found")
 
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "DataQualityCheck":
+        """Build an instance from trusted internal data, skipping validation."""
+        return cls.model_construct(**{**data, "check_type": DataQualityIssue(data["check_type"])})
+
     def to_sql(self) -> str:
         """Convert the check logic to SQL syntax."""
         # This is a simplified implementation
         return self.check_logic
 
 
+def _emit_direct_sql(source_path: str, target_path: str, rule: TransformationRule) -> str:
+    """Assign the source attribute straight to the target."""
+    return f"{target_path} = {source_path}"
+
+
+def _emit_transformed_sql(source_path: str, target_path: str, rule: TransformationRule) -> str:
+    """Assign the result of the transformation logic to the target."""
+    return f"{target_path} = {rule.to_sql()}"
+
+
+# SQL emitters keyed by transformation type. Simple SQL generation - would
+# be more complex in real implementation; types without an entry fall back
+# to _emit_transformed_sql.
+_SQL_EMITTERS: Dict[TransformationType, Callable[[str, str, TransformationRule], str]] = {
+    TransformationType.DIRECT_MAPPING: _emit_direct_sql
+}
+
+
 class AttributeMapping(BaseModel):
     """Mapping between source and target attributes."""
     mapping_id: str = Field(..., description="Unique identifier for the mapping")
@@ -229,19 +347,20 @@ class AttributeMapping(BaseModel):
 
     def to_sql(self) -> str:
         """Generate SQL for the mapping transformation."""
-        source_path = self.source_attribute.full_path
-        target_path = self.target_attribute.full_path
-        transform_sql = self.transformation_rule.to_sql()
-
-        # Simple SQL generation - would be more complex in real implementation
-        if self.transformation_rule.transformation_type == TransformationType.DIRECT_MAPPING:
-            return f"{target_path} = {source_path}"
-        else:
-            return f"{target_path} = {transform_sql}"
+        rule = self.transformation_rule
+        emit = _SQL_EMITTERS.get(rule.transformation_type, _emit_transformed_sql)
+        return emit(self.source_attribute.full_path, self.target_attribute.full_path, rule)
 
 
 class MappingSet(BaseModel):
-    """Collection of related attribute mappings."""
+    """Collection of related attribute mappings.
+
+    Mapping instances are neither revalidated when passed in nor on
+    assignment, so callers must supply AttributeMapping objects (or dicts)
+    of the correct shape.
+    """
+    model_config = ConfigDict(validate_assignment=False, revalidate_instances="never")
+
     mapping_set_id: str = Field(..., description="Unique identifier for the mapping set")
     name: str = Field(..., description="Name of the mapping set")
     description: Optional[str] = Field(None, description="Description of the mapping set")
@@ -256,66 +375,49 @@ class MappingSet(BaseModel):
 
     def to_sql(self) -> str:
         """Generate SQL for the entire mapping set."""
-        sql_parts = []
-        for mapping in self.mappings:
-            sql_parts.append(mapping.to_sql())
-
-        return ";\n".join(sql_parts)
+        return ";\n".join([mapping.to_sql() for mapping in self.mappings])
 
     def get_source_tables(self) -> List[str]:
-        """Get list of all source tables used in the mapping set."""
-        tables = set()
-        for mapping in self.mappings:
-            source = mapping.source_attribute
-            tables.add(f"{source.system_name}.{source.table_name}")
+        """Get list of all source tables used in the mapping set, in first-seen order."""
+        return list(dict.fromkeys(mapping.source_attribute.source_table_fqn for mapping in self.mappings))
 
-        return list(tables)
+    def _count_statuses(self) -> Counter:
+        """Count the mappings by their current status."""
+        return Counter([mapping.status for mapping in self.mappings])
 
     def get_mapping_statistics(self) -> Dict[str, Any]:
         """Get statistics about the mapping set."""
-        stats = {
+        # Enum members are counted directly; their string values are only
+        # looked up once per distinct member when building the result.
+        return {
             "total_mappings": len(self.mappings),
-            "status_counts": {},
-            "source_system_counts": {},
-            "target_entity_counts": {},
-            "transformation_type_counts": {}
+            "status_counts": {status.value: count for status, count in self._count_statuses().items()},
+            "source_system_counts": dict(Counter(
+                mapping.source_attribute.system_name for mapping in self.mappings
+            )),
+            "target_entity_counts": dict(Counter(
+                mapping.target_attribute.entity_name for mapping in self.mappings
+            )),
+            "transformation_type_counts": {
+                transform_type.value: count for transform_type, count in Counter(
+                    mapping.transformation_rule.transformation_type for mapping in self.mappings
+                ).items()
+            }
         }
 
-        # Count by status
-        for mapping in self.mappings:
-            # Status counts
-            status = mapping.status.value
-            if status in stats["status_counts"]:
-                stats["status_counts"][status] += 1
-            else:
-                stats["status_counts"][status] = 1
-
-            # Source system counts
-            source_system = mapping.source_attribute.system_name
-            if source_system in stats["source_system_counts"]:
-                stats["source_system_counts"][source_system] += 1
-            else:
-                stats["source_system_counts"][source_system] = 1
-
-            # Target entity counts
-            target_entity = mapping.target_attribute.entity_name
-            if target_entity in stats["target_entity_counts"]:
-                stats["target_entity_counts"][target_entity] += 1
-            else:
-                stats["target_entity_counts"][target_entity] = 1
-
-            # Transformation type counts
-            transform_type = mapping.transformation_rule.transformation_type.value
-            if transform_type in stats["transformation_type_counts"]:
-                stats["transformation_type_counts"][transform_type] += 1
-            else:
-                stats["transformation_type_counts"][transform_type] = 1
-
-        return stats
+
+# Mapping statuses that count towards project completion
+_COMPLETED_STATUSES = frozenset({MappingStatus.APPROVED, MappingStatus.IMPLEMENTED})
 
 
 class MappingProject(BaseModel):
-    """Project containing multiple mapping sets for a Customer 360 implementation."""
+    """Project containing multiple mapping sets for a Customer 360 implementation.
+
+    Like MappingSet, nested mapping sets are not revalidated on construction
+    or assignment.
+    """
+    model_config = ConfigDict(validate_assignment=False, revalidate_instances="never")
+
     project_id: str = Field(..., description="Unique identifier for the project")
     name: str = Field(..., description="Name of the project")
     description: Optional[str] = Field(None, description="Description of the project")
@@ -331,60 +433,78 @@ class MappingProject(BaseModel):
     updated_by: Optional[str] = Field(None, description="User who last updated the project")
     updated_at: Optional[str] = Field(None, description="Timestamp when project was last updated")
 
-    def get_completion_percentage(self) -> float:
-        """Calculate the completion percentage of the project."""
-        if not self.mapping_sets:
-            return 0.0
+    _rev: int = PrivateAttr(default=0)
+    _cached_membership: Optional[tuple] = PrivateAttr(default=None)
 
-        total_mappings = 0
-        completed_mappings = 0
+    def invalidate(self) -> None:
+        """Mark the cached summary as stale after editing a mapping set's systems or entities in place."""
+        self._rev += 1
 
+    def _count_statuses(self) -> Counter:
+        """Count mappings by status across all mapping sets."""
+        status_counts = Counter()
         for mapping_set in self.mapping_sets:
-            total_mappings += len(mapping_set.mappings)
-            for mapping in mapping_set.mappings:
-                if mapping.status in [MappingStatus.APPROVED, MappingStatus.IMPLEMENTED]:
-                    completed_mappings += 1
+            status_counts.update(mapping_set._count_statuses())
+
+        return status_counts
+
+    def _get_membership(self) -> Tuple[List[str], List[str]]:
+        """Return the deduplicated source systems and target entities, recomputing only when stale.
+
+        The lists are reused until the project revision changes (see
+        invalidate()), mapping sets are replaced, added or removed, or a
+        set's source system or target entity list changes length. Mapping
+        statuses are never cached, since they are edited during review.
+        """
+        # Hold the mapping sets themselves, so a recycled id() cannot match
+        mapping_sets = tuple(self.mapping_sets)
+        shape = tuple(
+            (len(mapping_set.source_systems), len(mapping_set.target_entities)) for mapping_set in mapping_sets
+        )
+        cached = self._cached_membership
+        if (
+            cached is None
+            or cached[0] != self._rev
+            or len(cached[1]) != len(mapping_sets)
+            or any(old is not new for old, new in zip(cached[1], mapping_sets))
+            or cached[2] != shape
+        ):
+            # Deduplicated in first-seen order, as lists for JSON serialization
+            source_systems = list(dict.fromkeys(
+                chain.from_iterable(mapping_set.source_systems for mapping_set in mapping_sets)
+            ))
+            target_entities = list(dict.fromkeys(
+                chain.from_iterable(mapping_set.target_entities for mapping_set in mapping_sets)
+            ))
+            cached = self._cached_membership = (self._rev, mapping_sets, shape, source_systems, target_entities)
+
+        return cached[3], cached[4]
 
+    def get_completion_percentage(self) -> float:
+        """Calculate the completion percentage of the project."""
+        status_counts = self._count_statuses()
+        total_mappings = sum(status_counts.values())
         if total_mappings == 0:
             return 0.0
 
+        completed_mappings = sum(status_counts[status] for status in _COMPLETED_STATUSES)
         return (completed_mappings / total_mappings) * 100.0
 
     def get_mapping_summary(self) -> Dict[str, Any]:
         """Get a summary of all mappings in the project."""
-        summary = {
+        status_counts = self._count_statuses()
+        source_systems, target_entities = self._get_membership()
+        return {
             "total_mapping_sets": len(self.mapping_sets),
-            "total_mappings": 0,
-            "source_systems": set(),
-            "target_entities": set(),
-            "status_summary": {
-                "DRAFT": 0,
-                "REVIEWED": 0,
-                "APPROVED": 0,
-                "IMPLEMENTED": 0,
-                "DEPRECATED": 0,
-                "ERROR": 0
-            }
+            "total_mappings": sum(status_counts.values()),
+            "source_systems": list(source_systems),
+            "target_entities": list(target_entities),
+            # Report every status, including those with no mappings
+            "status_summary": {status.value: status_counts[status] for status in MappingStatus}
         }
 
-        for mapping_set in self.mapping_sets:
-            summary["total_mappings"] += len(mapping_set.mappings)
-            summary["source_systems"].update(mapping_set.source_systems)
-            summary["target_entities"].update(mapping_set.target_entities)
-
-            for mapping in mapping_set.mappings:
-                status = mapping.status.value
-                if status in summary["status_summary"]:
-                    summary["status_summary"][status] += 1
-
-        # Convert sets to lists for JSON serialization
-        summary["source_systems"] = list(summary["source_systems"])
-        summary["target_entities"] = list(summary["target_entities"])
-
-        return summary
-
 
-class DependencyType(str, Enum):
+class DependencyType(StrEnum):
     """Types of dependencies between mappings."""
     SOURCE_DEPENDENCY = "SOURCE_DEPENDENCY"  # Target depends on source being available
     TRANSFORMATION_DEPENDENCY = "TRANSFORMATION_DEPENDENCY"  # Transformation depends on another attribute
@@ -394,6 +514,8 @@ class DependencyType(str, Enum):
 
 class MappingDependency(BaseModel):
     """Dependency between attribute mappings."""
+    model_config = ConfigDict(defer_build=True)
+
     dependency_id: str = Field(..., description="Unique identifier for the dependency")
     mapping_id: str = Field(..., description="ID of the mapping that has a dependency")
     dependent_mapping_id: str = Field(..., description="ID of the mapping that is depended upon")
@@ -404,6 +526,8 @@ class MappingDependency(BaseModel):
 
 class DataProfileMetrics(BaseModel):
     """Data profiling metrics for a source attribute."""
+    model_config = ConfigDict(defer_build=True)
+
     attribute_id: str = Field(..., description="ID of the source attribute")
     row_count: int = Field(..., description="Total number of rows")
     null_count: int = Field(..., description="Number of null values")
@@ -417,23 +541,31 @@ class DataProfileMetrics(BaseModel):
     min_length: Optional[int] = Field(None, description="Minimum length (for string attributes)")
     max_length: Optional[int] = Field(None, description="Maximum length (for string attributes)")
     avg_length: Optional[float] = Field(None, description="Average length (for string attributes)")
-    pattern_analysis: Optional[Dict[str, int]] = Field(None, description="Count of different patterns found")
-    top_values: Optional[List[Dict[str, Any]]] = Field(None, description="Most common values and their frequencies")
-    histogram_data: Optional[List[Dict[str, Any]]] = Field(None, description="Histogram data points")
+    pattern_analysis: Dict[str, int] = Field(default_factory=dict, description="Count of different patterns found")
+    top_values: Tuple[Dict[str, Any], ...] = Field((), description="Most common values and their frequencies")
+    histogram_data: Tuple[Dict[str, Any], ...] = Field((), description="Histogram data points")
     last_profiled_at: Optional[str] = Field(None, description="Timestamp when profiling was last run")
 
+    _none_as_empty = field_validator("pattern_analysis", "top_values", "histogram_data", mode="before")(_none_as_default)
+
 
 class DataLineage(BaseModel):
     """Data lineage information for target attributes."""
+    model_config = ConfigDict(defer_build=True)
+
     target_attribute_id: str = Field(..., description="ID of the target attribute")
     source_path: List[Dict[str, Any]] = Field(..., description="Path through source systems")
     transformations: List[Dict[str, Any]] = Field(..., description="Transformations applied")
-    data_quality_impact: Optional[Dict[str, Any]] = Field(None, description="Impact on data quality")
-    lineage_graph_data: Optional[Dict[str, Any]] = Field(None, description="Graph data for visualization")
+    data_quality_impact: Dict[str, Any] = Field(default_factory=dict, description="Impact on data quality")
+    lineage_graph_data: Dict[str, Any] = Field(default_factory=dict, description="Graph data for visualization")
+
+    _none_as_empty = field_validator("data_quality_impact", "lineage_graph_data", mode="before")(_none_as_default)
 
 
 class ValidationResult(BaseModel):
     """Results of validation checks for a mapping."""
+    model_config = ConfigDict(defer_build=True)
+
     mapping_id: str = Field(..., description="ID of the mapping being validated")
     validation_timestamp: str = Field(..., description="Timestamp when validation was performed")
     validation_status: str = Field(..., description="Overall status (PASSED, FAILED, WARNING)")
@@ -442,11 +574,15 @@ class ValidationResult(BaseModel):
     target_row_count: Optional[int] = Field(None, description="Number of target rows produced")
     row_count_match: Optional[bool] = Field(None, description="Flag indicating if row counts match expectations")
     data_quality_issues: List[Dict[str, Any]] = Field(default_factory=list, description="Data quality issues found")
-    performance_metrics: Optional[Dict[str, Any]] = Field(None, description="Performance metrics for the validation")
+    performance_metrics: Dict[str, Any] = Field(default_factory=dict, description="Performance metrics for the validation")
+
+    _none_as_empty = field_validator("performance_metrics", mode="before")(_none_as_default)
 
 
 class MappingTemplate(BaseModel):
     """Template for common mapping patterns."""
+    model_config = ConfigDict(defer_build=True)
+
     template_id: str = Field(..., description="Unique identifier for the template")
     name: str = Field(..., description="Name of the template")
     description: Optional[str] = Field(None, description="Description of the template")
@@ -454,11 +590,13 @@ class MappingTemplate(BaseModel):
     target_pattern: Dict[str, Any] = Field(..., description="Pattern for matching target attributes")
     transformation_template: Dict[str, Any] = Field(..., description="Template for transformation logic")
     applicable_systems: List[str] = Field(default_factory=list, description="Systems where this template applies")
-    examples: Optional[List[Dict[str, Any]]] = Field(None, description="Example applications of the template")
+    examples: Tuple[Dict[str, Any], ...] = Field((), description="Example applications of the template")
     created_by: Optional[str] = Field(None, description="User who created the template")
     created_at: Optional[str] = Field(None, description="Timestamp when template was created")
     usage_count: Optional[int] = Field(0, description="Count of how many times template has been used")
 
+    _none_as_empty = field_validator("examples", mode="before")(_none_as_default)
+
     def matches_source(self, source_attribute: SourceAttributeMetadata) -> bool:
         """Check if a source attribute matches this template's pattern."""
         # Implementation would check if the attribute matches the pattern
@@ -475,12 +613,46 @@ class MappingTemplate(BaseModel):
         """Generate a transformation rule based on the template."""
         # Implementation would generate a transformation rule
         # This is a placeholder implementation
-        return TransformationRule(
+        return TransformationRule.model_construct(
             transformation_type=TransformationType.DIRECT_MAPPING,
-            transformation_logic=f"{source.attribute_name}"
+            transformation_logic=source.attribute_name,
+            description=None,
+            value_mappings=()
         )
 
 
+# Example payload published in the MappingExample JSON schema
+_MAPPING_EXAMPLE_SCHEMA_EXTRA = {
+    "example": {
+        "example_id": "EX-001",
+        "name": "Basic Customer Name Mapping",
+        "description": "Demonstrates mapping of customer names from core banking to Customer 360",
+        "source_attribute": {
+            "system_name": "Core Banking",
+            "table_name": "CUSTOMER_MASTER",
+            "attribute_name": "CUST_FIRST_NAME",
+            "data_type": "VARCHAR",
+            "nullable": False,
+            "primary_key": False
+        },
+        "target_attribute": {
+            "entity_name": "DemographicProfile",
+            "attribute_path": "name.first_name",
+            "data_type": "STRING",
+            "nullable": False,
+            "description": "Customer's first name"
+        },
+        "transformation_rule": {
+            "transformation_type": "FORMAT_STANDARDIZATION",
+            "transformation_logic": "INITCAP(TRIM(CUST_FIRST_NAME))",
+            "description": "Standardize name format with initial capital letter and trimmed spaces"
+        },
+        "complexity": "SIMPLE",
+        "tags": ["Name", "Core Banking", "Standardization"]
+    }
+}
+
+
 class MappingExample(BaseModel):
     """Example mapping for documentation and reference."""
     example_id: str = Field(..., description="Unique identifier for the example")
@@ -493,33 +665,4 @@ class MappingExample(BaseModel):
     tags: List[str] = Field(default_factory=list, description="Tags for categorizing the example")
     complexity: str = Field("MEDIUM", description="Complexity level (SIMPLE, MEDIUM, COMPLEX)")
 
-    class Config:
-        schema_extra = {
-            "example": {
-                "example_id": "EX-001",
-                "name": "Basic Customer Name Mapping",
-                "description": "Demonstrates mapping of customer names from core banking to Customer 360",
-                "source_attribute": {
-                    "system_name": "Core Banking",
-                    "table_name": "CUSTOMER_MASTER",
-                    "attribute_name": "CUST_FIRST_NAME",
-                    "data_type": "VARCHAR",
-                    "nullable": False,
-                    "primary_key": False
-                },
-                "target_attribute": {
-                    "entity_name": "DemographicProfile",
-                    "attribute_path": "name.first_name",
-                    "data_type": "STRING",
-                    "nullable": False,
-                    "description": "Customer's first name"
-                },
-                "transformation_rule": {
-                    "transformation_type": "FORMAT_STANDARDIZATION",
-                    "transformation_logic": "INITCAP(TRIM(CUST_FIRST_NAME))",
-                    "description": "Standardize name format with initial capital letter and trimmed spaces"
-                },
-                "complexity": "SIMPLE",
-                "tags": ["Name", "Core Banking", "Standardization"]
-            }
-        }
+    model_config = ConfigDict(defer_build=True, json_schema_extra=_MAPPING_EXAMPLE_SCHEMA_EXTRA)
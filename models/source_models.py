@@ -5,14 +5,22 @@ This module defines data models representing banking source systems and their me
 These models are used to catalog and interact with source systems during the data mapping process.
 """
 
-from typing import List, Dict, Any, Optional, Union
-from pydantic import BaseModel, Field
+import operator
+import sys
+from typing import List, Dict, Any, FrozenSet, Iterator, Literal, Optional, Tuple, Union
+from pydantic import BaseModel, ConfigDict, Field, PrivateAttr, ValidationInfo, field_validator, model_validator
 from enum import Enum
 from datetime import datetime
+from collections import Counter, defaultdict
+from itertools import chain
 
 
 class SourceSystemType(str, Enum):
-    """Types of source systems in a banking environment."""
+    """Types of source systems in a banking environment.
+
+    Model fields are typed with the matching ``...Literal`` alias so they
+    validate as plain strings; the enum is kept for named constants.
+    """
     CORE_BANKING = "CORE_BANKING"
     CRM = "CRM"
     DIGITAL_BANKING = "DIGITAL_BANKING"
@@ -30,6 +38,10 @@ class SourceSystemType(str, Enum):
     OTHER = "OTHER"
 
 
+# Plain-string field type accepting the SourceSystemType values
+SourceSystemTypeLiteral = Literal[tuple(member.value for member in SourceSystemType)]
+
+
 class DataFrequency(str, Enum):
     """Data update frequency types."""
     REAL_TIME = "REAL_TIME"
@@ -44,6 +56,10 @@ class DataFrequency(str, Enum):
     BATCH = "BATCH"
 
 
+# Plain-string field type accepting the DataFrequency values
+DataFrequencyLiteral = Literal[tuple(member.value for member in DataFrequency)]
+
+
 class DataQualityLevel(str, Enum):
     """Data quality level classification."""
     HIGH = "HIGH"
@@ -52,6 +68,10 @@ class DataQualityLevel(str, Enum):
     UNKNOWN = "UNKNOWN"
 
 
+# Plain-string field type accepting the DataQualityLevel values
+DataQualityLevelLiteral = Literal[tuple(member.value for member in DataQualityLevel)]
+
+
 class AccessMethod(str, Enum):
     """Methods to access source system data."""
     API = "API"
@@ -65,6 +85,10 @@ class AccessMethod(str, Enum):
     MANUAL = "MANUAL"
 
 
+# Plain-string field type accepting the AccessMethod values
+AccessMethodLiteral = Literal[tuple(member.value for member in AccessMethod)]
+
+
 class DatabaseType(str, Enum):
     """Types of databases used in source systems."""
     ORACLE = "ORACLE"
@@ -84,6 +108,10 @@ class DatabaseType(str, Enum):
     OTHER = "OTHER"
 
 
+# Plain-string field type accepting the DatabaseType values
+DatabaseTypeLiteral = Literal[tuple(member.value for member in DatabaseType)]
+
+
 class FileFormat(str, Enum):
     """File formats for file-based source systems."""
     CSV = "CSV"
@@ -100,31 +128,56 @@ class FileFormat(str, Enum):
     OTHER = "OTHER"
 
 
+# Plain-string field type accepting the FileFormat values
+FileFormatLiteral = Literal[tuple(member.value for member in FileFormat)]
+
+
+# Credential fields marked exclude=True on ConnectionCredentials, so every
+# dump leaves them out, including when the credentials are nested in a
+# SourceSystem; read them explicitly with sensitive_values()
+SENSITIVE_CRED_FIELDS = frozenset({"password", "api_key", "api_token", "connection_string"})
+
+
 class ConnectionCredentials(BaseModel):
     """Credentials for connecting to a source system."""
     credential_id: str = Field(..., description="Unique identifier for the credentials")
     credential_type: str = Field(..., description="Type of credentials (username/password, API key, etc.)")
-    connection_string: Optional[str] = Field(None, description="Database connection string, if applicable")
+    connection_string: Optional[str] = Field(None, exclude=True, description="Database connection string, if applicable")
     username: Optional[str] = Field(None, description="Username, if applicable")
-    password: Optional[str] = Field(None, description="Password placeholder - actual value stored securely")
-    api_key: Optional[str] = Field(None, description="API key placeholder - actual value stored securely")
-    api_token: Optional[str] = Field(None, description="API token placeholder - actual value stored securely")
+    password: Optional[str] = Field(None, exclude=True, description="Password placeholder - actual value stored securely")
+    api_key: Optional[str] = Field(None, exclude=True, description="API key placeholder - actual value stored securely")
+    api_token: Optional[str] = Field(None, exclude=True, description="API token placeholder - actual value stored securely")
     certificate_path: Optional[str] = Field(None, description="Path to certificate file, if applicable")
     key_path: Optional[str] = Field(None, description="Path to key file, if applicable")
     secret_manager_ref: Optional[str] = Field(None, description="Reference to secrets in secret manager")
     expiration_date: Optional[datetime] = Field(None, description="Expiration date for credentials")
     is_encrypted: bool = Field(True, description="Flag indicating if credentials are encrypted")
 
-    class Config:
-        """Pydantic model configuration."""
+    model_config = ConfigDict(
+        frozen=True,
+        extra="forbid",
         # Extra security measure to ensure sensitive fields are not included in exports/logs
-        schema_extra = {
-            "sensitive_fields": ["password", "api_key", "api_token", "connection_string"]
+        json_schema_extra={
+            "sensitive_fields": sorted(SENSITIVE_CRED_FIELDS)
         }
+    )
+
+    def sensitive_values(self) -> Dict[str, Optional[str]]:
+        """Get the sensitive fields, which every model dump leaves out."""
+        return {name: getattr(self, name) for name in SENSITIVE_CRED_FIELDS}
+
+
+def _none_as_default(cls, value: Any, info: ValidationInfo) -> Any:
+    """Treat an explicit null as the field's empty default; these fields accepted None before."""
+    if value is None:
+        return cls.model_fields[info.field_name].get_default(call_default_factory=True)
+    return value
 
 
 class ContactPerson(BaseModel):
     """Contact person information for a source system."""
+    model_config = ConfigDict(frozen=True)
+
     name: str = Field(..., description="Name of the contact person")
     role: str = Field(..., description="Role or title of the contact person")
     email: Optional[str] = Field(None, description="Email address")
@@ -135,26 +188,42 @@ class ContactPerson(BaseModel):
 
 class DataRetentionPolicy(BaseModel):
     """Data retention policy information."""
+    model_config = ConfigDict(frozen=True)
+
     retention_period: str = Field(..., description="Period for which data is retained")
     archive_policy: Optional[str] = Field(None, description="Policy for archiving data")
     deletion_policy: Optional[str] = Field(None, description="Policy for deleting data")
-    compliance_requirements: Optional[List[str]] = Field(None, description="Compliance requirements affecting retention")
-    exceptions: Optional[List[str]] = Field(None, description="Exceptions to the retention policy")
+    compliance_requirements: Tuple[str, ...] = Field((), description="Compliance requirements affecting retention")
+    exceptions: Tuple[str, ...] = Field((), description="Exceptions to the retention policy")
+
+    _none_as_empty = field_validator("compliance_requirements", "exceptions", mode="before")(_none_as_default)
 
 
 class DataPrivacyInfo(BaseModel):
     """Data privacy information for a source system or table."""
+    model_config = ConfigDict(frozen=True)
+
     contains_pii: bool = Field(False, description="Flag indicating if contains personally identifiable information")
     contains_sensitive_data: bool = Field(False, description="Flag indicating if contains sensitive data")
     data_classification: str = Field("PUBLIC", description="Data classification (PUBLIC, INTERNAL, CONFIDENTIAL, RESTRICTED)")
     compliance_regimes: List[str] = Field(default_factory=list, description="Applicable compliance regimes (GDPR, CCPA, etc.)")
     encryption_required: bool = Field(False, description="Flag indicating if encryption is required")
     masking_required: bool = Field(False, description="Flag indicating if data masking is required")
-    access_restrictions: Optional[List[str]] = Field(None, description="Access restrictions for the data")
+    access_restrictions: Tuple[str, ...] = Field((), description="Access restrictions for the data")
+
+    _none_as_empty = field_validator("access_restrictions", mode="before")(_none_as_default)
+
+    @field_validator("data_classification")
+    @classmethod
+    def _intern_data_classification(cls, value: str) -> str:
+        """Intern the classification, which repeats across most tables and attributes."""
+        return sys.intern(value)
 
 
 class SourceAttribute(BaseModel):
     """Attribute (column) in a source system table."""
+    model_config = ConfigDict(frozen=True, validate_assignment=False)
+
     attribute_id: str = Field(..., description="Unique identifier for the attribute")
     name: str = Field(..., description="Name of the attribute")
     description: Optional[str] = Field(None, description="Description of the attribute")
@@ -169,13 +238,21 @@ class SourceAttribute(BaseModel):
     is_unique: bool = Field(False, description="Flag indicating if attribute has unique constraint")
     default_value: Optional[Any] = Field(None, description="Default value for the attribute")
     has_index: bool = Field(False, description="Flag indicating if attribute is indexed")
-    sample_values: Optional[List[Any]] = Field(None, description="Sample values for the attribute")
+    sample_values: Tuple[Any, ...] = Field((), description="Sample values for the attribute")
     business_definition: Optional[str] = Field(None, description="Business definition of the attribute")
     privacy_info: Optional[DataPrivacyInfo] = Field(None, description="Privacy information for the attribute")
     data_quality_metrics: Optional[Dict[str, Any]] = Field(None, description="Data quality metrics for the attribute")
-    domain_values: Optional[List[str]] = Field(None, description="Allowed domain values, if applicable")
+    domain_values: Tuple[str, ...] = Field((), description="Allowed domain values, if applicable")
     comments: Optional[str] = Field(None, description="Additional comments about the attribute")
 
+    _none_as_empty = field_validator("sample_values", "domain_values", mode="before")(_none_as_default)
+
+    @field_validator("data_type")
+    @classmethod
+    def _intern_data_type(cls, value: str) -> str:
+        """Intern the data type, which repeats across most attributes."""
+        return sys.intern(value)
+
 
 class SourceTable(BaseModel):
     """Table or entity in a source system."""
@@ -185,12 +262,12 @@ class SourceTable(BaseModel):
     database_name: Optional[str] = Field(None, description="Database name, if applicable")
     description: Optional[str] = Field(None, description="Description of the table")
     attributes: List[SourceAttribute] = Field(default_factory=list, description="Attributes (columns) in the table")
-    primary_key: Optional[List[str]] = Field(None, description="Primary key attribute names")
+    primary_key: Tuple[str, ...] = Field((), description="Primary key attribute names")
     record_count: Optional[int] = Field(None, description="Approximate number of records in the table")
     size_in_mb: Optional[float] = Field(None, description="Approximate size of the table in MB")
     created_date: Optional[datetime] = Field(None, description="Date when the table was created")
     last_updated_date: Optional[datetime] = Field(None, description="Date when the table was last updated")
-    update_frequency: Optional[DataFrequency] = Field(None, description="Frequency of table updates")
+    update_frequency: Optional[DataFrequencyLiteral] = Field(None, description="Frequency of table updates")
     data_owner: Optional[str] = Field(None, description="Business owner of the data")
     technical_owner: Optional[str] = Field(None, description="Technical owner of the table")
     is_view: bool = Field(False, description="Flag indicating if this is a view rather than a table")
@@ -198,25 +275,54 @@ class SourceTable(BaseModel):
     privacy_info: Optional[DataPrivacyInfo] = Field(None, description="Privacy information for the table")
     retention_policy: Optional[DataRetentionPolicy] = Field(None, description="Data retention policy for the table")
     business_entity: Optional[str] = Field(None, description="Business entity represented by this table")
-    related_tables: Optional[List[str]] = Field(None, description="Related tables through relationships")
+    related_tables: Tuple[str, ...] = Field((), description="Related tables through relationships")
     sample_query: Optional[str] = Field(None, description="Sample query to retrieve data from this table")
 
+    _none_as_empty = field_validator("primary_key", "related_tables", mode="before")(_none_as_default)
+
+    # Lookup structures built on first use and refreshed when the table changes
+    _attr_index: Optional[Dict[str, SourceAttribute]] = PrivateAttr(default=None)
+    _attr_index_count: int = PrivateAttr(default=0)
+    _primary_key_names: Optional[Tuple[Tuple[str, ...], FrozenSet[str]]] = PrivateAttr(default=None)
+
     def get_primary_key_attributes(self) -> List[SourceAttribute]:
         """Get the attributes that form the primary key."""
         if not self.primary_key:
             return []
 
-        return [attr for attr in self.attributes if attr.name in self.primary_key]
+        # Keyed on the primary key tuple itself, which is replaced rather than edited
+        if self._primary_key_names is None or self._primary_key_names[0] is not self.primary_key:
+            self._primary_key_names = (self.primary_key, frozenset(self.primary_key))
 
-    def get_attribute_by_name(self, name: str) -> Optional[SourceAttribute]:
-        """Get an attribute by name."""
-        for attr in self.attributes:
-            if attr.name == name:
-                return attr
-        return None
+        key_names = self._primary_key_names[1]
+        return [attr for attr in self.attributes if attr.name in key_names]
 
-    def get_full_table_name(self) -> str:
-        """Get the fully qualified table name."""
+    def _index_attributes(self) -> None:
+        """Rebuild the attribute lookup from the current attributes."""
+        # Build in reverse so the first attribute wins on duplicate names
+        self._attr_index = {attr.name: attr for attr in reversed(self.attributes)}
+        self._attr_index_count = len(self.attributes)
+
+    def get_attribute_by_name(self, name: str) -> Optional[SourceAttribute]:
+        """Get an attribute by name.
+
+        The index is rebuilt when attributes were added or removed, and a miss
+        falls back to scanning the list, so attributes renamed or replaced in
+        place are still found.
+        """
+        if self._attr_index is None or self._attr_index_count != len(self.attributes):
+            self._index_attributes()
+
+        attribute = self._attr_index.get(name)
+        if attribute is None or attribute.name != name:
+            attribute = next((attr for attr in self.attributes if attr.name == name), None)
+            if attribute is not None:
+                self._index_attributes()
+        return attribute
+
+    @property
+    def full_table_name(self) -> str:
+        """Fully qualified table name."""
         parts = []
         if self.database_name:
             parts.append(self.database_name)
@@ -225,51 +331,60 @@ class SourceTable(BaseModel):
         parts.append(self.name)
         return ".".join(parts)
 
+    def get_full_table_name(self) -> str:
+        """Get the fully qualified table name."""
+        return self.full_table_name
+
 
 class SourceDatabase(BaseModel):
     """Database in a source system."""
     database_id: str = Field(..., description="Unique identifier for the database")
     name: str = Field(..., description="Name of the database")
     description: Optional[str] = Field(None, description="Description of the database")
-    database_type: DatabaseType = Field(..., description="Type of database")
+    database_type: DatabaseTypeLiteral = Field(..., description="Type of database")
     version: Optional[str] = Field(None, description="Database version")
     tables: List[SourceTable] = Field(default_factory=list, description="Tables in the database")
-    schemas: Optional[List[str]] = Field(None, description="Schemas in the database")
+    schemas: Tuple[str, ...] = Field((), description="Schemas in the database")
     host: Optional[str] = Field(None, description="Database host")
     port: Optional[int] = Field(None, description="Database port")
     connection_details: Optional[Dict[str, Any]] = Field(None, description="Connection details for the database")
 
+    _none_as_empty = field_validator("schemas", mode="before")(_none_as_default)
+
 
 class SourceSystem(BaseModel):
     """Source system containing data relevant to Customer 360."""
     system_id: str = Field(..., description="Unique identifier for the source system")
     name: str = Field(..., description="Name of the source system")
     description: Optional[str] = Field(None, description="Description of the source system")
-    system_type: SourceSystemType = Field(..., description="Type of source system")
+    system_type: SourceSystemTypeLiteral = Field(..., description="Type of source system")
     vendor: Optional[str] = Field(None, description="Vendor of the system, if applicable")
     version: Optional[str] = Field(None, description="Version of the system")
     is_active: bool = Field(True, description="Flag indicating if system is currently active")
-    access_method: AccessMethod = Field(..., description="Method to access the system's data")
-    data_update_frequency: DataFrequency = Field(..., description="Frequency of data updates in the system")
-    data_quality_level: DataQualityLevel = Field(DataQualityLevel.MEDIUM, description="Overall data quality level")
+    access_method: AccessMethodLiteral = Field(..., description="Method to access the system's data")
+    data_update_frequency: DataFrequencyLiteral = Field(..., description="Frequency of data updates in the system")
+    data_quality_level: DataQualityLevelLiteral = Field(DataQualityLevel.MEDIUM.value, description="Overall data quality level")
     databases: List[SourceDatabase] = Field(default_factory=list, description="Databases in the source system")
-    file_formats: Optional[List[FileFormat]] = Field(None, description="File formats for file-based systems")
-    api_endpoints: Optional[List[Dict[str, Any]]] = Field(None, description="API endpoints for API-based systems")
+    file_formats: Tuple[FileFormatLiteral, ...] = Field((), description="File formats for file-based systems")
+    api_endpoints: Tuple[Dict[str, Any], ...] = Field((), description="API endpoints for API-based systems")
     credentials: Optional[ConnectionCredentials] = Field(None, description="Connection credentials")
     contacts: List[ContactPerson] = Field(default_factory=list, description="Contact persons for the system")
-    documentation_links: Optional[List[str]] = Field(None, description="Links to system documentation")
+    documentation_links: Tuple[str, ...] = Field((), description="Links to system documentation")
     data_dictionary_link: Optional[str] = Field(None, description="Link to the data dictionary")
     onboarding_date: Optional[datetime] = Field(None, description="Date when system was onboarded")
     last_profiled_date: Optional[datetime] = Field(None, description="Date when system was last profiled")
     profiling_results: Optional[Dict[str, Any]] = Field(None, description="Results of data profiling")
     notes: Optional[str] = Field(None, description="Additional notes about the system")
 
+    _none_as_empty = field_validator("file_formats", "api_endpoints", "documentation_links", mode="before")(_none_as_default)
+
+    def iter_tables(self) -> Iterator[SourceTable]:
+        """Iterate over all tables across all databases in the source system."""
+        return chain.from_iterable(db.tables for db in self.databases)
+
     def get_tables(self) -> List[SourceTable]:
         """Get all tables across all databases in the source system."""
-        tables = []
-        for db in self.databases:
-            tables.extend(db.tables)
-        return tables
+        return list(self.iter_tables())
 
     def get_table_by_name(self, name: str, schema: Optional[str] = None, database: Optional[str] = None) -> Optional[SourceTable]:
         """Get a table by name, optionally filtered by schema and database."""
@@ -284,13 +399,16 @@ class SourceSystem(BaseModel):
         return None
 
     def get_primary_contact(self) -> Optional[ContactPerson]:
-        """Get the primary contact person for the system."""
-        for contact in self.contacts:
-            if contact.is_primary:
-                return contact
+        """Get the primary contact person for the system.
 
-        # If no primary contact is explicitly marked, return the first one
-        return self.contacts[0] if self.contacts else None
+        Resolved on each call, so contacts added or re-flagged after
+        validation are picked up.
+        """
+        return next(
+            (contact for contact in self.contacts if contact.is_primary),
+            # If no primary contact is explicitly marked, use the first one
+            self.contacts[0] if self.contacts else None
+        )
 
 
 class SourceSystemCatalog(BaseModel):
@@ -304,57 +422,90 @@ class SourceSystemCatalog(BaseModel):
     updated_by: Optional[str] = Field(None, description="User who last updated the catalog")
     updated_at: Optional[datetime] = Field(None, description="Timestamp when catalog was last updated")
 
+    _systems_by_id: Dict[str, SourceSystem] = PrivateAttr(default_factory=dict)
+    _systems_by_name: Dict[str, SourceSystem] = PrivateAttr(default_factory=dict)
+    _indexed_systems: Tuple[SourceSystem, ...] = PrivateAttr(default=())
+    _summary_cache: Optional[tuple] = PrivateAttr(default=None)
+
+    @model_validator(mode="after")
+    def _index_systems(self) -> "SourceSystemCatalog":
+        """Index the source systems by id and name when the catalog is validated."""
+        # Build in reverse so the first system wins on duplicate keys
+        self._systems_by_id = {system.system_id: system for system in reversed(self.source_systems)}
+        self._systems_by_name = {system.name: system for system in reversed(self.source_systems)}
+        self._indexed_systems = tuple(self.source_systems)
+        return self
+
+    def _refresh_index(self) -> None:
+        """Rebuild the indexes when systems were added to, removed from or replaced in the list."""
+        indexed = self._indexed_systems
+        if len(indexed) != len(self.source_systems) or not all(map(operator.is_, indexed, self.source_systems)):
+            self._index_systems()
+
     def get_system_by_id(self, system_id: str) -> Optional[SourceSystem]:
-        """Get a source system by its ID."""
-        for system in self.source_systems:
-            if system.system_id == system_id:
-                return system
-        return None
+        """Get a source system by its ID.
 
-    def get_system_by_name(self, name: str) -> Optional[SourceSystem]:
-        """Get a source system by its name."""
-        for system in self.source_systems:
-            if system.name == name:
-                return system
-        return None
+        Falls back to scanning the list on a miss, so systems renamed in
+        place are still found.
+        """
+        self._refresh_index()
+        system = self._systems_by_id.get(system_id)
+        if system is None or system.system_id != system_id:
+            system = next((s for s in self.source_systems if s.system_id == system_id), None)
+        return system
 
-    def get_tables_by_system_type(self, system_type: SourceSystemType) -> List[SourceTable]:
+    def get_system_by_name(self, name: str) -> Optional[SourceSystem]:
+        """Get a source system by its name, falling back to a scan on a miss."""
+        self._refresh_index()
+        system = self._systems_by_name.get(name)
+        if system is None or system.name != name:
+            system = next((s for s in self.source_systems if s.name == name), None)
+        return system
+
+    def get_tables_by_system_type(self, system_type: str) -> List[SourceTable]:
         """Get all tables from systems of a specific type."""
-        tables = []
-        for system in self.source_systems:
-            if system.system_type == system_type:
-                tables.extend(system.get_tables())
-        return tables
+        return list(chain.from_iterable(
+            system.iter_tables() for system in self.source_systems if system.system_type == system_type
+        ))
 
-    def get_systems_by_type(self, system_type: SourceSystemType) -> List[SourceSystem]:
+    def get_systems_by_type(self, system_type: str) -> List[SourceSystem]:
         """Get all systems of a specific type."""
         return [system for system in self.source_systems if system.system_type == system_type]
 
+    def invalidate_summary(self) -> None:
+        """Drop the cached systems summary after editing the catalog's tables in place."""
+        self._summary_cache = None
+
     def get_systems_summary(self) -> Dict[str, Any]:
-        """Get a summary of all source systems in the catalog."""
+        """Get a summary of all source systems in the catalog.
+
+        The summary is cached until the systems in the catalog, or their
+        is_active flag or system_type, change. Call invalidate_summary()
+        after adding or removing databases, tables or attributes in place.
+        The returned dictionary is shared between calls, so treat it as
+        read-only.
+        """
+        summary_key = tuple(
+            (system.system_id, system.is_active, system.system_type) for system in self.source_systems
+        )
+        if self._summary_cache is not None and self._summary_cache[0] == summary_key:
+            return self._summary_cache[1]
+
+        total_tables = 0
+        total_attributes = 0
+        for table in chain.from_iterable(system.iter_tables() for system in self.source_systems):
+            total_tables += 1
+            total_attributes += len(table.attributes)
+
         summary = {
             "total_systems": len(self.source_systems),
             "active_systems": sum(1 for system in self.source_systems if system.is_active),
-            "system_types": {},
-            "total_tables": 0,
-            "total_attributes": 0
+            "system_types": dict(Counter(system.system_type for system in self.source_systems)),
+            "total_tables": total_tables,
+            "total_attributes": total_attributes
         }
 
-        for system in self.source_systems:
-            # Count by system type
-            system_type = system.system_type.value
-            if system_type in summary["system_types"]:
-                summary["system_types"][system_type] += 1
-            else:
-                summary["system_types"][system_type] = 1
-
-            # Count tables and attributes
-            tables = system.get_tables()
-            summary["total_tables"] += len(tables)
-
-            for table in tables:
-                summary["total_attributes"] += len(table.attributes)
-
+        self._summary_cache = (summary_key, summary)
         return summary
 
 
@@ -371,19 +522,23 @@ class IncrementalLoadStrategy(str, Enum):
     HYBRID = "HYBRID"
 
 
+# Plain-string field type accepting the IncrementalLoadStrategy values
+IncrementalLoadStrategyLiteral = Literal[tuple(member.value for member in IncrementalLoadStrategy)]
+
+
 class DataExtractionConfig(BaseModel):
     """Configuration for extracting data from a source system."""
     config_id: str = Field(..., description="Unique identifier for the configuration")
     source_system_id: str = Field(..., description="ID of the source system")
-    extraction_method: AccessMethod = Field(..., description="Method for extracting data")
-    incremental_strategy: Optional[IncrementalLoadStrategy] = Field(None, description="Strategy for incremental loads")
+    extraction_method: AccessMethodLiteral = Field(..., description="Method for extracting data")
+    incremental_strategy: Optional[IncrementalLoadStrategyLiteral] = Field(None, description="Strategy for incremental loads")
     incremental_key: Optional[str] = Field(None, description="Key attribute for incremental loads")
     batch_size: Optional[int] = Field(None, description="Batch size for extraction, if applicable")
     parallelism: Optional[int] = Field(None, description="Degree of parallelism for extraction")
     schedule: Optional[str] = Field(None, description="Schedule expression (cron or similar)")
     extraction_window: Optional[Dict[str, Any]] = Field(None, description="Time window for extraction")
-    filter_conditions: Optional[List[str]] = Field(None, description="Filter conditions for extraction")
-    target_tables: Optional[List[str]] = Field(None, description="Target tables to extract")
+    filter_conditions: Tuple[str, ...] = Field((), description="Filter conditions for extraction")
+    target_tables: Tuple[str, ...] = Field((), description="Target tables to extract")
     include_deleted: bool = Field(False, description="Flag indicating if deleted records should be included")
     retry_settings: Optional[Dict[str, Any]] = Field(None, description="Settings for retry logic")
     timeout_seconds: Optional[int] = Field(None, description="Timeout in seconds")
@@ -392,6 +547,8 @@ class DataExtractionConfig(BaseModel):
     created_by: Optional[str] = Field(None, description="User who created the configuration")
     custom_settings: Optional[Dict[str, Any]] = Field(None, description="Custom settings specific to extraction method")
 
+    _none_as_empty = field_validator("filter_conditions", "target_tables", mode="before")(_none_as_default)
+
     def get_extraction_window_description(self) -> str:
         """Get a human-readable description of the extraction window."""
         if not self.extraction_window:
@@ -423,7 +580,55 @@ class DataTransformationRule(BaseModel):
     created_at: Optional[datetime] = Field(None, description="When the rule was created")
     created_by: Optional[str] = Field(None, description="User who created the rule")
     version: Optional[str] = Field(None, description="Version of the rule")
-    tags: Optional[List[str]] = Field(None, description="Tags for the rule")
+    tags: Tuple[str, ...] = Field((), description="Tags for the rule")
+
+    _none_as_empty = field_validator("tags", mode="before")(_none_as_default)
+
+    @field_validator("rule_type")
+    @classmethod
+    def _intern_rule_type(cls, value: str) -> str:
+        """Intern the rule type, which repeats across most rules."""
+        return sys.intern(value)
+
+
+class DirectAttributeMapping(BaseModel):
+    """Attribute mapping that copies a source attribute unchanged.
+
+    The attribute names are optional, as they were when attribute mappings
+    were plain dicts, so incomplete entries still load and can be reported.
+    """
+    model_config = ConfigDict(extra="allow")
+
+    mapping_type: Literal["direct"] = Field(..., description="Type of attribute mapping")
+    source_attribute: Optional[str] = Field(None, description="Source attribute name")
+    target_attribute: Optional[str] = Field(None, description="Target attribute name")
+
+
+class DerivedAttributeMapping(BaseModel):
+    """Attribute mapping whose target value is derived, computed or looked up.
+
+    This is the catch-all variant: any mapping_type other than "direct",
+    including a missing one, is treated as transformed.
+    """
+    model_config = ConfigDict(extra="allow")
+
+    mapping_type: Optional[str] = Field(None, description="Type of attribute mapping (derived, computed, lookup, etc.)")
+    source_attribute: Optional[str] = Field(None, description="Source attribute name, if any")
+    target_attribute: Optional[str] = Field(None, description="Target attribute name")
+    transformation_logic: Optional[str] = Field(None, description="Logic or expression producing the target value")
+
+
+# Attribute-level mapping; DataMapping routes each entry to its variant by mapping_type
+DataAttributeMapping = Union[DirectAttributeMapping, DerivedAttributeMapping]
+
+
+def _attribute_mapping_variant(value: Any) -> Any:
+    """Build the variant for one raw attribute mapping from its mapping_type tag."""
+    if isinstance(value, dict):
+        if value.get("mapping_type") == "direct":
+            return DirectAttributeMapping(**value)
+        return DerivedAttributeMapping(**value)
+    return value
 
 
 class DataMapping(BaseModel):
@@ -438,7 +643,7 @@ class DataMapping(BaseModel):
     target_entity: str = Field(..., description="Name of the target entity in the Customer 360 model")
     target_entity_version: Optional[str] = Field(None, description="Version of the target entity")
     mapping_type: str = Field(..., description="Type of mapping (direct, derived, etc.)")
-    attribute_mappings: List[Dict[str, Any]] = Field(..., description="Attribute-level mappings")
+    attribute_mappings: List[DataAttributeMapping] = Field(..., description="Attribute-level mappings")
     transformation_rules: List[DataTransformationRule] = Field(default_factory=list, description="Transformation rules")
     filter_criteria: Optional[str] = Field(None, description="Filter criteria for the mapping")
     is_active: bool = Field(True, description="Flag indicating if mapping is active")
@@ -447,29 +652,67 @@ class DataMapping(BaseModel):
     created_by: Optional[str] = Field(None, description="User who created the mapping")
     updated_by: Optional[str] = Field(None, description="User who last updated the mapping")
     validation_status: Optional[str] = Field(None, description="Validation status of the mapping")
-    validation_messages: Optional[List[str]] = Field(None, description="Validation messages")
-    tags: Optional[List[str]] = Field(None, description="Tags for the mapping")
+    validation_messages: List[str] = Field(default_factory=list, description="Validation messages")
+    tags: Tuple[str, ...] = Field((), description="Tags for the mapping")
     notes: Optional[str] = Field(None, description="Additional notes about the mapping")
 
+    _none_as_empty = field_validator("validation_messages", "tags", mode="before")(_none_as_default)
+
+    @field_validator("mapping_type")
+    @classmethod
+    def _intern_mapping_type(cls, value: str) -> str:
+        """Intern the mapping type, which repeats across most mappings."""
+        return sys.intern(value)
+
+    @field_validator("attribute_mappings", mode="before")
+    @classmethod
+    def _route_attribute_mappings(cls, value: Any) -> Any:
+        """Pick each attribute mapping's variant with one tag lookup."""
+        if isinstance(value, list):
+            return [_attribute_mapping_variant(item) for item in value]
+        return value
+
+    # Attribute names cached together with the mappings they were collected from
+    _attr_cache: Optional[tuple] = PrivateAttr(default=None)
+
+    def _get_attribute_names(self) -> Tuple[Tuple[str, ...], Tuple[str, ...]]:
+        """Collect source and target attribute names in one pass.
+
+        The result is reused until attribute mappings are added, removed or
+        replaced; editing a mapping's attribute names in place is not detected.
+        """
+        cached = self._attr_cache
+        if (
+            cached is None
+            or len(cached[0]) != len(self.attribute_mappings)
+            or not all(map(operator.is_, cached[0], self.attribute_mappings))
+        ):
+            sources = []
+            targets = []
+            for mapping in self.attribute_mappings:
+                if mapping.source_attribute:
+                    sources.append(mapping.source_attribute)
+                if mapping.target_attribute is not None:
+                    targets.append(mapping.target_attribute)
+            cached = self._attr_cache = (tuple(self.attribute_mappings), tuple(sources), tuple(targets))
+
+        return cached[1], cached[2]
+
     def get_source_attributes(self) -> List[str]:
         """Get all source attributes used in this mapping."""
-        attributes = []
-        for mapping in self.attribute_mappings:
-            if "source_attribute" in mapping and mapping["source_attribute"]:
-                attributes.append(mapping["source_attribute"])
-        return attributes
+        return list(self._get_attribute_names()[0])
 
     def get_target_attributes(self) -> List[str]:
         """Get all target attributes used in this mapping."""
-        return [mapping["target_attribute"] for mapping in self.attribute_mappings if "target_attribute" in mapping]
+        return list(self._get_attribute_names()[1])
 
-    def get_direct_mappings(self) -> List[Dict[str, Any]]:
-        """Get all direct (non-transformed) mappings."""
-        return [mapping for mapping in self.attribute_mappings if mapping.get("mapping_type") == "direct"]
+    def get_direct_mappings(self) -> List[DirectAttributeMapping]:
+        """Get all direct (non-transformed) mappings, as DirectAttributeMapping models."""
+        return [mapping for mapping in self.attribute_mappings if isinstance(mapping, DirectAttributeMapping)]
 
-    def get_transformed_mappings(self) -> List[Dict[str, Any]]:
-        """Get all mappings that involve transformations."""
-        return [mapping for mapping in self.attribute_mappings if mapping.get("mapping_type") != "direct"]
+    def get_transformed_mappings(self) -> List[DerivedAttributeMapping]:
+        """Get all mappings that involve transformations, as DerivedAttributeMapping models."""
+        return [mapping for mapping in self.attribute_mappings if isinstance(mapping, DerivedAttributeMapping)]
 
 
 class MappingCatalog(BaseModel):
@@ -486,6 +729,36 @@ class MappingCatalog(BaseModel):
     version: Optional[str] = Field(None, description="Version of the catalog")
     status: Optional[str] = Field(None, description="Status of the catalog (draft, approved, etc.)")
 
+    # Inverted indexes built on first use, together with the mappings they
+    # were built from; rebuilt whenever the list no longer holds those mappings
+    _indexed_mappings: Optional[Tuple[DataMapping, ...]] = PrivateAttr(default=None)
+    _by_source: Dict[str, List[DataMapping]] = PrivateAttr(default_factory=dict)
+    _by_target: Dict[str, List[DataMapping]] = PrivateAttr(default_factory=dict)
+
+    def _refresh_indexes(self) -> None:
+        """Rebuild the source and target indexes if mappings were added, removed or replaced.
+
+        Editing a mapping's source_system_id or target_entity in place is not
+        detected; replace the mapping in the list instead.
+        """
+        indexed = self._indexed_mappings
+        if (
+            indexed is not None
+            and len(indexed) == len(self.mappings)
+            and all(map(operator.is_, indexed, self.mappings))
+        ):
+            return
+
+        by_source = defaultdict(list)
+        by_target = defaultdict(list)
+        for mapping in self.mappings:
+            by_source[mapping.source_system_id].append(mapping)
+            by_target[mapping.target_entity].append(mapping)
+
+        self._by_source = dict(by_source)
+        self._by_target = dict(by_target)
+        self._indexed_mappings = tuple(self.mappings)
+
     def get_mapping_by_id(self, mapping_id: str) -> Optional[DataMapping]:
         """Get a mapping by its ID."""
         for mapping in self.mappings:
@@ -495,11 +768,13 @@ class MappingCatalog(BaseModel):
 
     def get_mappings_by_source_system(self, source_system_id: str) -> List[DataMapping]:
         """Get all mappings for a specific source system."""
-        return [mapping for mapping in self.mappings if mapping.source_system_id == source_system_id]
+        self._refresh_indexes()
+        return list(self._by_source.get(source_system_id, ()))
 
     def get_mappings_by_target_entity(self, target_entity: str) -> List[DataMapping]:
         """Get all mappings for a specific target entity."""
-        return [mapping for mapping in self.mappings if mapping.target_entity == target_entity]
+        self._refresh_indexes()
+        return list(self._by_target.get(target_entity, ()))
 
     def get_summary(self) -> Dict[str, Any]:
         """Get a summary of the mapping catalog."""
@@ -0,0 +1,390 @@
+"""
+Data Designer Models
+
+This module contains the Pydantic models describing the data models produced
+by the Data Designer Agent. They live apart from the prompt templates so that
+rendering a prompt does not pay for importing Pydantic.
+"""
+
+import sys
+from functools import lru_cache
+from typing import Annotated, Dict, List, Literal, Optional, Any, Tuple, Type, Union
+from pydantic import BaseModel, BeforeValidator, ConfigDict, Field, TypeAdapter, field_serializer, field_validator, model_validator
+
+
+# Human-readable field descriptions, kept out of the model definitions so
+# class creation stays cheap. They are added to the JSON schema on demand.
+_FIELD_DOCS: Dict[str, Dict[str, str]] = {
+    "EntityAttribute": {
+        "name": "Name of the attribute",
+        "description": "Description of the attribute",
+        "data_type": "Data type of the attribute",
+        "is_required": "Whether the attribute is required",
+        "is_pii": "Whether the attribute contains PII",
+        "is_sensitive": "Whether the attribute contains sensitive data",
+        "source_type": "Type of source (derived, direct, reference)",
+        "domain_values": "Allowed domain values if applicable",
+        "business_rules": "Business rules for the attribute",
+    },
+    "Relationships": {
+        "target_entity": "Target entity of each relationship",
+        "relation_type": "Type of each relationship (belongs-to, has-many, etc.)",
+        "cardinality": "Cardinality of each relationship",
+        "attributes": "Any further properties of each relationship",
+    },
+    "DataEntity": {
+        "name": "Name of the entity",
+        "description": "Description of the entity",
+        "entity_type": "Type of entity (core, reference, transaction, etc.)",
+        "attributes": "Attributes in the entity",
+        "relationships": "Relationships to other entities",
+        "update_frequency": "Frequency of updates to this entity",
+        "business_owner": "Business owner of the entity",
+        "data_steward": "Data steward responsible for the entity",
+    },
+    "TransactionEntity": {
+        "retention_days": "Number of days transaction records are retained",
+    },
+    "DataModel": {
+        "model_name": "Name of the data model",
+        "description": "Description of the data model",
+        "version": "Version of the data model",
+        "entities": "Entities in the data model",
+        "created_by": "Creator of the data model",
+        "created_at": "Creation timestamp",
+    },
+}
+
+
+EntityType = Literal["core", "reference", "transaction", "event", "derived"]
+SourceType = Literal["derived", "direct", "reference"]
+UpdateFrequency = Literal[
+    "realtime", "hourly", "daily", "weekly", "monthly", "quarterly", "yearly", "on_demand"
+]
+
+# Spellings the LLM uses for the literal values, after lower-casing and
+# mapping "-" and " " to "_"
+_LITERAL_ALIASES = {"real_time": "realtime", "ondemand": "on_demand"}
+
+
+def _normalize_literal(value: Any) -> Any:
+    """Normalize an LLM-written enum value such as "Core" or "Real-time"."""
+    if isinstance(value, str):
+        value = value.strip().lower().replace("-", "_").replace(" ", "_")
+        return _LITERAL_ALIASES.get(value, value)
+    return value
+
+
+def _normalize_entity(value: Any) -> Any:
+    """Normalize entity_type and update_frequency before picking the entity variant."""
+    if isinstance(value, dict) and ("entity_type" in value or "update_frequency" in value):
+        value = dict(value)
+        for key in ("entity_type", "update_frequency"):
+            if key in value:
+                value[key] = _normalize_literal(value[key])
+    return value
+
+
+def _add_field_docs(schema: Dict[str, Any], model: Type[BaseModel]) -> None:
+    """Fill in the JSON schema field descriptions from _FIELD_DOCS.
+
+    Docs are looked up along the MRO, so variants such as CoreEntity inherit
+    the descriptions written for DataEntity.
+    """
+    docs: Dict[str, str] = {}
+    for cls in reversed(model.__mro__):
+        docs.update(_FIELD_DOCS.get(cls.__name__, {}))
+    for name, prop in schema.get("properties", {}).items():
+        if name in docs:
+            prop.setdefault("description", docs[name])
+
+
+class _DesignerModel(BaseModel):
+    """Base class for the data designer models.
+
+    Models are frozen once built and are not revalidated when nested into a
+    parent model. Unknown fields are ignored, since the models are parsed
+    from LLM output that often carries extra keys.
+    """
+    model_config = ConfigDict(
+        frozen=True, extra="ignore", revalidate_instances="never", json_schema_extra=_add_field_docs
+    )
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]):
+        """Build an instance from trusted internal data, skipping validation.
+
+        Only use this for data produced by the pipeline itself; raw LLM output
+        must go through the regular constructor.
+        """
+        return cls.model_construct(**data)
+
+
+class EntityAttribute(_DesignerModel):
+    """Model representing an attribute in a data entity.
+
+    Instances are frozen so identical definitions can be shared between
+    entities; see make_attribute.
+    """
+    name: str
+    description: str
+    data_type: str
+    is_required: bool = False
+    is_pii: bool = False
+    is_sensitive: bool = False
+    source_type: SourceType
+    domain_values: Tuple[str, ...] = ()
+    business_rules: Tuple[str, ...] = ()
+
+    @field_validator("domain_values", "business_rules", mode="before")
+    @classmethod
+    def _none_as_empty(cls, value: Any) -> Any:
+        """Treat an explicit null from the LLM as no values."""
+        return () if value is None else value
+
+    @field_validator("source_type", mode="before")
+    @classmethod
+    def _normalize_source_type(cls, value: Any) -> Any:
+        return _normalize_literal(value)
+
+    @field_validator("data_type")
+    @classmethod
+    def _intern_type(cls, value: str) -> str:
+        """Intern data type names, which repeat across attributes."""
+        return sys.intern(value)
+
+
+@lru_cache(maxsize=4096)
+def _interned_attribute(
+    name: str,
+    description: str,
+    data_type: str,
+    source_type: SourceType,
+    is_required: bool,
+    is_pii: bool,
+    is_sensitive: bool,
+    domain_values: Tuple[str, ...],
+    business_rules: Tuple[str, ...],
+) -> EntityAttribute:
+    return EntityAttribute(
+        name=name,
+        description=description,
+        data_type=data_type,
+        source_type=source_type,
+        is_required=is_required,
+        is_pii=is_pii,
+        is_sensitive=is_sensitive,
+        domain_values=domain_values,
+        business_rules=business_rules,
+    )
+
+
+def make_attribute(
+    name: str,
+    description: str,
+    data_type: str,
+    source_type: SourceType,
+    is_required: bool = False,
+    is_pii: bool = False,
+    is_sensitive: bool = False,
+    domain_values: Tuple[str, ...] = (),
+    business_rules: Tuple[str, ...] = (),
+) -> EntityAttribute:
+    """Return a shared EntityAttribute for the given definition.
+
+    Attributes such as customer_id recur across many entities of a model;
+    identical definitions resolve to one instance instead of one per entity.
+    The most recently used 4096 definitions are kept.
+    """
+    return _interned_attribute(
+        name, description, data_type, source_type, is_required, is_pii, is_sensitive,
+        tuple(domain_values), tuple(business_rules),
+    )
+
+
+_RELATIONSHIP_COLUMNS = ("target_entity", "relation_type", "cardinality")
+
+
+class Relationships(_DesignerModel):
+    """Relationships of an entity, stored column-wise.
+
+    Row i is (target_entity[i], relation_type[i], cardinality[i], attributes[i]);
+    filtering by type is then a scan over one list of strings.
+    """
+    target_entity: List[str] = Field(default_factory=list)
+    relation_type: List[str] = Field(default_factory=list)
+    cardinality: List[str] = Field(default_factory=list)
+    attributes: List[Dict[str, Any]] = Field(default_factory=list)
+
+    @classmethod
+    def from_records(cls, records: List[Dict[str, Any]]) -> "Relationships":
+        """Build the columns from relationship dicts as returned by the LLM.
+
+        Keys other than the three relationship columns are kept per row in
+        attributes; missing columns default to an empty string.
+        """
+        target_entity, relation_type, cardinality, attributes = [], [], [], []
+        for record in records:
+            target_entity.append(record.get("target_entity", ""))
+            relation_type.append(record.get("relation_type", ""))
+            cardinality.append(record.get("cardinality", ""))
+            attributes.append({k: v for k, v in record.items() if k not in _RELATIONSHIP_COLUMNS})
+        return cls.model_construct(
+            target_entity=target_entity,
+            relation_type=relation_type,
+            cardinality=cardinality,
+            attributes=attributes,
+        )
+
+    def __len__(self) -> int:
+        return len(self.target_entity)
+
+    def indices_of_type(self, relation_type: str) -> List[int]:
+        """Get the row indices of relationships of the given type."""
+        return [i for i, value in enumerate(self.relation_type) if value == relation_type]
+
+    def to_records(self) -> List[Dict[str, Any]]:
+        """Get the relationships back as one dict per relationship."""
+        return [
+            {"target_entity": target, "relation_type": kind, "cardinality": card, **extra}
+            for target, kind, card, extra in zip(
+                self.target_entity, self.relation_type, self.cardinality, self.attributes
+            )
+        ]
+
+
+class DataEntity(_DesignerModel):
+    """Model representing a data entity in the Customer 360 model."""
+    name: str
+    description: str
+    entity_type: EntityType
+    attributes: List[EntityAttribute] = Field(default_factory=list)
+    relationships: Relationships = Field(default_factory=Relationships)
+    update_frequency: UpdateFrequency
+    business_owner: Optional[str] = None
+    data_steward: Optional[str] = None
+
+    @model_validator(mode="before")
+    @classmethod
+    def _normalize_literals(cls, data: Any) -> Any:
+        return _normalize_entity(data)
+
+    @field_validator("relationships", mode="before")
+    @classmethod
+    def _relationships_from_records(cls, value: Any) -> Any:
+        if value is None:
+            return Relationships()
+        if isinstance(value, list):
+            return Relationships.from_records(value)
+        return value
+
+    @field_serializer("relationships")
+    def _relationships_to_records(self, value: Relationships) -> List[Dict[str, Any]]:
+        # Dump the list-of-dicts shape the LLM produces, not the internal columns
+        return value.to_records()
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "DataEntity":
+        """Build an instance from trusted internal data, skipping validation."""
+        fields = dict(data)
+        if data.get("attributes"):
+            fields["attributes"] = [
+                attr if isinstance(attr, EntityAttribute) else EntityAttribute.from_dict(attr)
+                for attr in data["attributes"]
+            ]
+        relationships = data.get("relationships")
+        if relationships is None:
+            fields["relationships"] = Relationships()
+        elif isinstance(relationships, list):
+            fields["relationships"] = Relationships.from_records(relationships)
+        elif isinstance(relationships, dict):
+            fields["relationships"] = Relationships.from_dict(relationships)
+        return cls.model_construct(**fields)
+
+
+class CoreEntity(DataEntity):
+    """Core entity, such as the customer profile."""
+    entity_type: Literal["core"] = "core"
+
+
+class ReferenceEntity(DataEntity):
+    """Reference data entity, such as a product or branch catalogue."""
+    entity_type: Literal["reference"] = "reference"
+
+
+class TransactionEntity(DataEntity):
+    """Transactional entity, such as account transactions."""
+    entity_type: Literal["transaction"] = "transaction"
+    retention_days: Optional[int] = None
+
+
+class EventEntity(DataEntity):
+    """Event entity, such as customer interactions."""
+    entity_type: Literal["event"] = "event"
+
+
+class DerivedEntity(DataEntity):
+    """Entity derived from other entities, such as scores or aggregates."""
+    entity_type: Literal["derived"] = "derived"
+
+
+# Entities are validated against the variant named by their entity_type,
+# normalized first so that "Core" or "Real-time" still select a variant.
+AnyDataEntity = Annotated[
+    Union[CoreEntity, ReferenceEntity, TransactionEntity, EventEntity, DerivedEntity],
+    Field(discriminator="entity_type"),
+    BeforeValidator(_normalize_entity),
+]
+
+_ENTITY_CLASSES: Dict[str, Type[DataEntity]] = {
+    "core": CoreEntity,
+    "reference": ReferenceEntity,
+    "transaction": TransactionEntity,
+    "event": EventEntity,
+    "derived": DerivedEntity,
+}
+
+
+class DataModel(_DesignerModel):
+    """Model representing a complete data model for Customer 360."""
+    model_name: str
+    description: str
+    version: str
+    entities: List[AnyDataEntity] = Field(default_factory=list)
+    created_by: str
+    created_at: str
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "DataModel":
+        """Build an instance from trusted internal data, skipping validation."""
+        fields = dict(data)
+        if data.get("entities"):
+            fields["entities"] = [
+                entity if isinstance(entity, DataEntity)
+                else _ENTITY_CLASSES[entity["entity_type"]].from_dict(entity)
+                for entity in data["entities"]
+            ]
+        return cls.model_construct(**fields)
+
+
+def parse_data_model(response: Union[str, bytes]) -> DataModel:
+    """Parse and validate a data model from the LLM's JSON response.
+
+    The JSON is parsed by pydantic-core directly into the model, without
+    building an intermediate dict via json.loads.
+    """
+    return DataModel.model_validate_json(response)
+
+
+# Adapters for validating bare lists, built once rather than per call.
+ENTITY_ATTRIBUTE_LIST_ADAPTER = TypeAdapter(List[EntityAttribute])
+DATA_ENTITY_LIST_ADAPTER = TypeAdapter(List[AnyDataEntity])
+
+
+@lru_cache(maxsize=None)
+def get_json_schema(model: Type[BaseModel]) -> Dict[str, Any]:
+    """Get the JSON schema of a designer model, generated once per model.
+
+    The returned dict is shared between callers and must not be modified.
+    """
+    return model.model_json_schema()
@@ -3,50 +3,52 @@ Data Designer Prompts
 
 This module contains prompt templates for the Data Designer Agent to recommend
 optimal data structures for Customer 360 data products in retail banking.
+The data model classes live in data_designer_models and are imported lazily.
 """
 
-from typing import Dict, List, Optional, Any
-from pydantic import BaseModel, Field
-
-
-class EntityAttribute(BaseModel):
-    """Model representing an attribute in a data entity."""
-    name: str = Field(..., description="Name of the attribute")
-    description: str = Field(..., description="Description of the attribute")
-    data_type: str = Field(..., description="Data type of the attribute")
-    is_required: bool = Field(False, description="Whether the attribute is required")
-    is_pii: bool = Field(False, description="Whether the attribute contains PII")
-    is_sensitive: bool = Field(False, description="Whether the attribute contains sensitive data")
-    source_type: str = Field(..., description="Type of source (derived, direct, reference)")
-    domain_values: Optional[List[str]] = Field(None, description="Allowed domain values if applicable")
-    business_rules: Optional[List[str]] = Field(None, description="Business rules for the attribute")
-
-
-class DataEntity(BaseModel):
-    """Model representing a data entity in the Customer 360 model."""
-    name: str = Field(..., description="Name of the entity")
-    description: str = Field(..., description="Description of the entity")
-    entity_type: str = Field(..., description="Type of entity (core, reference, transaction, etc.)")
-    attributes: List[EntityAttribute] = Field(default_factory=list, description="Attributes in the entity")
-    relationships: List[Dict[str, Any]] = Field(default_factory=list, description="Relationships to other entities")
-    update_frequency: str = Field(..., description="Frequency of updates to this entity")
-    business_owner: Optional[str] = Field(None, description="Business owner of the entity")
-    data_steward: Optional[str] = Field(None, description="Data steward responsible for the entity")
-
-
-class DataModel(BaseModel):
-    """Model representing a complete data model for Customer 360."""
-    model_name: str = Field(..., description="Name of the data model")
-    description: str = Field(..., description="Description of the data model")
-    version: str = Field(..., description="Version of the data model")
-    entities: List[DataEntity] = Field(default_factory=list, description="Entities in the data model")
-    created_by: str = Field(..., description="Creator of the data model")
-    created_at: str = Field(..., description="Creation timestamp")
+from functools import lru_cache
+from typing import TYPE_CHECKING, Any, Iterator
+
+try:
+    import orjson
+    _loads = orjson.loads
+except ImportError:
+    import json
+    _loads = json.loads
+
+if TYPE_CHECKING:
+    from .data_designer_models import (
+        DataEntity,
+        DataModel,
+        EntityAttribute,
+        make_attribute,
+        parse_data_model,
+    )
+
+
+# Responses to the design prompts below should be parsed with parse_data_model.
+_MODEL_EXPORTS = frozenset(
+    ("EntityAttribute", "DataEntity", "DataModel", "make_attribute", "parse_data_model")
+)
+
+
+def __getattr__(name: str) -> Any:
+    # Keep the models importable from here without importing Pydantic up front.
+    if name in _MODEL_EXPORTS:
+        from . import data_designer_models
+        return getattr(data_designer_models, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+# Role headers and footers shared by the prompts below
+_ROLE_HEADER = "You are an expert data architect specializing in Customer 360 data models for retail banking."
+_BANKING_ROLE_HEADER = "You are a banking data architect specializing in retail banking."
+_CUSTOMER_DATA_ROLE_HEADER = "You are a banking data architect specializing in retail customer data."
+_ENTITY_SPEC_FOOTER = "Format your response as a structured entity specification document.\n"
 
 
 # Prompt to design a Customer 360 data model based on business requirements
-DESIGN_CUSTOMER_360_MODEL_PROMPT = """
-You are an expert data architect specializing in Customer 360 data models for retail banking.
+DESIGN_CUSTOMER_360_MODEL_PROMPT = "\n" + _ROLE_HEADER + """
 Based on the provided business requirements, design an optimal data model for a Customer 360 data product.
 
 Business Requirements:
@@ -74,10 +76,10 @@ Create a comprehensive data model with the following components:
 
 3. For each entity:
    - Provide a clear name and description
-   - Define the entity type (core, reference, transaction, etc.)
+   - Define the entity type (one of: core, reference, transaction, event, derived)
    - List all relevant attributes with data types
    - Specify relationships to other entities
-   - Indicate update frequency
+   - Indicate update frequency (one of: realtime, hourly, daily, weekly, monthly, quarterly, yearly, on_demand)
    - Note any special considerations
 
 4. Data Model Architecture
@@ -100,8 +102,7 @@ Use industry best practices for retail banking data modeling and ensure the mode
 
 
 # Prompt to refine a data model based on available source systems
-REFINE_DATA_MODEL_PROMPT = """
-You are an expert data architect specializing in Customer 360 data models for retail banking.
+REFINE_DATA_MODEL_PROMPT = "\n" + _ROLE_HEADER + """
 You've designed an initial data model, but now need to refine it based on available source systems.
 
 Initial Data Model:
@@ -143,8 +144,7 @@ Include clear notations about changes made from the initial model and rationales
 
 
 # Prompt to design domain-specific data structures
-DESIGN_DOMAIN_MODEL_PROMPT = """
-You are an expert data architect specializing in Customer 360 data models for retail banking.
+DESIGN_DOMAIN_MODEL_PROMPT = "\n" + _ROLE_HEADER + """
 Design a detailed data structure for the {domain_name} domain within the Customer 360 data product.
 
 Business Context:
@@ -193,8 +193,7 @@ Ensure the design aligns with banking industry best practices and supports the s
 
 
 # Prompt to generate data dictionary for the designed model
-GENERATE_DATA_DICTIONARY_PROMPT = """
-You are an expert data architect specializing in Customer 360 data models for retail banking.
+GENERATE_DATA_DICTIONARY_PROMPT = "\n" + _ROLE_HEADER + """
 Create a comprehensive data dictionary for the designed Customer 360 data model.
 
 Data Model:
@@ -248,8 +247,7 @@ Use tables, headings, and formatting to make the dictionary accessible and usefu
 
 
 # Prompt to generate physical implementation recommendations
-GENERATE_IMPLEMENTATION_RECOMMENDATIONS_PROMPT = """
-You are an expert data architect specializing in Customer 360 data models for retail banking.
+GENERATE_IMPLEMENTATION_RECOMMENDATIONS_PROMPT = "\n" + _ROLE_HEADER + """
 Provide detailed technical implementation recommendations for the designed Customer 360 data model.
 
 Data Model:
@@ -302,48 +300,173 @@ Include specific technology recommendations where appropriate, with alternatives
 """
 
 
+class PromptRenderer:
+    """Prompt template pre-split around its placeholders.
+
+    Rendering concatenates the constant parts with the supplied values, so
+    the template string is never re-parsed the way ``str.format`` does. A
+    renderer can be built once and reused across the turns of an agent loop;
+    iter_chunks() hands the parts to a streaming client without joining them.
+    """
+
+    __slots__ = ("parts", "parts_b")
+
+    def __init__(self, template: str, *fields: str):
+        parts = []
+        rest = template
+        for field in fields:
+            head, sep, rest = rest.partition("{" + field + "}")
+            if not sep:
+                raise ValueError(f"Placeholder '{field}' not found in template")
+            parts.append(head)
+        parts.append(rest)
+        self.parts = tuple(parts)
+        self.parts_b = tuple(part.encode("utf-8") for part in parts)
+
+    def render(self, *values: str) -> str:
+        parts = self.parts
+        chunks = [parts[0]]
+        for value, part in zip(values, parts[1:]):
+            chunks.append(value)
+            chunks.append(part)
+        return "".join(chunks)
+
+    def iter_chunks(self, *values: str) -> Iterator[str]:
+        """Yield the constant parts interleaved with the values."""
+        parts = self.parts
+        yield parts[0]
+        for value, part in zip(values, parts[1:]):
+            yield value
+            yield part
+
+    def render_bytes(self, *values: str) -> bytes:
+        """Render straight to UTF-8, reusing the pre-encoded constant parts."""
+        parts = self.parts_b
+        chunks = [parts[0]]
+        for value, part in zip(values, parts[1:]):
+            chunks.append(value.encode("utf-8"))
+            chunks.append(part)
+        return b"".join(chunks)
+
+
+_DESIGN_CUSTOMER_360_MODEL_TMPL = PromptRenderer(
+    DESIGN_CUSTOMER_360_MODEL_PROMPT, "business_requirements"
+)
+_REFINE_DATA_MODEL_TMPL = PromptRenderer(
+    REFINE_DATA_MODEL_PROMPT, "initial_data_model_json", "source_systems_json"
+)
+_DESIGN_DOMAIN_MODEL_TMPL = PromptRenderer(
+    DESIGN_DOMAIN_MODEL_PROMPT, "domain_name", "business_context"
+)
+_GENERATE_DATA_DICTIONARY_TMPL = PromptRenderer(
+    GENERATE_DATA_DICTIONARY_PROMPT, "data_model_json"
+)
+_GENERATE_IMPLEMENTATION_RECOMMENDATIONS_TMPL = PromptRenderer(
+    GENERATE_IMPLEMENTATION_RECOMMENDATIONS_PROMPT, "data_model_json", "target_environment"
+)
+
+
+# Agents retry and share context across sub-agents, so the generate_* helpers
+# are memoized on their (string) arguments. Entries are a few KB each.
+@lru_cache(maxsize=256)
 def generate_design_model_prompt(business_requirements: str) -> str:
     """Generate a prompt to design a Customer 360 data model."""
-    return DESIGN_CUSTOMER_360_MODEL_PROMPT.format(
-        business_requirements=business_requirements
-    )
+    return _DESIGN_CUSTOMER_360_MODEL_TMPL.render(business_requirements)
+
+
+def validate_refine_inputs(initial_data_model_json: str, source_systems_json: str) -> None:
+    """Check that the refine prompt inputs are well-formed JSON.
 
+    Broken LLM output is caught here rather than being spliced into the next
+    prompt. Raises ValueError naming the offending argument.
+    """
+    for name, payload in (
+        ("initial_data_model_json", initial_data_model_json),
+        ("source_systems_json", source_systems_json),
+    ):
+        try:
+            _loads(payload)
+        except ValueError as e:
+            raise ValueError(f"{name} is not valid JSON: {e}") from e
 
+
+@lru_cache(maxsize=256)
 def generate_refine_model_prompt(initial_data_model_json: str, source_systems_json: str) -> str:
     """Generate a prompt to refine a data model based on source systems."""
-    return REFINE_DATA_MODEL_PROMPT.format(
-        initial_data_model_json=initial_data_model_json,
-        source_systems_json=source_systems_json
-    )
+    return _REFINE_DATA_MODEL_TMPL.render(initial_data_model_json, source_systems_json)
 
 
+@lru_cache(maxsize=256)
 def generate_domain_model_prompt(domain_name: str, business_context: str) -> str:
     """Generate a prompt to design a domain-specific data model."""
-    return DESIGN_DOMAIN_MODEL_PROMPT.format(
-        domain_name=domain_name,
-        business_context=business_context
-    )
+    return _DESIGN_DOMAIN_MODEL_TMPL.render(domain_name, business_context)
 
 
+@lru_cache(maxsize=256)
 def generate_data_dictionary_prompt(data_model_json: str) -> str:
     """Generate a prompt to create a data dictionary for a data model."""
-    return GENERATE_DATA_DICTIONARY_PROMPT.format(
-        data_model_json=data_model_json
-    )
+    return _GENERATE_DATA_DICTIONARY_TMPL.render(data_model_json)
 
 
+@lru_cache(maxsize=256)
 def generate_implementation_recommendations_prompt(data_model_json: str, target_environment: str) -> str:
     """Generate a prompt for implementation recommendations."""
-    return GENERATE_IMPLEMENTATION_RECOMMENDATIONS_PROMPT.format(
-        data_model_json=data_model_json,
-        target_environment=target_environment
-    )
+    return _GENERATE_IMPLEMENTATION_RECOMMENDATIONS_TMPL.render(data_model_json, target_environment)
+
+
+def generate_design_model_prompt_bytes(business_requirements: str) -> bytes:
+    """Generate the design model prompt as UTF-8 bytes."""
+    return _DESIGN_CUSTOMER_360_MODEL_TMPL.render_bytes(business_requirements)
+
+
+def generate_refine_model_prompt_bytes(initial_data_model_json: str, source_systems_json: str) -> bytes:
+    """Generate the refine model prompt as UTF-8 bytes."""
+    return _REFINE_DATA_MODEL_TMPL.render_bytes(initial_data_model_json, source_systems_json)
+
+
+def generate_domain_model_prompt_bytes(domain_name: str, business_context: str) -> bytes:
+    """Generate the domain model prompt as UTF-8 bytes."""
+    return _DESIGN_DOMAIN_MODEL_TMPL.render_bytes(domain_name, business_context)
+
+
+def generate_data_dictionary_prompt_bytes(data_model_json: str) -> bytes:
+    """Generate the data dictionary prompt as UTF-8 bytes."""
+    return _GENERATE_DATA_DICTIONARY_TMPL.render_bytes(data_model_json)
+
+
+def generate_implementation_recommendations_prompt_bytes(data_model_json: str, target_environment: str) -> bytes:
+    """Generate the implementation recommendations prompt as UTF-8 bytes."""
+    return _GENERATE_IMPLEMENTATION_RECOMMENDATIONS_TMPL.render_bytes(data_model_json, target_environment)
+
+
+def iter_design_model_prompt(business_requirements: str) -> Iterator[str]:
+    """Yield the design model prompt in chunks for streaming clients."""
+    return _DESIGN_CUSTOMER_360_MODEL_TMPL.iter_chunks(business_requirements)
+
+
+def iter_refine_model_prompt(initial_data_model_json: str, source_systems_json: str) -> Iterator[str]:
+    """Yield the refine model prompt in chunks for streaming clients."""
+    return _REFINE_DATA_MODEL_TMPL.iter_chunks(initial_data_model_json, source_systems_json)
+
+
+def iter_domain_model_prompt(domain_name: str, business_context: str) -> Iterator[str]:
+    """Yield the domain model prompt in chunks for streaming clients."""
+    return _DESIGN_DOMAIN_MODEL_TMPL.iter_chunks(domain_name, business_context)
+
+
+def iter_data_dictionary_prompt(data_model_json: str) -> Iterator[str]:
+    """Yield the data dictionary prompt in chunks for streaming clients."""
+    return _GENERATE_DATA_DICTIONARY_TMPL.iter_chunks(data_model_json)
+
+
+def iter_implementation_recommendations_prompt(data_model_json: str, target_environment: str) -> Iterator[str]:
+    """Yield the implementation recommendations prompt in chunks for streaming clients."""
+    return _GENERATE_IMPLEMENTATION_RECOMMENDATIONS_TMPL.iter_chunks(data_model_json, target_environment)
 
 
 # Additional specialized prompts for banking data models
 
-CUSTOMER_PROFILE_ENTITY_DESIGN_PROMPT = """
-You are a banking data architect specializing in retail customer data.
+CUSTOMER_PROFILE_ENTITY_DESIGN_PROMPT = "\n" + _CUSTOMER_DATA_ROLE_HEADER + """
 Design a comprehensive Customer Profile entity for a retail banking Customer 360 data product.
 
 Business Requirements:
@@ -400,12 +523,10 @@ For each attribute, include:
 - Source considerations
 - Update frequency
 
-Format your response as a structured entity specification document.
-"""
+""" + _ENTITY_SPEC_FOOTER
 
 
-ACCOUNT_ENTITY_DESIGN_PROMPT = """
-You are a banking data architect specializing in retail banking.
+ACCOUNT_ENTITY_DESIGN_PROMPT = "\n" + _BANKING_ROLE_HEADER + """
 Design comprehensive Account entities for a retail banking Customer 360 data product.
 
 Business Requirements:
@@ -465,12 +586,10 @@ For each entity and attribute, include:
 - Source considerations
 - Update frequency
 
-Format your response as a structured entity specification document.
-"""
+""" + _ENTITY_SPEC_FOOTER
 
 
-TRANSACTION_ENTITY_DESIGN_PROMPT = """
-You are a banking data architect specializing in retail banking.
+TRANSACTION_ENTITY_DESIGN_PROMPT = "\n" + _BANKING_ROLE_HEADER + """
 Design comprehensive Transaction entities for a retail banking Customer 360 data product.
 
 Business Requirements:
@@ -534,5 +653,4 @@ For each entity and attribute, include:
 - Source considerations
 - Update frequency
 
-Format your response as a structured entity specification document.
-"""
+""" + _ENTITY_SPEC_FOOTER
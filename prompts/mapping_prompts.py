@@ -5,12 +5,22 @@ This module contains prompt templates for the Mapping Agent to generate source-t
 mappings for Customer 360 data products in retail banking.
 """
 
+import json
+import re
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from typing import Dict, List, Optional, Any
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field, ValidationError
 
 
 class AttributeMapping(BaseModel):
-    """Model representing a mapping between source and target attributes."""
+    """Model representing a mapping between source and target attributes.
+
+    Keys the LLM adds beyond these fields are ignored rather than rejected.
+    """
+    model_config = ConfigDict(frozen=True, extra="ignore")
+
     source_system: str = Field(..., description="Source system name")
     source_table: str = Field(..., description="Source table name")
     source_attribute: str = Field(..., description="Source attribute name")
@@ -25,7 +35,13 @@ class AttributeMapping(BaseModel):
 
 
 class EntityMapping(BaseModel):
-    """Model representing a mapping between source tables and target entities."""
+    """Model representing a mapping between source tables and target entities.
+
+    The entity-mapping prompt also asks for overview, source selection and
+    data quality sections; such extra keys are ignored rather than rejected.
+    """
+    model_config = ConfigDict(frozen=True, extra="ignore")
+
     target_entity: str = Field(..., description="Target entity name")
     source_systems: List[Dict[str, Any]] = Field(..., description="Source systems and tables")
     attribute_mappings: List[AttributeMapping] = Field(..., description="Attribute-level mappings")
@@ -35,16 +51,33 @@ class EntityMapping(BaseModel):
     notes: Optional[str] = Field(None, description="Additional notes about the entity mapping")
 
 
-# Prompt to analyze source systems and target model for mapping
-ANALYZE_FOR_MAPPING_PROMPT = """
-You are an expert data integration specialist focused on banking data.
-Analyze the source systems and target data model to identify mapping opportunities and challenges.
+# Rough characters-per-token ratio used to budget prompts without a tokenizer
+_CHARS_PER_TOKEN = 4
 
-Source Systems:
-{source_systems_json}
+# Words of a CamelCase or snake_case name, e.g. CustomerProfile -> Customer, Profile
+_NAME_WORD_RE = re.compile(r"[A-Z]?[a-z]+|[A-Z]+(?![a-z])|\d+")
 
-Target Data Model:
-{target_data_model_json}
+# Mapping types that need dedicated transformation rules
+COMPLEX_MAPPING_TYPES = frozenset({"transformed", "derived", "aggregated", "conditional"})
+
+
+@lru_cache(maxsize=32)
+def _canonicalize_json(json_str: str) -> str:
+    """Re-serialize JSON with sorted keys and compact separators.
+
+    Semantically identical inputs then render byte-identical prompts, which
+    keeps the model server's prompt cache and the agent's own caches hot.
+    """
+    return json.dumps(json.loads(json_str), sort_keys=True, separators=(",", ":"))
+
+
+# Persona shared by the analysis and entity mapping prompts
+_SYSTEM_PERSONA = "You are an expert data integration specialist focused on banking data."
+
+
+# Prompt to analyze source systems and target model for mapping
+_ANALYZE_FOR_MAPPING_INSTRUCTIONS = "\n" + _SYSTEM_PERSONA + """
+Analyze the source systems and target data model provided below to identify mapping opportunities and challenges.
 
 Provide a comprehensive analysis with the following sections:
 
@@ -90,21 +123,19 @@ Provide a comprehensive analysis with the following sections:
 Format your response as a structured markdown document with clear sections and subsections.
 Focus on providing actionable insights that will guide the detailed mapping design.
 """
-
-
-# Prompt to generate entity-level mapping specification
-GENERATE_ENTITY_MAPPING_PROMPT = """
-You are an expert data integration specialist focused on banking data.
-Generate a detailed mapping specification for the {target_entity} entity in the Customer 360 data model.
-
-Source Systems Information:
+_ANALYZE_FOR_MAPPING_INPUTS = """
+Source Systems:
 {source_systems_json}
 
-Target Entity Structure:
-{target_entity_json}
+Target Data Model:
+{target_data_model_json}
+"""
+ANALYZE_FOR_MAPPING_PROMPT = _ANALYZE_FOR_MAPPING_INSTRUCTIONS + _ANALYZE_FOR_MAPPING_INPUTS
 
-Mapping Analysis:
-{mapping_analysis}
+
+# Prompt to generate entity-level mapping specification
+_GENERATE_ENTITY_MAPPING_INSTRUCTIONS = "\n" + _SYSTEM_PERSONA + """
+Generate a detailed mapping specification for the target entity in the Customer 360 data model described below.
 
 Create a comprehensive entity mapping specification with:
 
@@ -145,15 +176,26 @@ Create a comprehensive entity mapping specification with:
 Format your response as a structured JSON document following the EntityMapping model.
 Include detailed notes and explanations for complex mapping decisions.
 """
+_GENERATE_ENTITY_MAPPING_INPUTS = """
+Target Entity:
+{target_entity}
+
+Source Systems Information:
+{source_systems_json}
+
+Target Entity Structure:
+{target_entity_json}
+
+Mapping Analysis:
+{mapping_analysis}
+"""
+GENERATE_ENTITY_MAPPING_PROMPT = _GENERATE_ENTITY_MAPPING_INSTRUCTIONS + _GENERATE_ENTITY_MAPPING_INPUTS
 
 
 # Prompt to generate transformation rules for complex mappings
-GENERATE_TRANSFORMATION_RULES_PROMPT = """
+_GENERATE_TRANSFORMATION_RULES_INSTRUCTIONS = """
 You are an expert in data transformation and integration for banking systems.
-Create detailed transformation rules for complex mappings identified for the Customer 360 data product.
-
-Complex Mapping Requirements:
-{complex_mapping_requirements}
+Create detailed transformation rules for the complex mappings identified below for the Customer 360 data product.
 
 For each complex transformation, generate:
 
@@ -184,17 +226,17 @@ For each complex transformation, generate:
 Format your response as a structured JSON document that can be used directly in ETL/ELT processes.
 Include detailed documentation for each transformation to enable implementation by data engineers.
 """
+_GENERATE_TRANSFORMATION_RULES_INPUTS = """
+Complex Mapping Requirements:
+{complex_mapping_requirements}
+"""
+GENERATE_TRANSFORMATION_RULES_PROMPT = _GENERATE_TRANSFORMATION_RULES_INSTRUCTIONS + _GENERATE_TRANSFORMATION_RULES_INPUTS
 
 
 # Prompt to generate SQL/code for implementing mappings
-GENERATE_IMPLEMENTATION_CODE_PROMPT = """
+_GENERATE_IMPLEMENTATION_CODE_INSTRUCTIONS = """
 You are an expert data engineer specializing in ETL/ELT implementations for banking data.
-Create implementation code for the following entity mappings:
-
-Entity Mapping Specification:
-{entity_mapping_json}
-
-Target Platform: {target_platform}
+Create implementation code for the entity mappings given below.
 
 Please generate code to implement these mappings with:
 
@@ -225,15 +267,20 @@ Format your response with clearly commented code sections.
 Ensure the implementation follows best practices for the target platform.
 Include any initialization or setup code required.
 """
+_GENERATE_IMPLEMENTATION_CODE_INPUTS = """
+Entity Mapping Specification:
+{entity_mapping_json}
+
+Target Platform:
+{target_platform}
+"""
+GENERATE_IMPLEMENTATION_CODE_PROMPT = _GENERATE_IMPLEMENTATION_CODE_INSTRUCTIONS + _GENERATE_IMPLEMENTATION_CODE_INPUTS
 
 
 # Prompt to generate data lineage documentation
-GENERATE_DATA_LINEAGE_PROMPT = """
+_GENERATE_DATA_LINEAGE_INSTRUCTIONS = """
 You are a data governance specialist with expertise in data lineage documentation.
-Create comprehensive data lineage documentation for the following Customer 360 entity:
-
-Entity Mapping:
-{entity_mapping_json}
+Create comprehensive data lineage documentation for the Customer 360 entity given below.
 
 Generate detailed data lineage documentation with:
 
@@ -268,18 +315,35 @@ Format your response as a structured markdown document with clear sections.
 Include mermaid diagrams where appropriate for visual representation.
 Ensure documentation is detailed enough for both technical and business stakeholders.
 """
+_GENERATE_DATA_LINEAGE_INPUTS = """
+Entity Mapping:
+{entity_mapping_json}
+"""
+GENERATE_DATA_LINEAGE_PROMPT = _GENERATE_DATA_LINEAGE_INSTRUCTIONS + _GENERATE_DATA_LINEAGE_INPUTS
 
 
 class MappingAgent:
     """Main class for the Mapping Agent that orchestrates the mapping process."""
 
-    def __init__(self, target_platform="snowflake"):
+    def __init__(self, target_platform="snowflake", max_prompt_tokens=8192, max_llm_calls=5):
         """Initialize the Mapping Agent.
 
         Args:
             target_platform (str): Target platform for implementation code generation.
+            max_prompt_tokens (int): Approximate token budget for a single prompt.
+            max_llm_calls (int): Maximum number of LLM calls in flight at once,
+                across all entities and concurrent process_model calls.
         """
         self.target_platform = target_platform
+        self.max_prompt_tokens = max_prompt_tokens
+        # Slots shared by every LLM-backed step, bounding calls to the provider
+        self._llm_slots = threading.BoundedSemaphore(max_llm_calls)
+        # Mapping analyses keyed by (source_systems_json, target_data_model_json)
+        self._analysis_cache = {}
+        # Entities of the last parsed target data model, keyed by name
+        self._entity_index = {}
+        self._entity_index_source = None
+        self._entity_index_lock = threading.Lock()
         # Add LLM and other dependencies initialization here
 
     def analyze_for_mapping(self, source_systems_json, target_data_model_json):
@@ -293,7 +357,7 @@ class MappingAgent:
             str: Comprehensive mapping analysis
         """
         # Implement LLM call with ANALYZE_FOR_MAPPING_PROMPT
-        prompt = ANALYZE_FOR_MAPPING_PROMPT.format(
+        prompt = _ANALYZE_FOR_MAPPING_INSTRUCTIONS + _ANALYZE_FOR_MAPPING_INPUTS.format(
             source_systems_json=source_systems_json,
             target_data_model_json=target_data_model_json
         )
@@ -313,13 +377,13 @@ class MappingAgent:
             EntityMapping: Entity mapping specification
         """
         # Implement LLM call with GENERATE_ENTITY_MAPPING_PROMPT
-        prompt = GENERATE_ENTITY_MAPPING_PROMPT.format(
+        prompt = _GENERATE_ENTITY_MAPPING_INSTRUCTIONS + _GENERATE_ENTITY_MAPPING_INPUTS.format(
             target_entity=target_entity,
             source_systems_json=source_systems_json,
             target_entity_json=target_entity_json,
             mapping_analysis=mapping_analysis
         )
-        # Parse LLM response into EntityMapping model
+        # Parse LLM response into EntityMapping model with _parse_entity_mapping
         pass
 
     def generate_transformation_rules(self, complex_mapping_requirements):
@@ -332,7 +396,7 @@ class MappingAgent:
             dict: Detailed transformation rules
         """
         # Implement LLM call with GENERATE_TRANSFORMATION_RULES_PROMPT
-        prompt = GENERATE_TRANSFORMATION_RULES_PROMPT.format(
+        prompt = _GENERATE_TRANSFORMATION_RULES_INSTRUCTIONS + _GENERATE_TRANSFORMATION_RULES_INPUTS.format(
             complex_mapping_requirements=complex_mapping_requirements
         )
         # Parse LLM response into transformation rules
@@ -348,7 +412,7 @@ class MappingAgent:
             str: Implementation code for the mappings
         """
         # Implement LLM call with GENERATE_IMPLEMENTATION_CODE_PROMPT
-        prompt = GENERATE_IMPLEMENTATION_CODE_PROMPT.format(
+        prompt = _GENERATE_IMPLEMENTATION_CODE_INSTRUCTIONS + _GENERATE_IMPLEMENTATION_CODE_INPUTS.format(
             entity_mapping_json=entity_mapping_json,
             target_platform=self.target_platform
         )
@@ -365,7 +429,7 @@ class MappingAgent:
             str: Data lineage documentation
         """
         # Implement LLM call with GENERATE_DATA_LINEAGE_PROMPT
-        prompt = GENERATE_DATA_LINEAGE_PROMPT.format(
+        prompt = _GENERATE_DATA_LINEAGE_INSTRUCTIONS + _GENERATE_DATA_LINEAGE_INPUTS.format(
             entity_mapping_json=entity_mapping_json
         )
         # Return LLM response
@@ -382,30 +446,45 @@ class MappingAgent:
         Returns:
             dict: Complete mapping artifacts for the entity
         """
+        # Normalize the JSON inputs so identical content yields identical prompts
+        source_systems_json = _canonicalize_json(source_systems_json)
+        target_data_model_json = _canonicalize_json(target_data_model_json)
+
         # Extract target entity json from target data model
         target_entity_json = self._extract_target_entity(target_entity, target_data_model_json)
 
-        # Generate mapping analysis
-        mapping_analysis = self.analyze_for_mapping(source_systems_json, target_data_model_json)
+        # Generate mapping analysis, shared by all entities of the same model
+        mapping_analysis = self._get_mapping_analysis(source_systems_json, target_data_model_json)
 
-        # Generate entity mapping
-        entity_mapping = self.generate_entity_mapping(
-            target_entity, source_systems_json, target_entity_json, mapping_analysis
+        # Generate entity mapping, trimming source systems to the prompt budget
+        entity_source_systems_json = self._fit_source_systems(
+            source_systems_json,
+            target_entity,
+            _GENERATE_ENTITY_MAPPING_INSTRUCTIONS,
+            target_entity_json,
+            mapping_analysis,
+        )
+        entity_mapping = self._run_llm_step(
+            self.generate_entity_mapping,
+            target_entity, entity_source_systems_json, target_entity_json, mapping_analysis
         )
 
         # Identify complex mappings
         complex_mappings = self._identify_complex_mappings(entity_mapping)
 
+        # Serialize the entity mapping once for both downstream prompts
+        entity_mapping_json = entity_mapping.model_dump_json()
+
         # Generate transformation rules for complex mappings
         transformation_rules = None
         if complex_mappings:
-            transformation_rules = self.generate_transformation_rules(complex_mappings)
+            transformation_rules = self._run_llm_step(self.generate_transformation_rules, complex_mappings)
 
         # Generate implementation code
-        implementation_code = self.generate_implementation_code(entity_mapping.json())
+        implementation_code = self._run_llm_step(self.generate_implementation_code, entity_mapping_json)
 
         # Generate data lineage
-        data_lineage = self.generate_data_lineage(entity_mapping.json())
+        data_lineage = self._run_llm_step(self.generate_data_lineage, entity_mapping_json)
 
         # Return all artifacts
         return {
@@ -415,6 +494,139 @@ class MappingAgent:
             "data_lineage": data_lineage
         }
 
+    def process_model(self, entity_names, source_systems_json, target_data_model_json, max_concurrency=5):
+        """Process several target entities of one data model.
+
+        The mapping analysis covers the whole model, so it is generated once
+        up front and reused for every entity. Entities are then processed
+        concurrently, with at most max_concurrency in flight; the LLM calls
+        they make are further bounded by the agent's max_llm_calls, to stay
+        within the LLM provider's rate limits.
+
+        Args:
+            entity_names (List[str]): Target entity names
+            source_systems_json (str): JSON representation of source systems
+            target_data_model_json (str): JSON representation of target data model
+            max_concurrency (int): Maximum number of entities processed at once
+
+        Returns:
+            dict: Mapping artifacts keyed by target entity name
+        """
+        source_systems_json = _canonicalize_json(source_systems_json)
+        target_data_model_json = _canonicalize_json(target_data_model_json)
+        self._get_mapping_analysis(source_systems_json, target_data_model_json)
+
+        with ThreadPoolExecutor(max_workers=max_concurrency) as executor:
+            futures = {
+                entity_name: executor.submit(
+                    self.process_entity, entity_name, source_systems_json, target_data_model_json
+                )
+                for entity_name in entity_names
+            }
+        return {entity_name: future.result() for entity_name, future in futures.items()}
+
+    def _get_mapping_analysis(self, source_systems_json, target_data_model_json):
+        """Get the mapping analysis for a source/target pair, generating it once.
+
+        Args:
+            source_systems_json (str): JSON representation of source systems
+            target_data_model_json (str): JSON representation of target data model
+
+        Returns:
+            str: Comprehensive mapping analysis
+        """
+        cache_key = (source_systems_json, target_data_model_json)
+        if cache_key not in self._analysis_cache:
+            self._analysis_cache[cache_key] = self._run_llm_step(
+                self.analyze_for_mapping, source_systems_json, target_data_model_json
+            )
+        return self._analysis_cache[cache_key]
+
+    def _run_llm_step(self, step, *args):
+        """Run one LLM-backed step while holding one of the shared LLM call slots."""
+        with self._llm_slots:
+            return step(*args)
+
+    def _fit_source_systems(self, source_systems_json, target_entity, *prompt_parts):
+        """Trim source systems so an entity prompt fits within the token budget.
+
+        Tokens are estimated from character counts. When the prompt would run
+        over budget, source systems are ranked by how often the words of the
+        target entity name occur in them, and the least relevant are dropped;
+        the top-ranked system is always kept. The number of dropped systems is
+        recorded under "truncated_systems". Both a {"systems": [...]} object
+        and a bare list of systems are accepted.
+
+        Args:
+            source_systems_json (str): JSON representation of source systems
+            target_entity (str): Target entity name
+            *prompt_parts (str): Other text going into the same prompt
+
+        Returns:
+            str: JSON representation of the source systems to include
+        """
+        budget = self.max_prompt_tokens * _CHARS_PER_TOKEN
+        budget -= sum(len(part) for part in prompt_parts if part)
+        if len(source_systems_json) <= budget:
+            return source_systems_json
+
+        source_systems = json.loads(source_systems_json)
+        if isinstance(source_systems, list):
+            # A bare list of systems; trimmed into the {"systems": [...]} shape
+            source_systems = {"systems": source_systems}
+        elif not isinstance(source_systems, dict):
+            return source_systems_json
+        systems = source_systems.get("systems")
+        if not isinstance(systems, list) or not systems:
+            return source_systems_json
+
+        terms = [term.lower() for term in _NAME_WORD_RE.findall(target_entity)]
+        encoded = [json.dumps(system, sort_keys=True, separators=(",", ":")) for system in systems]
+        ranked = sorted(
+            range(len(systems)),
+            key=lambda i: sum(encoded[i].lower().count(term) for term in terms),
+            reverse=True,
+        )
+
+        # Start from the JSON left over once every system is dropped. The
+        # most relevant system is always kept, even if it alone is over budget,
+        # so the prompt never goes out without any source.
+        used = len(source_systems_json) - sum(len(text) + 1 for text in encoded)
+        kept = []
+        for i in ranked:
+            if kept and used + len(encoded[i]) + 1 > budget:
+                continue
+            kept.append(i)
+            used += len(encoded[i]) + 1
+
+        kept.sort()
+        trimmed = dict(source_systems)
+        trimmed["systems"] = [systems[i] for i in kept]
+        trimmed["truncated_systems"] = len(systems) - len(kept)
+        return json.dumps(trimmed, sort_keys=True, separators=(",", ":"))
+
+    def _parse_entity_mapping(self, llm_response):
+        """Parse an LLM response into an EntityMapping model.
+
+        The response is validated straight from JSON by pydantic-core. When the
+        model wraps the JSON object in prose, the outermost object is cut out
+        and validated instead.
+
+        Args:
+            llm_response (str): Raw LLM response
+
+        Returns:
+            EntityMapping: Entity mapping specification
+        """
+        try:
+            return EntityMapping.model_validate_json(llm_response)
+        except ValidationError:
+            start = llm_response.find("{")
+            end = llm_response.rfind("}")
+            if start == -1 or end < start:
+                raise
+            return EntityMapping.model_validate_json(llm_response[start:end + 1])
+
     def _extract_target_entity(self, target_entity, target_data_model_json):
         """Extract target entity JSON from target data model.
 
@@ -425,8 +637,19 @@ class MappingAgent:
         Returns:
             str: JSON representation of target entity
         """
-        # Implementation to extract specific entity from data model
-        pass
+        # Parse the model once and index its entities, rather than re-parsing
+        # the whole document for every entity processed. The lock keeps the
+        # index and its source in step across concurrent process_model calls.
+        with self._entity_index_lock:
+            if self._entity_index_source != target_data_model_json:
+                entities = json.loads(target_data_model_json).get("entities", [])
+                self._entity_index = {entity["name"]: entity for entity in entities}
+                self._entity_index_source = target_data_model_json
+
+            entity = self._entity_index.get(target_entity)
+        if entity is None:
+            raise ValueError(f"Entity '{target_entity}' not found in target data model")
+        return json.dumps(entity, sort_keys=True, separators=(",", ":"))
 
     def _identify_complex_mappings(self, entity_mapping):
         """Identify complex mappings that require detailed transformation rules.
@@ -435,14 +658,15 @@ class MappingAgent:
             entity_mapping (EntityMapping): Entity mapping specification
 
         Returns:
-            str: JSON representation of complex mapping requirements
+            Optional[str]: JSON representation of complex mapping requirements,
+                or None when the entity has no complex mappings
         """
-        # Implementation to identify complex mappings
-        complex_mappings = []
-
-        for mapping in entity_mapping.attribute_mappings:
-            if mapping.mapping_type in ["transformed", "derived", "aggregated", "conditional"]:
-                complex_mappings.append(mapping)
+        complex_mappings = [
+            mapping for mapping in entity_mapping.attribute_mappings
+            if mapping.mapping_type in COMPLEX_MAPPING_TYPES
+        ]
+        if not complex_mappings:
+            return None
 
         # Format complex mappings as requirements
         return self._format_complex_mapping_requirements(complex_mappings)
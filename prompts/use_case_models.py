@@ -0,0 +1,167 @@
+"""
+Use Case Models
+
+This module contains the Pydantic models for the requirements and use cases
+produced by the Use Case Agent. They live apart from the prompt templates so
+that rendering a prompt does not pay for importing Pydantic.
+"""
+
+import json
+import logging
+import re
+import sys
+from typing import Any, Iterable, Iterator, List, Literal, Sequence, Tuple, Union
+from pydantic import BaseModel, ConfigDict, Field, TypeAdapter, field_validator
+
+logger = logging.getLogger(__name__)
+
+Priority = Literal["high", "medium", "low"]
+
+
+class BusinessRequirement(BaseModel):
+    """Model representing a parsed business requirement."""
+    model_config = ConfigDict(frozen=True, extra="ignore")
+
+    requirement_id: str = Field(..., description="Unique identifier for the requirement")
+    description: str = Field(..., description="Full text description of the requirement")
+    category: str = Field(..., description="Category of the requirement (marketing, risk, etc.)")
+    priority: Priority = Field(..., description="Priority level (high, medium, low)")
+    stakeholders: Tuple[str, ...] = Field((), description="Stakeholders for this requirement")
+    data_needs: Tuple[str, ...] = Field((), description="Data elements needed to satisfy requirement")
+    metrics: Tuple[str, ...] = Field((), description="Metrics or KPIs associated with requirement")
+    source: str = Field(..., description="Source of the requirement (document, interview, etc.)")
+
+    @field_validator("priority", mode="before")
+    @classmethod
+    def _normalize_priority(cls, value: Any) -> Any:
+        """Accept the capitalized levels the extraction prompt asks for."""
+        return value.strip().lower() if isinstance(value, str) else value
+
+    @field_validator("category", "source")
+    @classmethod
+    def _intern(cls, value: str) -> str:
+        """Intern values drawn from a small vocabulary that repeats across requirements."""
+        return sys.intern(value)
+
+
+class BusinessUseCase(BaseModel):
+    """Model representing a business use case extracted from requirements."""
+    model_config = ConfigDict(frozen=True, extra="ignore")
+
+    use_case_id: str = Field(..., description="Unique identifier for the use case")
+    name: str = Field(..., description="Name of the use case")
+    description: str = Field(..., description="Description of the use case")
+    business_objective: str = Field(..., description="Primary business objective")
+    requirements: Tuple[BusinessRequirement, ...] = Field((), description="Related requirements")
+    success_criteria: Tuple[str, ...] = Field((), description="Success criteria for the use case")
+    data_categories: Tuple[str, ...] = Field((), description="Categories of data needed")
+    primary_stakeholders: Tuple[str, ...] = Field((), description="Primary stakeholders")
+    expected_benefits: Tuple[str, ...] = Field((), description="Expected business benefits")
+
+
+# Adapters for bare sequences, built once rather than per call.
+_REQUIREMENT_LIST_ADAPTER = TypeAdapter(Tuple[BusinessRequirement, ...])
+_USE_CASE_LIST_ADAPTER = TypeAdapter(Tuple[BusinessUseCase, ...])
+
+
+def requirements_to_json(requirements: Sequence[BusinessRequirement]) -> str:
+    """Serialize requirements for the classification and structure prompts.
+
+    Encoding happens in pydantic-core, without the intermediate dicts of
+    json.dumps([r.model_dump() for r in requirements]).
+    """
+    return _REQUIREMENT_LIST_ADAPTER.dump_json(tuple(requirements)).decode()
+
+
+def use_cases_to_json(use_cases: Sequence[BusinessUseCase]) -> str:
+    """Serialize use cases for the questions and structure prompts."""
+    return _USE_CASE_LIST_ADAPTER.dump_json(tuple(use_cases)).decode()
+
+
+def parse_requirements(response: Union[str, bytes]) -> Tuple[BusinessRequirement, ...]:
+    """Parse and validate the requirements in the extraction prompt's JSON response.
+
+    The JSON is parsed by pydantic-core directly into the models, without
+    building an intermediate list of dicts via json.loads.
+    """
+    return _REQUIREMENT_LIST_ADAPTER.validate_json(response)
+
+
+def parse_use_cases(response: Union[str, bytes]) -> Tuple[BusinessUseCase, ...]:
+    """Parse and validate the use cases in the classification prompt's JSON response."""
+    return _USE_CASE_LIST_ADAPTER.validate_json(response)
+
+
+def dedupe_requirements(requirements: Sequence[BusinessRequirement]) -> List[BusinessRequirement]:
+    """Drop requirements whose description repeats an earlier one.
+
+    Descriptions are compared ignoring case and whitespace, which catches the
+    same requirement extracted from overlapping document chunks. The first
+    occurrence is kept and the order is preserved.
+    """
+    seen = set()
+    unique = []
+    for requirement in requirements:
+        key = " ".join(requirement.description.lower().split())
+        if key not in seen:
+            seen.add(key)
+            unique.append(requirement)
+    if len(unique) < len(requirements):
+        logger.debug(f"Dropped {len(requirements) - len(unique)} of {len(requirements)} requirements as duplicates")
+    return unique
+
+
+_JSON_DECODER = json.JSONDecoder()
+
+# Opening bracket of the use case array: one followed by an object or by the
+# closing bracket, so bracketed prose such as "[as requested]" is skipped
+_ARRAY_START_RE = re.compile(r"\[\s*[{\]]")
+
+
+def iter_use_cases(chunks: Iterable[str]) -> Iterator[BusinessUseCase]:
+    """Parse a streamed JSON array of use cases, yielding each as it completes.
+
+    chunks are successive pieces of the classification response, e.g. token
+    deltas from a streaming LLM call. Any text before the opening bracket is
+    skipped. Each use case is validated and yielded as soon as its closing
+    brace arrives, so later stages can start before the response is complete.
+
+    Raises:
+        ValueError: If the stream ends without any use case parsed while
+            unparsed text other than an empty array remains
+    """
+    buffer = ""
+    pos = -1
+    parsed = 0
+    for chunk in chunks:
+        buffer += chunk
+        if pos < 0:
+            start = _ARRAY_START_RE.search(buffer)
+            if start is None:
+                continue
+            pos = start.start() + 1
+            # Objects may already have closed in the text buffered so far
+            chunk = buffer
+        # Only attempt a decode once an object may have closed
+        if "}" not in chunk:
+            continue
+        while True:
+            while pos < len(buffer) and buffer[pos] in " \t\r\n,":
+                pos += 1
+            if pos >= len(buffer) or buffer[pos] == "]":
+                break
+            try:
+                obj, end = _JSON_DECODER.raw_decode(buffer, pos)
+            except json.JSONDecodeError:
+                break
+            yield BusinessUseCase.model_validate(obj)
+            parsed += 1
+            pos = end
+        # Drop consumed text so the buffer holds at most one partial object
+        buffer = buffer[pos:]
+        pos = 0
+
+    if not parsed:
+        rest = buffer[pos:].lstrip(" \t\r\n,") if pos >= 0 else buffer.strip()
+        if rest and not (pos >= 0 and rest.startswith("]")):
+            raise ValueError(f"No use cases could be parsed from the response: {rest[:80]!r}")
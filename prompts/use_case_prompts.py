@@ -3,45 +3,51 @@ Use Case Prompts
 
 This module contains prompt templates for the Use Case Agent to interpret business requirements
 and generate structured specifications for Customer 360 data products.
+The requirement and use case models live in use_case_models and are imported lazily.
 """
 
-from typing import Dict, List, Optional, Any
-from pydantic import BaseModel, Field
+from functools import lru_cache
+from typing import TYPE_CHECKING, Dict, List, Any
+
+if TYPE_CHECKING:
+    from .use_case_models import (
+        BusinessRequirement,
+        BusinessUseCase,
+        dedupe_requirements,
+        iter_use_cases,
+        parse_requirements,
+        parse_use_cases,
+        requirements_to_json,
+        use_cases_to_json,
+    )
 
 
-class BusinessRequirement(BaseModel):
-    """Model representing a parsed business requirement."""
-    requirement_id: str = Field(..., description="Unique identifier for the requirement")
-    description: str = Field(..., description="Full text description of the requirement")
-    category: str = Field(..., description="Category of the requirement (marketing, risk, etc.)")
-    priority: str = Field(..., description="Priority level (high, medium, low)")
-    stakeholders: List[str] = Field(default_factory=list, description="Stakeholders for this requirement")
-    data_needs: List[str] = Field(default_factory=list, description="Data elements needed to satisfy requirement")
-    metrics: List[str] = Field(default_factory=list, description="Metrics or KPIs associated with requirement")
-    source: str = Field(..., description="Source of the requirement (document, interview, etc.)")
+_MODEL_EXPORTS = frozenset(
+    (
+        "BusinessRequirement",
+        "BusinessUseCase",
+        "dedupe_requirements",
+        "iter_use_cases",
+        "parse_requirements",
+        "parse_use_cases",
+        "requirements_to_json",
+        "use_cases_to_json",
+    )
+)
 
 
-class BusinessUseCase(BaseModel):
-    """Model representing a business use case extracted from requirements."""
-    use_case_id: str = Field(..., description="Unique identifier for the use case")
-    name: str = Field(..., description="Name of the use case")
-    description: str = Field(..., description="Description of the use case")
-    business_objective: str = Field(..., description="Primary business objective")
-    requirements: List[BusinessRequirement] = Field(default_factory=list, description="Related requirements")
-    success_criteria: List[str] = Field(default_factory=list, description="Success criteria for the use case")
-    data_categories: List[str] = Field(default_factory=list, description="Categories of data needed")
-    primary_stakeholders: List[str] = Field(default_factory=list, description="Primary stakeholders")
-    expected_benefits: List[str] = Field(default_factory=list, description="Expected business benefits")
+def __getattr__(name: str) -> Any:
+    # Keep the models importable from here without importing Pydantic up front.
+    if name in _MODEL_EXPORTS:
+        from . import use_case_models
+        return getattr(use_case_models, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 # Base prompt for the Use Case Agent to extract requirements from documents
-EXTRACT_REQUIREMENTS_PROMPT = """
+_EXTRACT_REQUIREMENTS_INSTRUCTIONS = """
 You are an expert banking business analyst responsible for extracting business requirements for a Customer 360 data product.
-Your task is to analyze the provided document and identify clear, structured business requirements.
-
-Document Title: {document_title}
-Document Content:
-{document_content}
+Your task is to analyze the document provided below and identify clear, structured business requirements.
 
 For each business requirement you identify, provide the following details:
 1. A unique identifier (REQ-xxx)
@@ -56,16 +62,21 @@ For each business requirement you identify, provide the following details:
 Focus on requirements that are relevant to a Customer 360 data product in the retail banking context.
 Format each requirement as a structured JSON object.
 """
+_EXTRACT_REQUIREMENTS_INPUTS = """
+Document Title:
+{document_title}
+
+Document Content:
+{document_content}
+"""
+EXTRACT_REQUIREMENTS_PROMPT = _EXTRACT_REQUIREMENTS_INSTRUCTIONS + _EXTRACT_REQUIREMENTS_INPUTS
 
 
 # Prompt to classify and prioritize the extracted requirements
-CLASSIFY_REQUIREMENTS_PROMPT = """
+_CLASSIFY_REQUIREMENTS_INSTRUCTIONS = """
 You are an expert banking business analyst responsible for classifying and prioritizing requirements for a Customer 360 data product.
 Review the extracted requirements below and organize them into cohesive business use cases.
 
-Extracted Requirements:
-{requirements_json}
-
 For each business use case you identify:
 1. Assign a unique identifier (UC-xxx)
 2. Provide a descriptive name
@@ -89,15 +100,17 @@ Consider typical retail banking use cases such as:
 
 Format your response as a structured JSON array of business use cases.
 """
+_CLASSIFY_REQUIREMENTS_INPUTS = """
+Extracted Requirements:
+{requirements_json}
+"""
+CLASSIFY_REQUIREMENTS_PROMPT = _CLASSIFY_REQUIREMENTS_INSTRUCTIONS + _CLASSIFY_REQUIREMENTS_INPUTS
 
 
 # Prompt to generate clarifying questions for stakeholders
-GENERATE_QUESTIONS_PROMPT = """
+_GENERATE_QUESTIONS_INSTRUCTIONS = """
 You are an expert banking business analyst working on a Customer 360 data product.
-You've extracted the following business use cases but need additional clarity from stakeholders.
-
-Business Use Cases:
-{use_cases_json}
+You've extracted the business use cases below but need additional clarity from stakeholders.
 
 Generate a set of clarifying questions for stakeholders to better understand the requirements.
 For each question:
@@ -116,21 +129,17 @@ Focus on questions that will help:
 
 Format your response as a structured list of questions, organized by use case.
 """
+_GENERATE_QUESTIONS_INPUTS = """
+Business Use Cases:
+{use_cases_json}
+"""
+GENERATE_QUESTIONS_PROMPT = _GENERATE_QUESTIONS_INSTRUCTIONS + _GENERATE_QUESTIONS_INPUTS
 
 
 # Prompt to structure the final requirements document
-STRUCTURE_REQUIREMENTS_DOCUMENT_PROMPT = """
+_STRUCTURE_REQUIREMENTS_DOCUMENT_INSTRUCTIONS = """
 You are an expert banking business analyst finalizing a requirements document for a Customer 360 data product.
-Based on the use cases, requirements, and stakeholder feedback provided, create a structured requirements document.
-
-Use Cases:
-{use_cases_json}
-
-Requirements:
-{requirements_json}
-
-Stakeholder Feedback:
-{stakeholder_feedback}
+Based on the use cases, requirements, and stakeholder feedback provided below, create a structured requirements document.
 
 Create a comprehensive requirements document with the following sections:
 1. Executive Summary
@@ -172,40 +181,243 @@ Create a comprehensive requirements document with the following sections:
 
 Format your response as a well-structured markdown document. Use formatting, bullet points, tables, and other elements to enhance readability.
 """
+_STRUCTURE_REQUIREMENTS_DOCUMENT_INPUTS = """
+Use Cases:
+{use_cases_json}
 
+Requirements:
+{requirements_json}
 
-def generate_extraction_prompt(document_title: str, document_content: str) -> str:
-    """Generate a prompt to extract requirements from a document."""
-    return EXTRACT_REQUIREMENTS_PROMPT.format(
-        document_title=document_title,
-        document_content=document_content
+Stakeholder Feedback:
+{stakeholder_feedback}
+"""
+STRUCTURE_REQUIREMENTS_DOCUMENT_PROMPT = _STRUCTURE_REQUIREMENTS_DOCUMENT_INSTRUCTIONS + _STRUCTURE_REQUIREMENTS_DOCUMENT_INPUTS
+
+
+
+class _PromptRenderer:
+    """Prompt template pre-split around its placeholders.
+
+    Kept local, like data_designer_prompts.PromptRenderer, so this module
+    imports nothing from its package and still runs as a script.
+    """
+
+    __slots__ = ("parts",)
+
+    def __init__(self, template: str, *fields: str):
+        parts = []
+        rest = template
+        for field in fields:
+            head, sep, rest = rest.partition("{" + field + "}")
+            if not sep:
+                raise ValueError(f"Placeholder '{field}' not found in template")
+            parts.append(head)
+        parts.append(rest)
+        self.parts = tuple(parts)
+
+    def render(self, *values: str) -> str:
+        parts = self.parts
+        chunks = [parts[0]]
+        for value, part in zip(values, parts[1:]):
+            chunks.append(value)
+            chunks.append(part)
+        return "".join(chunks)
+
+
+_EXTRACT_REQUIREMENTS_TMPL = _PromptRenderer(
+    EXTRACT_REQUIREMENTS_PROMPT, "document_title", "document_content"
+)
+_CLASSIFY_REQUIREMENTS_TMPL = _PromptRenderer(CLASSIFY_REQUIREMENTS_PROMPT, "requirements_json")
+_GENERATE_QUESTIONS_TMPL = _PromptRenderer(GENERATE_QUESTIONS_PROMPT, "use_cases_json")
+_STRUCTURE_REQUIREMENTS_DOCUMENT_TMPL = _PromptRenderer(
+    STRUCTURE_REQUIREMENTS_DOCUMENT_PROMPT, "use_cases_json", "requirements_json", "stakeholder_feedback"
+)
+
+
+# User-message renderers for the inputs alone; the instructions go in the
+# system message so they form an identical, cacheable prefix on every call
+_EXTRACT_REQUIREMENTS_INPUTS_TMPL = _PromptRenderer(
+    _EXTRACT_REQUIREMENTS_INPUTS, "document_title", "document_content"
+)
+_CLASSIFY_REQUIREMENTS_INPUTS_TMPL = _PromptRenderer(_CLASSIFY_REQUIREMENTS_INPUTS, "requirements_json")
+_GENERATE_QUESTIONS_INPUTS_TMPL = _PromptRenderer(_GENERATE_QUESTIONS_INPUTS, "use_cases_json")
+_STRUCTURE_REQUIREMENTS_DOCUMENT_INPUTS_TMPL = _PromptRenderer(
+    _STRUCTURE_REQUIREMENTS_DOCUMENT_INPUTS, "use_cases_json", "requirements_json", "stakeholder_feedback"
+)
+
+
+def _chat_messages(instructions: str, inputs: str) -> List[Dict[str, str]]:
+    return [
+        {"role": "system", "content": instructions.strip()},
+        {"role": "user", "content": inputs.strip()},
+    ]
+
+
+# Prompt sizes are estimated from character counts, so no tokenizer is needed
+_CHARS_PER_TOKEN = 4
+MAX_PROMPT_TOKENS = 8192
+CHUNK_OVERLAP_TOKENS = 256
+
+
+def _document_budget(document_title: str, max_prompt_tokens: int) -> int:
+    """Get the number of tokens of document content that fit in one extraction prompt.
+
+    Raises:
+        ValueError: If the prompt without any document content already
+            takes up max_prompt_tokens
+    """
+    fixed_tokens = (len(EXTRACT_REQUIREMENTS_PROMPT) + len(document_title)) // _CHARS_PER_TOKEN
+    budget = max_prompt_tokens - fixed_tokens
+    if budget <= 0:
+        raise ValueError(
+            f"max_prompt_tokens={max_prompt_tokens} leaves no room for document content; "
+            f"the extraction prompt alone takes about {fixed_tokens} tokens"
+        )
+    return budget
+
+
+def truncate_to_tokens(text: str, max_tokens: int) -> str:
+    """Cut text down to roughly max_tokens tokens."""
+    limit = max_tokens * _CHARS_PER_TOKEN
+    return text if len(text) <= limit else text[:limit]
+
+
+def chunk_document(
+    text: str,
+    max_tokens: int,
+    overlap_tokens: int = CHUNK_OVERLAP_TOKENS
+) -> List[str]:
+    """Split text into windows of roughly max_tokens tokens.
+
+    Consecutive windows share overlap_tokens tokens, so a requirement that
+    straddles a boundary appears whole in at least one of them.
+    """
+    if overlap_tokens >= max_tokens:
+        raise ValueError("overlap_tokens must be smaller than max_tokens")
+    size = max_tokens * _CHARS_PER_TOKEN
+    if len(text) <= size:
+        return [text]
+    overlap = overlap_tokens * _CHARS_PER_TOKEN
+    stride = size - overlap
+    return [text[start:start + size] for start in range(0, len(text) - overlap, stride)]
+
+
+# The same documents and JSON payloads are handed to several agents, so the
+# generators are memoized on their (string) arguments.
+@lru_cache(maxsize=256)
+def generate_extraction_prompt(
+    document_title: str,
+    document_content: str,
+    max_prompt_tokens: int = MAX_PROMPT_TOKENS
+) -> str:
+    """Generate a prompt to extract requirements from a document.
+
+    Content beyond the prompt's token budget is dropped; use
+    generate_extraction_chunk_prompts to cover a long document in full.
+    """
+    budget = _document_budget(document_title, max_prompt_tokens)
+    return _EXTRACT_REQUIREMENTS_TMPL.render(
+        document_title, truncate_to_tokens(document_content, budget)
     )
 
 
+def generate_extraction_prompts(
+    document_titles: List[str],
+    document_contents: List[str],
+    max_prompt_tokens: int = MAX_PROMPT_TOKENS
+) -> List[str]:
+    """Generate extraction prompts for several documents, to be sent as one batch."""
+    return [
+        generate_extraction_prompt(title, content, max_prompt_tokens)
+        for title, content in zip(document_titles, document_contents)
+    ]
+
+
+def generate_extraction_chunk_prompts(
+    document_title: str,
+    document_content: str,
+    max_prompt_tokens: int = MAX_PROMPT_TOKENS,
+    overlap_tokens: int = CHUNK_OVERLAP_TOKENS
+) -> List[str]:
+    """Generate one extraction prompt per overlapping window of a long document.
+
+    The prompts are independent and can be sent together as one batch. When
+    the budget left for content is small, the overlap is capped at half of it.
+    """
+    budget = _document_budget(document_title, max_prompt_tokens)
+    overlap_tokens = min(overlap_tokens, budget // 2)
+    return [
+        _EXTRACT_REQUIREMENTS_TMPL.render(document_title, chunk)
+        for chunk in chunk_document(document_content, budget, overlap_tokens)
+    ]
+
+
+@lru_cache(maxsize=256)
 def generate_classification_prompt(requirements_json: str) -> str:
     """Generate a prompt to classify requirements into use cases."""
-    return CLASSIFY_REQUIREMENTS_PROMPT.format(
-        requirements_json=requirements_json
-    )
+    return _CLASSIFY_REQUIREMENTS_TMPL.render(requirements_json)
 
 
+@lru_cache(maxsize=256)
 def generate_questions_prompt(use_cases_json: str) -> str:
     """Generate a prompt to create clarifying questions for stakeholders."""
-    return GENERATE_QUESTIONS_PROMPT.format(
-        use_cases_json=use_cases_json
-    )
+    return _GENERATE_QUESTIONS_TMPL.render(use_cases_json)
 
 
+@lru_cache(maxsize=128)
 def generate_document_structure_prompt(
     use_cases_json: str,
     requirements_json: str,
     stakeholder_feedback: str
 ) -> str:
     """Generate a prompt to structure the final requirements document."""
-    return STRUCTURE_REQUIREMENTS_DOCUMENT_PROMPT.format(
-        use_cases_json=use_cases_json,
-        requirements_json=requirements_json,
-        stakeholder_feedback=stakeholder_feedback
+    return _STRUCTURE_REQUIREMENTS_DOCUMENT_TMPL.render(
+        use_cases_json, requirements_json, stakeholder_feedback
+    )
+
+
+def generate_extraction_messages(
+    document_title: str,
+    document_content: str,
+    max_prompt_tokens: int = MAX_PROMPT_TOKENS
+) -> List[Dict[str, str]]:
+    """Generate chat messages to extract requirements from a document."""
+    budget = _document_budget(document_title, max_prompt_tokens)
+    return _chat_messages(
+        _EXTRACT_REQUIREMENTS_INSTRUCTIONS,
+        _EXTRACT_REQUIREMENTS_INPUTS_TMPL.render(
+            document_title, truncate_to_tokens(document_content, budget)
+        ),
+    )
+
+
+def generate_classification_messages(requirements_json: str) -> List[Dict[str, str]]:
+    """Generate chat messages to classify requirements into use cases."""
+    return _chat_messages(
+        _CLASSIFY_REQUIREMENTS_INSTRUCTIONS,
+        _CLASSIFY_REQUIREMENTS_INPUTS_TMPL.render(requirements_json),
+    )
+
+
+def generate_questions_messages(use_cases_json: str) -> List[Dict[str, str]]:
+    """Generate chat messages to create clarifying questions for stakeholders."""
+    return _chat_messages(
+        _GENERATE_QUESTIONS_INSTRUCTIONS,
+        _GENERATE_QUESTIONS_INPUTS_TMPL.render(use_cases_json),
+    )
+
+
+def generate_document_structure_messages(
+    use_cases_json: str,
+    requirements_json: str,
+    stakeholder_feedback: str
+) -> List[Dict[str, str]]:
+    """Generate chat messages to structure the final requirements document."""
+    return _chat_messages(
+        _STRUCTURE_REQUIREMENTS_DOCUMENT_INSTRUCTIONS,
+        _STRUCTURE_REQUIREMENTS_DOCUMENT_INPUTS_TMPL.render(
+            use_cases_json, requirements_json, stakeholder_feedback
+        ),
     )
 
 
@@ -1,9 +1,173 @@
 # data_utils.py - Data manipulation and schema utilities
 
-import pandas as pd
+import hashlib
 import json
+import operator
 import re
-from collections import defaultdict
+import threading
+from bisect import bisect_right
+from collections import OrderedDict, defaultdict
+
+try:
+    import orjson
+    _loads = orjson.loads
+except ImportError:
+    _loads = json.loads
+
+# Patterns for transformation logic and STRUCT type parsing, compiled once
+_FUNCTION_RE = re.compile(r'([A-Za-z_]+)\s*\(')
+_COLUMN_RE = re.compile(r'([A-Za-z_][A-Za-z0-9_]*)')
+_STRUCT_RE = re.compile(r'<([^>]+)>')
+
+# Field extractors for mapping dicts, one call instead of a lookup per key
+_mapping_fields = operator.itemgetter("sourceSystem", "targetEntity", "targetAttribute")
+_mapping_target = operator.itemgetter("targetEntity", "targetAttribute")
+
+# SQL keywords that the column pattern picks up but are not column references
+_SQL_KEYWORDS = frozenset({
+    "AS", "AND", "OR", "NOT", "NULL", "IN",
+    "BETWEEN", "LIKE", "CASE", "WHEN", "THEN", "ELSE", "END"
+})
+
+# Markers of conditional logic and aggregate functions in transformation logic
+_CONDITIONAL_MARKERS = ("CASE", "WHEN", "IF(", "IIF(")
+_AGGREGATE_FUNCTIONS = frozenset({"SUM", "AVG", "MIN", "MAX", "COUNT"})
+
+# Transformation logic markers for the mapping complexity levels
+_COMPLEX_LOGIC_PATTERN = r'CASE|WHEN'
+_MEDIUM_LOGIC_PATTERN = r'CAST|CONVERT|UPPER|LOWER'
+
+# Entities every Customer 360 schema must define, and the allowed base types
+REQUIRED_ENTITIES = ("Customer", "DemographicProfile", "FinancialProfile")
+VALID_BASE_TYPES = frozenset({
+    "STRING", "INT", "FLOAT", "DECIMAL", "BOOLEAN", "DATE",
+    "TIMESTAMP", "ARRAY", "STRUCT"
+})
+
+# Business terms looked for in requirements and in schema names
+KEY_TERMS = (
+    "demographic", "profile", "income", "assets", "liabilities",
+    "product", "holdings", "transaction", "risk", "channel",
+    "interaction", "lifetime value", "profitability"
+)
+
+# Finds every occurrence of every key term, overlapping ones included. No
+# term is a prefix of another, so at most one can match at any position.
+_KEY_TERMS_RE = re.compile("(?=(" + "|".join(map(re.escape, KEY_TERMS)) + "))")
+
+# Key terms occurring in a (lowercased) text. pyahocorasick, when installed,
+# finds them all in one pass over the text; otherwise each term is searched
+# for with str.find, which beats a regex alternation for a handful of terms.
+try:
+    import ahocorasick
+
+    _KEY_TERMS_AUTOMATON = ahocorasick.Automaton()
+    for _term in KEY_TERMS:
+        _KEY_TERMS_AUTOMATON.add_word(_term, _term)
+    _KEY_TERMS_AUTOMATON.make_automaton()
+
+    def _find_key_terms(text):
+        return {term for _, term in _KEY_TERMS_AUTOMATON.iter(text)}
+except ImportError:
+    def _find_key_terms(text):
+        return {term for term in KEY_TERMS if term in text}
+
+# Validation results for recently seen schemas, keyed by a digest of their
+# JSON form and evicted least recently used first
+_SCHEMA_CACHE_SIZE = 256
+_schema_validation_cache = OrderedDict()
+_schema_coverage_cache = OrderedDict()
+_schema_index_cache = OrderedDict()
+_schema_terms_cache = OrderedDict()
+_schema_cache_lock = threading.Lock()
+
+
+def _schema_digest(schema):
+    """Digest of a schema's JSON form.
+
+    Key order is kept, since the order of reported issues and covering
+    entities follows the schema's iteration order.
+    """
+    encoded = json.dumps(schema, separators=(",", ":"))
+    return hashlib.blake2b(encoded.encode(), digest_size=16).digest()
+
+
+def _memoize(cache, key, compute):
+    """Return the cached result for key, computing and storing it on a miss."""
+    with _schema_cache_lock:
+        if key in cache:
+            cache.move_to_end(key)
+            return cache[key]
+    result = compute()
+    with _schema_cache_lock:
+        cache[key] = result
+        if len(cache) > _SCHEMA_CACHE_SIZE:
+            cache.popitem(last=False)
+    return result
+
+
+def _index_schema(target_schema):
+    """
+    Flattens a target schema into sets of qualified attribute paths.
+
+    Returns:
+        tuple: (set of "entity.attribute" paths, subset of those that are STRUCTs)
+    """
+    def build():
+        attr_set = set()
+        struct_parents = set()
+        for entity, attributes in target_schema.items():
+            for attr_name, attr_type in attributes.items():
+                path = f"{entity}.{attr_name}"
+                attr_set.add(path)
+                if "STRUCT" in attr_type:
+                    struct_parents.add(path)
+        return (frozenset(attr_set), frozenset(struct_parents))
+
+    return _memoize(_schema_index_cache, _schema_digest(target_schema), build)
+
+
+def _schema_term_coverage(schema, digest):
+    """
+    Finds where each key term first occurs in a schema's entity and attribute names.
+
+    Names are lowercased once per schema rather than once per term, and the
+    result is cached per schema digest.
+
+    Returns:
+        dict: Coverage description for each key term found in the schema
+    """
+    def build():
+        # Lay out entity and attribute names one per line, in schema order,
+        # and scan them for every key term in a single pass
+        locations = []
+        names = []
+        for entity, attributes in schema.items():
+            locations.append((entity, None))
+            names.append(entity.lower())
+            for attr_name in attributes.keys():
+                locations.append((entity, attr_name))
+                names.append(attr_name.lower())
+
+        line_starts = []
+        offset = 0
+        for name in names:
+            line_starts.append(offset)
+            offset += len(name) + 1
+
+        coverage = {}
+        for match in _KEY_TERMS_RE.finditer("\n".join(names)):
+            term = match.group(1)
+            if term in coverage:
+                continue
+            entity, attr_name = locations[bisect_right(line_starts, match.start()) - 1]
+            if attr_name is None:
+                coverage[term] = f"Covered in entity {entity}"
+            else:
+                coverage[term] = f"Covered in {entity}.{attr_name}"
+        return coverage
+
+    return _memoize(_schema_terms_cache, digest, build)
 
 class DataSchemaUtils:
     """
@@ -21,31 +185,60 @@ class DataSchemaUtils:
 
         Returns:
             tuple: (is_valid, list of issues)
+
+        Results are cached per schema content, so the returned list is shared
+        between callers and must not be modified.
         """
+        return _memoize(
+            _schema_validation_cache,
+            _schema_digest(schema),
+            lambda: DataSchemaUtils._validate_schema(schema)
+        )
+
+    @staticmethod
+    def validate_schema_json(raw):
+        """
+        Validates a schema given as serialized JSON.
+
+        Args:
+            raw (str or bytes): JSON-encoded schema definition
+
+        Returns:
+            tuple: (is_valid, list of issues)
+
+        Results are cached per serialized schema, so repeated input is not
+        parsed again; the returned list is shared and must not be modified.
+        """
+        encoded = raw.encode() if isinstance(raw, str) else raw
+        return _memoize(
+            _schema_validation_cache,
+            hashlib.blake2b(encoded, digest_size=16).digest(),
+            lambda: DataSchemaUtils.validate_schema(_loads(raw))
+        )
+
+    @staticmethod
+    def _validate_schema(schema):
         issues = []
+        add_issue = issues.append
 
         # Check for missing required entities
-        required_entities = ["Customer", "DemographicProfile", "FinancialProfile"]
-        missing_entities = [entity for entity in required_entities if entity not in schema]
+        missing_entities = [entity for entity in REQUIRED_ENTITIES if entity not in schema]
         if missing_entities:
-            issues.append(f"Missing required entities: {', '.join(missing_entities)}")
+            add_issue(f"Missing required entities: {', '.join(missing_entities)}")
 
         # Check data types
         for entity, attributes in schema.items():
             for attr_name, attr_type in attributes.items():
                 # Check for valid types
-                valid_base_types = ["STRING", "INT", "FLOAT", "DECIMAL", "BOOLEAN", "DATE",
-                                   "TIMESTAMP", "ARRAY", "STRUCT"]
-
-                base_type = attr_type.split("<")[0] if "<" in attr_type else attr_type
-                if base_type not in valid_base_types:
-                    issues.append(f"Invalid data type {attr_type} for {entity}.{attr_name}")
+                base_type = attr_type.partition("<")[0]
+                if base_type not in VALID_BASE_TYPES:
+                    add_issue(f"Invalid data type {attr_type} for {entity}.{attr_name}")
 
                 # Check complex types have proper format
                 if "ARRAY" in attr_type and "<" not in attr_type:
-                    issues.append(f"ARRAY type needs element type specification for {entity}.{attr_name}")
+                    add_issue(f"ARRAY type needs element type specification for {entity}.{attr_name}")
                 if "STRUCT" in attr_type and "<" not in attr_type:
-                    issues.append(f"STRUCT type needs field specifications for {entity}.{attr_name}")
+                    add_issue(f"STRUCT type needs field specifications for {entity}.{attr_name}")
 
         return (len(issues) == 0, issues)
 
@@ -63,30 +256,29 @@ class DataSchemaUtils:
             tuple: (is_valid, list of issues)
         """
         issues = []
+        add_issue = issues.append
+        attr_set, struct_parents = _index_schema(target_schema)
 
         for mapping in mapping_list:
+            source_system, target_entity, target_attribute = _mapping_fields(mapping)
+
             # Check source system exists
-            if mapping["sourceSystem"] not in source_systems:
-                issues.append(f"Unknown source system: {mapping['sourceSystem']}")
+            if source_system not in source_systems:
+                add_issue(f"Unknown source system: {source_system}")
 
             # Check target entity exists
-            if mapping["targetEntity"] not in target_schema:
-                issues.append(f"Unknown target entity: {mapping['targetEntity']}")
+            if target_entity not in target_schema:
+                add_issue(f"Unknown target entity: {target_entity}")
             else:
                 # Check target attribute exists in entity
-                target_path = mapping["targetAttribute"].split(".")
-                entity = target_schema[mapping["targetEntity"]]
+                parent_attr, nested, _ = target_attribute.partition(".")
+                parent_path = f"{target_entity}.{parent_attr}"
 
-                if len(target_path) == 1:
-                    if target_path[0] not in entity:
-                        issues.append(f"Unknown attribute {target_path[0]} in entity {mapping['targetEntity']}")
-                else:
-                    # Handle nested attributes
-                    parent_attr = target_path[0]
-                    if parent_attr not in entity:
-                        issues.append(f"Unknown attribute {parent_attr} in entity {mapping['targetEntity']}")
-                    elif "STRUCT" not in entity[parent_attr]:
-                        issues.append(f"Attribute {parent_attr} is not a STRUCT type")
+                if parent_path not in attr_set:
+                    add_issue(f"Unknown attribute {parent_attr} in entity {target_entity}")
+                elif nested and parent_path not in struct_parents:
+                    # Nested attributes need a STRUCT parent
+                    add_issue(f"Attribute {parent_attr} is not a STRUCT type")
 
         return (len(issues) == 0, issues)
 
@@ -101,46 +293,32 @@ class DataSchemaUtils:
 
         Returns:
             dict: Coverage analysis
+
+        Results are cached per requirements text and schema content, so the
+        returned dict is shared between callers and must not be modified.
         """
-        # Extract key terms from requirements
-        req_text = requirements.lower()
-        key_terms = [
-            "demographic", "profile", "income", "assets", "liabilities",
-            "product", "holdings", "transaction", "risk", "channel",
-            "interaction", "lifetime value", "profitability"
-        ]
+        digest = _schema_digest(schema)
+        return _memoize(
+            _schema_coverage_cache,
+            (requirements, digest),
+            lambda: DataSchemaUtils._analyze_schema_coverage(
+                requirements, _schema_term_coverage(schema, digest)
+            )
+        )
 
-        term_presence = {}
-        for term in key_terms:
-            term_presence[term] = term in req_text
+    @staticmethod
+    def _analyze_schema_coverage(requirements, schema_coverage):
+        # Extract key terms from requirements
+        found_terms = _find_key_terms(requirements.lower())
+        term_presence = {term: term in found_terms for term in KEY_TERMS}
 
         # Check schema coverage
         coverage = {}
-        for term in key_terms:
+        for term in KEY_TERMS:
             if not term_presence[term]:
                 coverage[term] = "Not required"
-                continue
-
-            found = False
-            for entity, attributes in schema.items():
-                entity_name = entity.lower()
-                if term in entity_name:
-                    found = True
-                    coverage[term] = f"Covered in entity {entity}"
-                    break
-
-                # Check attribute names
-                for attr_name in attributes.keys():
-                    if term in attr_name.lower():
-                        found = True
-                        coverage[term] = f"Covered in {entity}.{attr_name}"
-                        break
-
-                if found:
-                    break
-
-            if not found:
-                coverage[term] = "Not covered in schema"
+            else:
+                coverage[term] = schema_coverage.get(term, "Not covered in schema")
 
         # Calculate coverage percentage
         required_terms = [term for term, present in term_presence.items() if present]
@@ -167,42 +345,45 @@ class DataSchemaUtils:
         Returns:
             dict: Entity-based sample data
         """
-        import random
-        from datetime import datetime, timedelta
+        import numpy as np
+        import pandas as pd
+        from datetime import date
 
+        rng = np.random.default_rng()
+        today = np.datetime64(date.today(), "D")
         sample_data = {}
 
         for entity, attributes in schema.items():
-            entity_data = []
-
-            for _ in range(rows):
-                row = {}
-
-                for attr_name, attr_type in attributes.items():
-                    # Handle basic types
-                    if attr_type == "STRING":
-                        row[attr_name] = f"Sample{random.randint(1000, 9999)}"
-                    elif attr_type == "INT":
-                        row[attr_name] = random.randint(1, 1000)
-                    elif attr_type == "FLOAT" or attr_type == "DECIMAL":
-                        row[attr_name] = round(random.uniform(1, 1000), 2)
-                    elif attr_type == "BOOLEAN":
-                        row[attr_name] = random.choice([True, False])
-                    elif attr_type == "DATE":
-                        days = random.randint(0, 365)
-                        date = datetime.now() - timedelta(days=days)
-                        row[attr_name] = date.strftime("%Y-%m-%d")
-                    # Handle complex types (simplified)
-                    elif "STRUCT" in attr_type:
-                        row[attr_name] = {"field1": "Sample value", "field2": random.randint(1, 100)}
-                    elif "ARRAY" in attr_type:
-                        row[attr_name] = [f"Item{i}" for i in range(1, random.randint(2, 5))]
-                    else:
-                        row[attr_name] = "Sample data"
-
-                entity_data.append(row)
-
-            sample_data[entity] = entity_data
+            # Generate each column in one draw, then convert to rows in bulk
+            columns = {}
+            for attr_name, attr_type in attributes.items():
+                # Handle basic types
+                if attr_type == "STRING":
+                    values = np.char.add("Sample", rng.integers(1000, 10000, size=rows).astype(str)).tolist()
+                elif attr_type == "INT":
+                    values = rng.integers(1, 1001, size=rows).tolist()
+                elif attr_type == "FLOAT" or attr_type == "DECIMAL":
+                    values = np.round(rng.uniform(1, 1000, size=rows), 2).tolist()
+                elif attr_type == "BOOLEAN":
+                    values = rng.integers(0, 2, size=rows).astype(bool).tolist()
+                elif attr_type == "DATE":
+                    days = rng.integers(0, 366, size=rows).astype("timedelta64[D]")
+                    values = np.datetime_as_string(today - days, unit="D").tolist()
+                # Handle complex types (simplified)
+                elif "STRUCT" in attr_type:
+                    values = [{"field1": "Sample value", "field2": v}
+                              for v in rng.integers(1, 101, size=rows).tolist()]
+                elif "ARRAY" in attr_type:
+                    values = [[f"Item{i}" for i in range(1, n)]
+                              for n in rng.integers(2, 6, size=rows).tolist()]
+                else:
+                    values = ["Sample data"] * rows
+                columns[attr_name] = values
+
+            if columns:
+                sample_data[entity] = pd.DataFrame(columns).to_dict(orient="records")
+            else:
+                sample_data[entity] = [{} for _ in range(rows)]
 
         return sample_data
 
@@ -222,25 +403,22 @@ class DataSchemaUtils:
             return (False, {"error": "Empty transformation logic"})
 
         # Extract function calls
-        function_pattern = r'([A-Za-z_]+)\s*\('
-        functions = re.findall(function_pattern, logic_text)
+        functions = _FUNCTION_RE.findall(logic_text)
 
         # Extract column references
-        column_pattern = r'([A-Za-z_][A-Za-z0-9_]*)'
-        potential_columns = re.findall(column_pattern, logic_text)
+        potential_columns = _COLUMN_RE.findall(logic_text)
 
-        # Remove functions from potential columns
-        columns = [col for col in potential_columns if col not in functions
-                  and col not in ["AS", "AND", "OR", "NOT", "NULL", "IN",
-                                 "BETWEEN", "LIKE", "CASE", "WHEN", "THEN", "ELSE", "END"]]
+        # Remove functions and keywords from potential columns
+        function_names = set(functions)
+        columns = [col for col in potential_columns
+                   if col not in function_names and col not in _SQL_KEYWORDS]
 
         # Check for conditional logic
-        has_conditional = any(term in logic_text.upper()
-                             for term in ["CASE", "WHEN", "IF(", "IIF("])
+        upper_logic = logic_text.upper()
+        has_conditional = any(term in upper_logic for term in _CONDITIONAL_MARKERS)
 
         # Check for aggregation
-        has_aggregation = any(fn.upper() in ["SUM", "AVG", "MIN", "MAX", "COUNT"]
-                             for fn in functions)
+        has_aggregation = any(fn.upper() in _AGGREGATE_FUNCTIONS for fn in functions)
 
         return (True, {
             "functions": functions,
@@ -261,24 +439,23 @@ class DataSchemaUtils:
         Returns:
             pandas.DataFrame: DataFrame with mapping analysis
         """
+        import pandas as pd
+
         if not mappings:
             return pd.DataFrame()
 
         df = pd.DataFrame(mappings)
 
-        # Add mapping complexity column
-        def assess_complexity(row):
-            logic = row.get('transformationLogic', '')
-            if not logic or logic == '':
-                return 'Simple'
-            elif 'CASE' in logic or 'WHEN' in logic:
-                return 'Complex'
-            elif any(fn in logic for fn in ['CAST', 'CONVERT', 'UPPER', 'LOWER']):
-                return 'Medium'
-            else:
-                return 'Simple'
+        # Add mapping complexity column, classifying all rows column-wise
+        if 'transformationLogic' in df.columns:
+            logic = df['transformationLogic'].fillna('').astype(str)
+        else:
+            logic = pd.Series('', index=df.index)
 
-        df['mappingComplexity'] = df.apply(assess_complexity, axis=1)
+        complexity = pd.Series('Simple', index=df.index)
+        complexity[logic.str.contains(_MEDIUM_LOGIC_PATTERN, regex=True)] = 'Medium'
+        complexity[logic.str.contains(_COMPLEX_LOGIC_PATTERN, regex=True)] = 'Complex'
+        df['mappingComplexity'] = complexity
 
         return df
 
@@ -292,40 +469,35 @@ class DataSchemaUtils:
             mappings (list): List of mapping dictionaries
 
         Returns:
-            dict: Coverage analysis
+            dict: Coverage analysis, with unmapped attributes in sorted order
         """
         # Count total attributes in schema
         total_attributes = 0
-        flat_attributes = []
+        flat_attributes = set()
 
         for entity, attributes in target_schema.items():
             for attr_name, attr_type in attributes.items():
                 if "STRUCT" in attr_type:
                     # Extract nested attributes for STRUCT types
-                    struct_pattern = r'<([^>]+)>'
-                    struct_match = re.search(struct_pattern, attr_type)
+                    struct_match = _STRUCT_RE.search(attr_type)
                     if struct_match:
-                        struct_fields = struct_match.group(1).split(',')
-                        for field in struct_fields:
-                            if ':' in field:
-                                field_name = field.split(':')[0].strip()
-                                flat_attributes.append(f"{entity}.{attr_name}.{field_name}")
+                        for field in struct_match.group(1).split(','):
+                            field_name, sep, _ = field.partition(':')
+                            if sep:
+                                flat_attributes.add(f"{entity}.{attr_name}.{field_name.strip()}")
                                 total_attributes += 1
                 else:
-                    flat_attributes.append(f"{entity}.{attr_name}")
+                    flat_attributes.add(f"{entity}.{attr_name}")
                     total_attributes += 1
 
         # Count mapped attributes
-        mapped_attributes = set()
-        for mapping in mappings:
-            target_attr = f"{mapping['targetEntity']}.{mapping['targetAttribute']}"
-            mapped_attributes.add(target_attr)
+        mapped_attributes = {f"{entity}.{attr}" for entity, attr in map(_mapping_target, mappings)}
 
         # Calculate coverage metrics
         coverage_percentage = round(len(mapped_attributes) / max(total_attributes, 1) * 100)
 
         # Find unmapped attributes
-        unmapped = [attr for attr in flat_attributes if attr not in mapped_attributes]
+        unmapped = sorted(flat_attributes - mapped_attributes)
 
         return {
             "total_attributes": total_attributes,
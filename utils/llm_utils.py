@@ -1,63 +1,321 @@
 # llm_utils.py - Utilities for working with LLMs via Ollama
 
+import hashlib
 import json
+import reprlib
 import requests
+import threading
 import time
 import os
+import re
+from collections import OrderedDict, deque
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from itertools import islice
 from typing import Dict, List, Any, Optional
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+# orjson, when installed, parses and serializes several times faster than the
+# standard library. Its JSONDecodeError subclasses json.JSONDecodeError, so
+# callers catch the same exception either way.
+try:
+    import orjson
+    _loads = orjson.loads
+
+    def _dumps_indented(obj: Any) -> str:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS).decode()
+
+    def _dumps_compact(obj: Any) -> bytes:
+        return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS)
+except ImportError:
+    _loads = json.loads
+
+    def _dumps_indented(obj: Any) -> str:
+        return json.dumps(obj, indent=2)
+
+    def _dumps_compact(obj: Any) -> bytes:
+        return json.dumps(obj, separators=(",", ":")).encode()
+
+# zstandard is optional; it is only needed to save or load ".zst" memory files
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+
+def _require_zstandard(filename: str):
+    """Fail clearly when a ".zst" file is used without zstandard installed."""
+    if zstandard is None:
+        raise ImportError(f"zstandard is required to read or write {filename}")
+
+# Models often wrap their JSON in prose or a markdown code fence
+_FENCED_JSON_RE = re.compile(r"```(?:json)?\s*(.+?)```", re.S)
+# Where a JSON object, or an array of objects (or an empty array), may start
+_OBJECT_START_RE = re.compile(r"\{")
+_RECORDS_START_RE = re.compile(r"\{|\[\s*[{\]]")
+_JSON_DECODER = json.JSONDecoder()
+
+
+def _is_expected_json(value: Any, allow_records: bool) -> bool:
+    """Check that a decoded value is an object, or a list of objects if allowed."""
+    if isinstance(value, dict):
+        return True
+    return allow_records and isinstance(value, list) and all(isinstance(item, dict) for item in value)
+
+
+def _extract_json(text: str, allow_records: bool = False) -> Any:
+    """
+    Parse the JSON object in an LLM response, tolerating prose around it.
+
+    Tries the whole text, then a fenced ```json block, then scans for the
+    first object that decodes from an opening brace onwards. Values of any
+    other shape, such as a "[1]" citation in the prose, are skipped.
+
+    Args:
+        text: Response text from the LLM
+        allow_records: Also accept a list of objects
+
+    Raises:
+        json.JSONDecodeError: If no JSON value of the expected shape can be found
+    """
+    error = None
+    try:
+        value = _loads(text)
+        if _is_expected_json(value, allow_records):
+            return value
+    except json.JSONDecodeError as exc:
+        error = exc
+
+    match = _FENCED_JSON_RE.search(text)
+    if match:
+        try:
+            value = _loads(match.group(1))
+            if _is_expected_json(value, allow_records):
+                return value
+        except json.JSONDecodeError:
+            pass
+
+    # Resume each search after the decoded value or at the decode error, so
+    # the scan stays linear however many braces the prose contains
+    start_re = _RECORDS_START_RE if allow_records else _OBJECT_START_RE
+    position = 0
+    while True:
+        opening = start_re.search(text, position)
+        if opening is None:
+            break
+        try:
+            value, position = _JSON_DECODER.raw_decode(text, opening.start())
+        except json.JSONDecodeError as exc:
+            position = max(exc.pos, opening.start() + 1)
+            continue
+        except RecursionError:
+            # Nested too deeply to be a real response; give up on the scan
+            break
+        if _is_expected_json(value, allow_records):
+            return value
+
+    if error is None:
+        kind = "JSON object or array of objects" if allow_records else "JSON object"
+        error = json.JSONDecodeError(f"No {kind} found", text, 0)
+    raise error
+
+
+class OllamaError(RuntimeError):
+    """Raised when an Ollama request still fails after the retry policy is exhausted."""
+
 
 class OllamaLLM:
     """
     Client for interacting with Ollama API to access Gemma-2B model.
     """
 
-    def __init__(self, model_name="gemma-2b", base_url="http://localhost:11434"):
+    def __init__(self, model_name="gemma-2b", base_url="http://localhost:11434",
+                 timeout=(3.05, 180), keep_alive="10m"):
         """
         Initialize the Ollama LLM client.
 
         Args:
             model_name (str): Name of the model to use
             base_url (str): Ollama API base URL
+            timeout (tuple): (connect, read) timeouts in seconds for each request
+            keep_alive (str): How long Ollama keeps the model loaded after a request
         """
         self.model_name = model_name
         self.base_url = base_url.rstrip('/')
         self.generate_endpoint = f"{self.base_url}/api/generate"
         self.chat_endpoint = f"{self.base_url}/api/chat"
         self.list_endpoint = f"{self.base_url}/api/tags"
+        self.timeout = timeout
+        self.keep_alive = keep_alive
+
+        # Keep-alive connections shared by all calls, including generate_batch threads.
+        # Transient connection errors and 5xx responses are retried with
+        # exponential backoff; a request that still fails raises OllamaError.
+        self.session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=4,
+            pool_maxsize=16,
+            max_retries=Retry(
+                total=3,
+                connect=2,
+                read=1,
+                backoff_factor=0.3,
+                status_forcelist=(500, 502, 503, 504),
+                allowed_methods=frozenset(["POST", "GET"])
+            )
+        )
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+
+        # Responses to deterministic prompts, keyed by the raw BLAKE2b digest
+        # of the request (see _cache_key)
+        self._cache = OrderedDict()
+        self._cache_lock = threading.Lock()
+        self.cache_max = 512
+
+        # Model last found available, reused for _avail_ttl seconds
+        self._avail_model: Optional[str] = None
+        self._avail_ts = 0.0
+        self._avail_ttl = 60.0
+
+    @staticmethod
+    def _read_stream(response, extract) -> str:
+        """
+        Assemble a streamed Ollama response.
+
+        Ollama streams one JSON object per line; each line is parsed as it
+        arrives and its text fragment collected, then joined once at the end.
+
+        Args:
+            response (requests.Response): Response opened with stream=True
+            extract (callable): Returns the text fragment of one streamed object
+
+        Returns:
+            str: The complete response text
+
+        Raises:
+            OllamaError: If the stream reports an error or a line is not valid JSON
+        """
+        parts = []
+        for line in response.iter_lines(chunk_size=8192):
+            if not line:
+                continue
+            try:
+                chunk = _loads(line)
+            except json.JSONDecodeError as e:
+                bad_line = line.decode("utf-8", errors="replace")[:200]
+                raise OllamaError(f"Malformed line in streamed response: {bad_line!r}") from e
+            if "error" in chunk:
+                raise OllamaError(chunk["error"])
+            parts.append(extract(chunk))
+            if chunk.get("done"):
+                break
+        return "".join(parts)
+
+    def _cache_response(self, key: bytes, text: str):
+        """Store a generated response, evicting the least recently used one when full."""
+        with self._cache_lock:
+            self._cache[key] = text
+            if len(self._cache) > self.cache_max:
+                self._cache.popitem(last=False)
+
+    def close(self):
+        """Close the pooled HTTP connections."""
+        self.session.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
 
     def _check_model_availability(self):
-        """Check if the specified model is available in Ollama."""
+        """
+        Check if the specified model is available in Ollama.
+
+        A successful check is reused for _avail_ttl seconds, as the installed
+        models rarely change while the client is in use. Failures are never
+        cached, so a model pulled or a server started afterwards is seen on
+        the next call.
+        """
+        now = time.monotonic()
+        if self._avail_model == self.model_name and now - self._avail_ts < self._avail_ttl:
+            return True
+
         try:
-            response = requests.get(self.list_endpoint)
+            response = self.session.get(self.list_endpoint, timeout=self.timeout)
             models = response.json().get('models', [])
-            available_models = [model.get('name') for model in models]
+            available_models = {model.get('name') for model in models}
 
             if self.model_name not in available_models:
                 print(f"Warning: Model {self.model_name} not found in available models: {available_models}")
-                return False
-            return True
+                available = False
+            else:
+                available = True
         except Exception as e:
             print(f"Error checking model availability: {str(e)}")
-            return False
+            available = False
+
+        if available:
+            self._avail_model = self.model_name
+            self._avail_ts = now
+        else:
+            self._avail_model = None
+        return available
+
+    def _cache_key(self, prompt: str, system_prompt: Optional[str], temperature: float,
+                   max_tokens: Optional[int]) -> bytes:
+        """Digest every request field that affects the response.
+
+        Each field is length-prefixed, so no choice of prompt or system
+        prompt text can make two different requests hash the same input.
+        """
+        hasher = hashlib.blake2b(digest_size=16)
+        # Falsy system prompts and token limits are left out of the payload alike
+        for field in (self.model_name, system_prompt or "", repr(float(temperature)), str(max_tokens or ""), prompt):
+            data = field.encode()
+            hasher.update(len(data).to_bytes(8, "little"))
+            hasher.update(data)
+        return hasher.digest()
 
     def generate(self, prompt: str, system_prompt: Optional[str] = None,
-                temperature: float = 0.7, max_tokens: Optional[int] = None) -> str:
+                temperature: float = 0.7, max_tokens: Optional[int] = None,
+                use_cache: bool = True) -> str:
         """
         Generate text completion using Ollama.
 
+        Deterministic calls (temperature 0) are answered from an in-memory
+        cache when the same request was generated before.
+
         Args:
             prompt (str): The prompt to send to the model
             system_prompt (str, optional): System instructions for the model
             temperature (float): Sampling temperature (0.0 to 1.0)
             max_tokens (int, optional): Maximum number of tokens to generate
+            use_cache (bool): Whether to consult and fill the response cache
 
         Returns:
             str: Generated text
+
+        Raises:
+            OllamaError: If the request fails after retries
         """
+        key = None
+        # Only greedy decoding is deterministic; sampled responses are never reused
+        if use_cache and temperature <= 0:
+            key = self._cache_key(prompt, system_prompt, temperature, max_tokens)
+            with self._cache_lock:
+                if key in self._cache:
+                    self._cache.move_to_end(key)
+                    return self._cache[key]
+
         payload = {
             "model": self.model_name,
             "prompt": prompt,
             "temperature": temperature,
+            "keep_alive": self.keep_alive,
+            "stream": True,
         }
 
         if system_prompt:
@@ -67,15 +325,40 @@ class OllamaLLM:
             payload["max_tokens"] = max_tokens
 
         try:
-            response = requests.post(self.generate_endpoint, json=payload)
-            if response.status_code == 200:
-                return response.json().get('response', '')
-            else:
-                print(f"Error: Received status code {response.status_code}")
-                print(response.text)
-                return f"Error: Failed to generate text. Status code: {response.status_code}"
-        except Exception as e:
-            return f"Error: {str(e)}"
+            with self.session.post(self.generate_endpoint, json=payload,
+                                   timeout=self.timeout, stream=True) as response:
+                if response.status_code != 200:
+                    raise OllamaError(
+                        f"Failed to generate text. Status code: {response.status_code}: {response.text}")
+                text = self._read_stream(response, lambda chunk: chunk.get('response', ''))
+        except requests.RequestException as e:
+            raise OllamaError(f"Failed to generate text: {e}") from e
+
+        if key is not None:
+            self._cache_response(key, text)
+        return text
+
+    def generate_batch(self, prompts: List[str], system_prompt: Optional[str] = None,
+                       temperature: float = 0.7, max_tokens: Optional[int] = None,
+                       max_concurrency: int = 4) -> List[str]:
+        """
+        Generate completions for several independent prompts concurrently.
+
+        Args:
+            prompts (List[str]): The prompts to send to the model
+            system_prompt (str, optional): System instructions shared by all prompts
+            temperature (float): Sampling temperature (0.0 to 1.0)
+            max_tokens (int, optional): Maximum number of tokens to generate
+            max_concurrency (int): Maximum number of requests in flight
+
+        Returns:
+            List[str]: Generated texts, in the same order as the prompts
+        """
+        with ThreadPoolExecutor(max_workers=max_concurrency) as executor:
+            return list(executor.map(
+                lambda prompt: self.generate(prompt, system_prompt, temperature, max_tokens),
+                prompts
+            ))
 
     def chat(self, messages: List[Dict[str, str]],
              system_prompt: Optional[str] = None,
@@ -90,42 +373,55 @@ class OllamaLLM:
 
         Returns:
             str: Response from the model
+
+        Raises:
+            OllamaError: If the request fails after retries
         """
         payload = {
             "model": self.model_name,
             "messages": messages,
             "temperature": temperature,
+            "keep_alive": self.keep_alive,
+            "stream": True,
         }
 
         if system_prompt:
             payload["system"] = system_prompt
 
         try:
-            response = requests.post(self.chat_endpoint, json=payload)
-            if response.status_code == 200:
-                return response.json().get('message', {}).get('content', '')
-            else:
-                print(f"Error: Received status code {response.status_code}")
-                print(response.text)
-                return f"Error: Failed to chat. Status code: {response.status_code}"
-        except Exception as e:
-            return f"Error: {str(e)}"
+            with self.session.post(self.chat_endpoint, json=payload,
+                                   timeout=self.timeout, stream=True) as response:
+                if response.status_code != 200:
+                    raise OllamaError(
+                        f"Failed to chat. Status code: {response.status_code}: {response.text}")
+                return self._read_stream(
+                    response, lambda chunk: chunk.get('message', {}).get('content', ''))
+        except requests.RequestException as e:
+            raise OllamaError(f"Failed to chat: {e}") from e
 
 
-class AgentPromptLibrary:
-    """
-    Library of prompts for banking data product agents.
-    """
+# Prompt skeletons for the agents, built once; the builders only fill them in.
+# Every prompt opens with the same preamble and keeps its inputs at the end,
+# so the static text forms a common prefix that Ollama can reuse from its
+# prompt cache across the agents' calls.
+_AGENT_PREAMBLE = """
+        You are an expert agent in a multi-agent system that designs a Customer 360 data product for retail banking.
+        Each agent handles one step of the design and passes its output to the next as JSON.
 
-    @staticmethod
-    def use_case_agent_prompt(business_requirements: str) -> str:
-        """Generate prompt for the Use Case Agent."""
-        return f"""
-        You are an expert Use Case Agent specialized in banking customer data analytics.
+        Follow these rules in every response:
+        - Base your answer only on the inputs given at the end of this prompt
+        - Apply banking best practices and respect regulatory and privacy requirements
+        - Respond with valid JSON only, without commentary or markdown fences
+"""
 
-        Analyze the following business requirements for a banking Customer 360 view:
+_AGENT_EPILOGUE = """
+        Respond in JSON.
+        """
 
-        {business_requirements}
+_USE_CASE_AGENT_TMPL = _AGENT_PREAMBLE + """
+        You are the Use Case Agent, specialized in banking customer data analytics.
+
+        Analyze the business requirements below for a banking Customer 360 view.
 
         Extract and structure the following information:
         1. Primary business objective
@@ -135,20 +431,16 @@ class AgentPromptLibrary:
         5. KPIs and success metrics
 
         Format your response as JSON with these categories.
-        """
 
-    @staticmethod
-    def data_designer_agent_prompt(use_case_requirements: Dict[str, Any]) -> str:
-        """Generate prompt for the Data Designer Agent."""
-        req_json = json.dumps(use_case_requirements, indent=2)
-        return f"""
-        You are an expert Data Designer Agent specialized in banking data models.
+        BUSINESS REQUIREMENTS:
+        {business_requirements}
+""" + _AGENT_EPILOGUE
 
-        Based on the following analyzed requirements:
 
-        {req_json}
+_DATA_DESIGNER_AGENT_TMPL = _AGENT_PREAMBLE + """
+        You are the Data Designer Agent, specialized in banking data models.
 
-        Design an optimal schema for a Customer 360 data product with:
+        Based on the analyzed requirements below, design an optimal schema for a Customer 360 data product with:
         1. Core entities (e.g., Customer, Accounts, Transactions)
         2. Entity attributes with appropriate data types
         3. Entity relationships and cardinality
@@ -161,20 +453,16 @@ class AgentPromptLibrary:
         - Maintaining data lineage and audit trails
 
         Format your response as JSON with entity definitions and their attributes.
-        """
 
-    @staticmethod
-    def source_system_agent_prompt(use_case_requirements: Dict[str, Any]) -> str:
-        """Generate prompt for the Source System Agent."""
-        req_json = json.dumps(use_case_requirements, indent=2)
-        return f"""
-        You are an expert Source System Agent specialized in banking data systems.
+        ANALYZED REQUIREMENTS:
+        {req_json}
+""" + _AGENT_EPILOGUE
 
-        Based on the following requirements:
 
-        {req_json}
+_SOURCE_SYSTEM_AGENT_TMPL = _AGENT_PREAMBLE + """
+        You are the Source System Agent, specialized in banking data systems.
 
-        Identify appropriate source systems for a retail banking Customer 360 view:
+        Based on the requirements below, identify appropriate source systems for a retail banking Customer 360 view:
         1. List each relevant source system (e.g., Core Banking, CRM)
         2. For each system, identify key data tables/entities
         3. Assess data quality and update frequency
@@ -188,24 +476,16 @@ class AgentPromptLibrary:
         - Marketing Campaign Systems (offers, responses)
 
         Format your response as JSON with systems and their key data entities.
-        """
 
-    @staticmethod
-    def mapping_agent_prompt(schema: Dict[str, Any], source_systems: Dict[str, Any]) -> str:
-        """Generate prompt for the Mapping Agent."""
-        schema_json = json.dumps(schema, indent=2)
-        sources_json = json.dumps(source_systems, indent=2)
+        REQUIREMENTS:
+        {req_json}
+""" + _AGENT_EPILOGUE
 
-        return f"""
-        You are an expert Mapping Agent specialized in data integration for banking.
 
-        Create source-to-target mappings between source systems and the target schema:
+_MAPPING_AGENT_TMPL = _AGENT_PREAMBLE + """
+        You are the Mapping Agent, specialized in data integration for banking.
 
-        TARGET SCHEMA:
-        {schema_json}
-
-        SOURCE SYSTEMS:
-        {sources_json}
+        Create source-to-target mappings between the source systems and the target schema below.
 
         For each target attribute, create a mapping specification with:
         1. Source system and table
@@ -221,24 +501,19 @@ class AgentPromptLibrary:
         - Lookups (code to description)
 
         Format your response as a list of JSON objects, each representing a mapping.
-        """
 
-    @staticmethod
-    def certification_agent_prompt(schema: Dict[str, Any], mappings: List[Dict[str, Any]]) -> str:
-        """Generate prompt for the Certification Agent."""
-        schema_json = json.dumps(schema, indent=2)
-        mappings_json = json.dumps(mappings, indent=2)
+        TARGET SCHEMA:
+        {schema_json}
 
-        return f"""
-        You are an expert Certification Agent specialized in banking data governance.
+        SOURCE SYSTEMS:
+        {sources_json}
+""" + _AGENT_EPILOGUE
 
-        Evaluate the following Customer 360 data product for compliance and quality:
 
-        TARGET SCHEMA:
-        {schema_json}
+_CERTIFICATION_AGENT_TMPL = _AGENT_PREAMBLE + """
+        You are the Certification Agent, specialized in banking data governance.
 
-        DATA MAPPINGS:
-        {mappings_json}
+        Evaluate the Customer 360 data product below for compliance and quality.
 
         Assess the data product on these dimensions:
         1. Data quality (completeness, accuracy)
@@ -250,7 +525,69 @@ class AgentPromptLibrary:
         Identify any issues that must be addressed before certification and suggest remediation steps.
 
         Format your response as a JSON report with assessment scores and recommendations.
+
+        TARGET SCHEMA:
+        {schema_json}
+
+        DATA MAPPINGS:
+        {mappings_json}
+""" + _AGENT_EPILOGUE
+
+
+@lru_cache(maxsize=128)
+def _render_prompt(template: str, **fields: str) -> str:
+    """Fill a prompt template, memoized on the already serialized inputs."""
+    return template.format(**fields)
+
+
+class AgentPromptLibrary:
+    """
+    Library of prompts for banking data product agents.
+
+    Prompts are memoized, so rebuilding one for identical inputs (on a
+    retry or rerun) is a cache lookup. The dict inputs are keyed on their
+    serialized JSON, which keeps their key order as it appears in the prompt.
+    """
+
+    @staticmethod
+    @lru_cache(maxsize=256)
+    def use_case_agent_prompt(business_requirements: str) -> str:
+        """Generate prompt for the Use Case Agent."""
+        return _USE_CASE_AGENT_TMPL.format(business_requirements=business_requirements)
+
+    @staticmethod
+    def data_designer_agent_prompt(use_case_requirements: Dict[str, Any]) -> str:
+        """Generate prompt for the Data Designer Agent."""
+        req_json = _dumps_indented(use_case_requirements)
+        return _render_prompt(_DATA_DESIGNER_AGENT_TMPL, req_json=req_json)
+
+    @staticmethod
+    def source_system_agent_prompt(use_case_requirements: Dict[str, Any]) -> str:
+        """Generate prompt for the Source System Agent."""
+        req_json = _dumps_indented(use_case_requirements)
+        return _render_prompt(_SOURCE_SYSTEM_AGENT_TMPL, req_json=req_json)
+
+    @staticmethod
+    def mapping_agent_prompt(schema: Dict[str, Any], source_systems: Dict[str, Any],
+                             schema_json: Optional[str] = None) -> str:
+        """Generate prompt for the Mapping Agent.
+
+        schema_json, when given, is the schema already serialized with
+        _dumps_indented and is used instead of serializing schema again.
         """
+        if schema_json is None:
+            schema_json = _dumps_indented(schema)
+        sources_json = _dumps_indented(source_systems)
+        return _render_prompt(_MAPPING_AGENT_TMPL, schema_json=schema_json, sources_json=sources_json)
+
+    @staticmethod
+    def certification_agent_prompt(schema: Dict[str, Any], mappings: List[Dict[str, Any]],
+                                   schema_json: Optional[str] = None) -> str:
+        """Generate prompt for the Certification Agent; schema_json as for mapping_agent_prompt."""
+        if schema_json is None:
+            schema_json = _dumps_indented(schema)
+        mappings_json = _dumps_indented(mappings)
+        return _render_prompt(_CERTIFICATION_AGENT_TMPL, schema_json=schema_json, mappings_json=mappings_json)
 
 
 class MultiAgentOrchestrator:
@@ -277,124 +614,137 @@ class MultiAgentOrchestrator:
             business_requirements (str): Business requirements text
 
         Returns:
-            dict: Complete workflow results
+            dict: Complete workflow results. Step timestamps are
+            time.perf_counter() readings, meaningful only relative to "start".
+            If an LLM call fails, the results end at the last completed step
+            and "error" holds the failure.
         """
+        clock = time.perf_counter
+        timestamps = {"start": clock()}
         results = {
             "business_requirements": business_requirements,
-            "timestamps": {
-                "start": time.time()
-            }
+            "timestamps": timestamps
         }
 
-        # Step 1: Use Case Agent
-        print("🤖 Use Case Agent processing requirements...")
-        use_case_prompt = self.prompt_library.use_case_agent_prompt(business_requirements)
-        use_case_response = self.llm.generate(use_case_prompt)
-
+        # A failed LLM call stops the workflow; the remaining steps depend on its output
         try:
-            use_case_analysis = json.loads(use_case_response)
-        except json.JSONDecodeError:
-            # If not proper JSON, wrap in a basic structure
-            use_case_analysis = {"analysis": use_case_response}
-
-        results["use_case_analysis"] = use_case_analysis
-        results["timestamps"]["use_case_complete"] = time.time()
-
-        # Step 2: Data Designer Agent
-        print("🤖 Data Designer Agent creating schema...")
-        designer_prompt = self.prompt_library.data_designer_agent_prompt(use_case_analysis)
-        schema_response = self.llm.generate(designer_prompt)
-
-        try:
-            proposed_schema = json.loads(schema_response)
-        except json.JSONDecodeError:
-            # If not proper JSON, create a simplified schema
-            proposed_schema = {
-                "Customer": {
-                    "customerId": "STRING",
-                    "customerName": "STRING",
-                    "customerSegment": "STRING"
+            # Step 1: Use Case Agent
+            print("🤖 Use Case Agent processing requirements...")
+            use_case_prompt = self.prompt_library.use_case_agent_prompt(business_requirements)
+            use_case_response = self.llm.generate(use_case_prompt)
+
+            try:
+                use_case_analysis = _extract_json(use_case_response)
+            except json.JSONDecodeError:
+                # If not proper JSON, wrap in a basic structure
+                use_case_analysis = {"analysis": use_case_response}
+
+            results["use_case_analysis"] = use_case_analysis
+            timestamps["use_case_complete"] = clock()
+
+            # Steps 2 and 3 both depend only on the use case analysis, so the
+            # Data Designer and Source System prompts are submitted as one batch
+            print("🤖 Data Designer Agent creating schema...")
+            print("🤖 Source System Agent identifying data sources...")
+            schema_response, sources_response = self.llm.generate_batch([
+                self.prompt_library.data_designer_agent_prompt(use_case_analysis),
+                self.prompt_library.source_system_agent_prompt(use_case_analysis),
+            ], max_concurrency=2)
+            timestamps["schema_complete"] = timestamps["sources_complete"] = clock()
+
+            # Step 2: Data Designer Agent
+            try:
+                proposed_schema = _extract_json(schema_response)
+            except json.JSONDecodeError:
+                # If not proper JSON, create a simplified schema
+                proposed_schema = {
+                    "Customer": {
+                        "customerId": "STRING",
+                        "customerName": "STRING",
+                        "customerSegment": "STRING"
+                    }
                 }
-            }
 
-        results["proposed_schema"] = proposed_schema
-        results["timestamps"]["schema_complete"] = time.time()
-
-        # Step 3: Source System Agent
-        print("🤖 Source System Agent identifying data sources...")
-        source_prompt = self.prompt_library.source_system_agent_prompt(use_case_analysis)
-        sources_response = self.llm.generate(source_prompt)
-
-        try:
-            data_sources = json.loads(sources_response)
-        except json.JSONDecodeError:
-            # If not proper JSON, create simplified sources
-            data_sources = {
-                "Core Banking System": {
-                    "tables": ["CUSTOMER_MASTER", "ACCOUNT_MASTER"],
-                    "update_frequency": "Daily"
-                },
-                "CRM System": {
-                    "tables": ["CUSTOMER_INTERACTIONS"],
-                    "update_frequency": "Real-time"
+            results["proposed_schema"] = proposed_schema
+            # Serialized once for both the Mapping and Certification prompts
+            schema_json = _dumps_indented(proposed_schema)
+
+            # Step 3: Source System Agent
+            try:
+                data_sources = _extract_json(sources_response)
+            except json.JSONDecodeError:
+                # If not proper JSON, create simplified sources
+                data_sources = {
+                    "Core Banking System": {
+                        "tables": ["CUSTOMER_MASTER", "ACCOUNT_MASTER"],
+                        "update_frequency": "Daily"
+                    },
+                    "CRM System": {
+                        "tables": ["CUSTOMER_INTERACTIONS"],
+                        "update_frequency": "Real-time"
+                    }
                 }
-            }
-
-        results["data_sources"] = data_sources
-        results["timestamps"]["sources_complete"] = time.time()
 
-        # Step 4: Mapping Agent
-        print("🤖 Mapping Agent creating data mappings...")
-        mapping_prompt = self.prompt_library.mapping_agent_prompt(proposed_schema, data_sources)
-        mappings_response = self.llm.generate(mapping_prompt)
-
-        try:
-            data_mappings = json.loads(mappings_response)
-            # Ensure it's a list
-            if not isinstance(data_mappings, list):
-                data_mappings = [data_mappings]
-        except json.JSONDecodeError:
-            # Create simplified mappings
-            data_mappings = [
-                {
-                    "sourceSystem": "Core Banking System",
-                    "sourceTable": "CUSTOMER_MASTER",
-                    "sourceAttribute": "CUST_ID",
-                    "targetEntity": "Customer",
-                    "targetAttribute": "customerId",
-                    "transformationLogic": "CAST(CUST_ID AS STRING)",
+            results["data_sources"] = data_sources
+
+            # Step 4: Mapping Agent
+            print("🤖 Mapping Agent creating data mappings...")
+            mapping_prompt = self.prompt_library.mapping_agent_prompt(
+                proposed_schema, data_sources, schema_json=schema_json)
+            mappings_response = self.llm.generate(mapping_prompt)
+
+            try:
+                data_mappings = _extract_json(mappings_response, allow_records=True)
+                # Ensure it's a list
+                if not isinstance(data_mappings, list):
+                    data_mappings = [data_mappings]
+            except json.JSONDecodeError:
+                # Create simplified mappings
+                data_mappings = [
+                    {
+                        "sourceSystem": "Core Banking System",
+                        "sourceTable": "CUSTOMER_MASTER",
+                        "sourceAttribute": "CUST_ID",
+                        "targetEntity": "Customer",
+                        "targetAttribute": "customerId",
+                        "transformationLogic": "CAST(CUST_ID AS STRING)",
+                    }
+                ]
+
+            results["data_mappings"] = data_mappings
+            timestamps["mappings_complete"] = clock()
+
+            # Step 5: Certification Agent
+            print("🤖 Certification Agent validating the data product...")
+            certification_prompt = self.prompt_library.certification_agent_prompt(
+                proposed_schema, data_mappings, schema_json=schema_json)
+            certification_response = self.llm.generate(certification_prompt)
+
+            try:
+                certification_results = _extract_json(certification_response)
+            except json.JSONDecodeError:
+                # Create simplified certification results
+                certification_results = {
+                    "dataQualityScore": 85,
+                    "complianceStatus": "Needs Review",
+                    "recommendations": ["Validate PII handling", "Add data lineage documentation"]
                 }
-            ]
 
-        results["data_mappings"] = data_mappings
-        results["timestamps"]["mappings_complete"] = time.time()
-
-        # Step 5: Certification Agent
-        print("🤖 Certification Agent validating the data product...")
-        certification_prompt = self.prompt_library.certification_agent_prompt(proposed_schema, data_mappings)
-        certification_response = self.llm.generate(certification_prompt)
-
-        try:
-            certification_results = json.loads(certification_response)
-        except json.JSONDecodeError:
-            # Create simplified certification results
-            certification_results = {
-                "dataQualityScore": 85,
-                "complianceStatus": "Needs Review",
-                "recommendations": ["Validate PII handling", "Add data lineage documentation"]
-            }
-
-        results["certification_results"] = certification_results
-        results["timestamps"]["certification_complete"] = time.time()
-
-        # Calculate elapsed times
-        start_time = results["timestamps"]["start"]
-        for step, timestamp in results["timestamps"].items():
-            if step != "start":
-                results["timestamps"][f"{step}_elapsed"] = round(timestamp - start_time, 2)
-
-        results["timestamps"]["total_elapsed"] = round(
-            results["timestamps"]["certification_complete"] - start_time, 2)
+            results["certification_results"] = certification_results
+            timestamps["certification_complete"] = clock()
+        except OllamaError as e:
+            print(f"❌ Agent workflow stopped: {e}")
+            results["error"] = str(e)
+            timestamps["failed"] = clock()
+
+        # Calculate elapsed times, collected apart from the dict being iterated
+        start_time = timestamps["start"]
+        elapsed = {
+            f"{step}_elapsed": round(timestamp - start_time, 2)
+            for step, timestamp in timestamps.items() if step != "start"
+        }
+        timestamps.update(elapsed)
+        timestamps["total_elapsed"] = max(elapsed.values(), default=0.0)
 
         return results
 
@@ -415,8 +765,10 @@ class MultiAgentOrchestrator:
         mappings = results.get("data_mappings", [])
         certification = results.get("certification_results", {})
 
-        # Format as markdown report
-        report = f"""
+        # Format as markdown report, collecting the pieces and joining once
+        parts: List[str] = []
+        append = parts.append
+        append(f"""
         # Customer 360 Data Product Report
 
         ## Executive Summary
@@ -437,33 +789,33 @@ class MultiAgentOrchestrator:
 
         The Customer 360 data product includes the following entities:
 
-        """
+        """)
 
         # Add schema entities
         for entity_name, attributes in schema.items():
-            report += f"### {entity_name}\n\n"
-            report += "| Attribute | Data Type |\n|-----------|----------|\n"
-
-            for attr_name, attr_type in attributes.items():
-                report += f"| {attr_name} | {attr_type} |\n"
-
-            report += "\n"
+            append(f"### {entity_name}\n\n")
+            append("| Attribute | Data Type |\n|-----------|----------|\n")
+            append("".join([
+                "| %s | %s |\n" % (attr_name, attr_type)
+                for attr_name, attr_type in attributes.items()
+            ]))
+            append("\n")
 
         # Add source systems
-        report += "## Source Systems\n\n"
-        report += "| System | Tables | Update Frequency |\n|--------|--------|----------------|\n"
+        append("## Source Systems\n\n")
+        append("| System | Tables | Update Frequency |\n|--------|--------|----------------|\n")
 
         for system_name, details in sources.items():
             tables = ", ".join(details.get("tables", []))
             frequency = details.get("update_frequency", "N/A")
-            report += f"| {system_name} | {tables} | {frequency} |\n"
+            append(f"| {system_name} | {tables} | {frequency} |\n")
 
-        report += "\n"
+        append("\n")
 
         # Add sample mappings (first 5)
-        report += "## Sample Data Mappings\n\n"
-        report += "| Source System | Source Table | Source Attribute | Target Entity | Target Attribute | Transformation |\n"
-        report += "|--------------|-------------|-----------------|--------------|----------------|---------------|\n"
+        append("## Sample Data Mappings\n\n")
+        append("| Source System | Source Table | Source Attribute | Target Entity | Target Attribute | Transformation |\n")
+        append("|--------------|-------------|-----------------|--------------|----------------|---------------|\n")
 
         for mapping in mappings[:5]:
             source_sys = mapping.get("sourceSystem", "N/A")
@@ -473,30 +825,44 @@ class MultiAgentOrchestrator:
             target_attr = mapping.get("targetAttribute", "N/A")
             transform = mapping.get("transformationLogic", "Direct")
 
-            report += f"| {source_sys} | {source_tbl} | {source_attr} | {target_entity} | {target_attr} | {transform} |\n"
+            append(f"| {source_sys} | {source_tbl} | {source_attr} | {target_entity} | {target_attr} | {transform} |\n")
 
-        report += f"\n*Showing {min(5, len(mappings))} of {len(mappings)} total mappings*\n\n"
+        append(f"\n*Showing {min(5, len(mappings))} of {len(mappings)} total mappings*\n\n")
 
         # Add certification recommendations
-        report += "## Certification Recommendations\n\n"
+        append("## Certification Recommendations\n\n")
         recommendations = certification.get("recommendations", [])
 
         if recommendations:
             for rec in recommendations:
-                report += f"- {rec}\n"
+                append(f"- {rec}\n")
         else:
-            report += "No specific recommendations provided.\n"
+            append("No specific recommendations provided.\n")
 
-        report += "\n## Next Steps\n\n"
-        report += """
+        append("\n## Next Steps\n\n")
+        append("""
         1. Review the data product design with business stakeholders
         2. Address any certification recommendations
         3. Implement the data pipeline based on the provided mappings
         4. Set up monitoring and quality checks
         5. Document data lineage and usage guidelines
-        """
+        """)
+
+        return "".join(parts)
 
-        return report
+
+# Bounded repr for complex facts: it stops after a few items per container
+# instead of formatting the whole structure only to cut it down afterwards
+_FACT_REPR = reprlib.Repr()
+_FACT_REPR.maxstring = 100
+_FACT_REPR.maxother = 100
+_FACT_REPR.maxdict = 6
+_FACT_REPR.maxlist = 6
+
+
+def _truncate(text: str, limit: int) -> str:
+    """Cut text to limit characters, marking the cut with an ellipsis."""
+    return text if len(text) <= limit else text[:limit] + "..."
 
 
 class AgentMemory:
@@ -514,7 +880,8 @@ class AgentMemory:
         """
         self.agent_name = agent_name
         self.max_entries = max_entries
-        self.memory = []
+        # Oldest interactions drop off automatically once max_entries is reached
+        self.memory = deque(maxlen=max_entries)
         self.key_facts = {}
 
     def add_interaction(self, prompt: str, response: str):
@@ -531,10 +898,6 @@ class AgentMemory:
             "response": response
         })
 
-        # Trim memory if needed
-        if len(self.memory) > self.max_entries:
-            self.memory = self.memory[-self.max_entries:]
-
     def add_fact(self, key: str, value: Any):
         """
         Add or update a key fact in the agent's memory.
@@ -568,35 +931,35 @@ class AgentMemory:
         Returns:
             str: Formatted memory context
         """
-        context = f"--- {self.agent_name}'s Previous Knowledge ---\n"
+        parts = [f"--- {self.agent_name}'s Previous Knowledge ---\n"]
 
         # Add key facts
         if self.key_facts:
-            context += "Key facts:\n"
+            parts.append("Key facts:\n")
             for key, fact in self.key_facts.items():
                 value = fact["value"]
                 # Simplify complex objects for context
                 if isinstance(value, (dict, list)):
-                    value = str(value)[:100] + "..." if len(str(value)) > 100 else str(value)
-                context += f"- {key}: {value}\n"
+                    value = _truncate(_FACT_REPR.repr(value), 100)
+                parts.append(f"- {key}: {value}\n")
 
         # Add recent interactions summary
         if self.memory:
-            context += "\nRecent interactions:\n"
-            for idx, entry in enumerate(reversed(self.memory[-3:])):
-                prompt_summary = entry["prompt"][:50] + "..." if len(entry["prompt"]) > 50 else entry["prompt"]
-                response_summary = entry["response"][:50] + "..." if len(entry["response"]) > 50 else entry["response"]
-                context += f"[{idx+1}] Prompt: {prompt_summary}\n"
-                context += f"    Response: {response_summary}\n"
+            parts.append("\nRecent interactions:\n")
+            for idx, entry in enumerate(islice(reversed(self.memory), 3)):
+                parts.append(f"[{idx+1}] Prompt: {_truncate(entry['prompt'], 50)}\n")
+                parts.append(f"    Response: {_truncate(entry['response'], 50)}\n")
 
-        return context + "\n---\n"
+        parts.append("\n---\n")
+        return "".join(parts)
 
     def save_to_file(self, filename: str = None):
         """
-        Save agent memory to a file.
+        Save agent memory to a file as compact JSON.
 
         Args:
             filename (str, optional): File path. If None, generate based on agent name.
+                A ".zst" suffix compresses the file with zstandard.
         """
         if filename is None:
             filename = f"{self.agent_name.lower().replace(' ', '_')}_memory.json"
@@ -605,11 +968,16 @@ class AgentMemory:
             "agent_name": self.agent_name,
             "timestamp": time.time(),
             "key_facts": self.key_facts,
-            "memory": self.memory
+            "memory": list(self.memory)
         }
 
-        with open(filename, 'w') as f:
-            json.dump(data, f, indent=2)
+        payload = _dumps_compact(data)
+        if filename.endswith(".zst"):
+            _require_zstandard(filename)
+            payload = zstandard.ZstdCompressor(level=3).compress(payload)
+
+        with open(filename, 'wb') as f:
+            f.write(payload)
 
     def load_from_file(self, filename: str = None):
         """
@@ -617,6 +985,7 @@ class AgentMemory:
 
         Args:
             filename (str, optional): File path. If None, generate based on agent name.
+                A ".zst" suffix marks a zstandard-compressed file.
 
         Returns:
             bool: Success status
@@ -625,12 +994,16 @@ class AgentMemory:
             filename = f"{self.agent_name.lower().replace(' ', '_')}_memory.json"
 
         try:
-            with open(filename, 'r') as f:
-                data = json.load(f)
+            with open(filename, 'rb') as f:
+                raw = f.read()
+            if filename.endswith(".zst"):
+                _require_zstandard(filename)
+                raw = zstandard.ZstdDecompressor().decompress(raw)
+            data = _loads(raw)
 
             self.agent_name = data.get("agent_name", self.agent_name)
             self.key_facts = data.get("key_facts", {})
-            self.memory = data.get("memory", [])
+            self.memory = deque(data.get("memory", []), maxlen=self.max_entries)
 
             return True
         except (FileNotFoundError, json.JSONDecodeError) as e: